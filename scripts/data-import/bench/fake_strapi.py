@@ -0,0 +1,671 @@
+"""
+Local stand-in for the parts of the Strapi v5 REST API the importer talks to.
+
+Serves /api/consultants, /api/properties and /api/timeline-items (list with
+pagination, fields, filters and populate of relations, create, update, delete), the NDJSON
+/api/consultants/bulk-import route, /api/upload and /api/upload/files, all in
+memory. Latency and failures can be injected per
+request so retries and concurrency can be measured without a real Strapi:
+
+    python scripts/data-import/bench/fake_strapi.py --port 1337 --latency-ms 40 --error-rate 0.01
+
+With --capacity N the server behaves like a small instance: above N requests
+in flight every request slows down in proportion, and above twice N new
+requests get a 429.
+
+A few /__bench endpoints are not part of Strapi:
+  GET  /__bench/stats          request counts, per-endpoint latencies, upload bytes
+  POST /__bench/reset          forget every entry, file and stat
+  GET  /__bench/image/<n>.jpg  a deterministic JPEG, used in place of remote image URLs
+                              (with an ETag; If-None-Match gets a 304)
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import parse_qsl, urlparse
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+# The importer's sibling modules (endpoint_name) live one folder up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from expert_import.strapi_client import endpoint_name  # noqa: E402
+
+COLLECTIONS = ('consultants', 'properties', 'timeline-items')
+
+# Relation attribute -> target collection; entries store the target's numeric id
+RELATIONS = {'owner': 'consultants', 'author': 'consultants', 'property': 'properties', 'profileImage': 'files'}
+
+# Fields Strapi enforces as unique, per collection
+UNIQUE_FIELDS = {
+    'properties': ('property_uid',),
+    'timeline-items': ('post_id',),
+}
+
+# Mirrors config/api.ts
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+def _now():
+    return time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))]
+
+
+def parse_filters(query):
+    """
+    Turns Strapi's bracket syntax into [(field path, operator, value)]:
+    filters[owner][id][$eq]=3 -> (['owner', 'id'], '$eq', '3');
+    filters[id][$in][0]=1&filters[id][$in][1]=2 -> (['id'], '$in', ['1', '2']).
+    """
+    grouped = {}
+    for key, value in query:
+        if not key.startswith('filters['):
+            continue
+        parts = re.findall(r'\[([^\]]*)\]', key)
+        op_at = next((i for i, p in enumerate(parts) if p.startswith('$')), None)
+        if op_at is None:
+            parts, op_at = parts + ['$eq'], len(parts)
+        path, op = tuple(parts[:op_at]), parts[op_at]
+        if op in ('$in', '$notIn'):
+            grouped.setdefault((path, op), []).append(value)
+        else:
+            grouped[(path, op)] = value
+    return [(list(path), op, value) for (path, op), value in grouped.items()]
+
+
+def _resolve(entry, path):
+    value = entry
+    for part in path:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif part == 'id':
+            # Relations are stored as the id the importer sent
+            continue
+        else:
+            return None
+    return value
+
+
+def _matches(entry, path, op, expected):
+    value = _resolve(entry, path)
+    text = '' if value is None else str(value)
+    if op == '$eq':
+        return text == expected
+    if op == '$ne':
+        return text != expected
+    if op == '$in':
+        return text in expected
+    if op == '$notIn':
+        return text not in expected
+    if op == '$null':
+        return (value is None) == (expected in ('true', '1'))
+    if op == '$notNull':
+        return (value is not None) == (expected in ('true', '1'))
+    if op in ('$contains', '$containsi'):
+        return expected.lower() in text.lower() if op == '$containsi' else expected in text
+    if op in ('$lt', '$lte', '$gt', '$gte'):
+        if value is None:
+            return False
+        try:
+            left, right = float(value), float(expected)
+        except (TypeError, ValueError):
+            left, right = text, expected  # ISO timestamps compare as strings
+        return {'$lt': left < right, '$lte': left <= right,
+                '$gt': left > right, '$gte': left >= right}[op]
+    return True
+
+
+def bench_image(n, size=(1600, 1200)):
+    """A JPEG that differs per n (so the media cache cannot collapse them) and is the same every time."""
+    if Image is None:
+        # Undecodable stand-in; the importer uploads it unchanged
+        return b'\xff\xd8\xff\xe0' + f"bench-image-{n}".encode() * 4096
+    rng = random.Random(n)
+    colour = tuple(rng.randrange(256) for _ in range(3))
+    img = Image.new('RGB', size, colour)
+    # A few bands so the encoder has something to do
+    for i in range(0, size[1], 40):
+        img.paste(tuple(rng.randrange(256) for _ in range(3)), (0, i, size[0], i + 20))
+    out = BytesIO()
+    img.save(out, format='JPEG', quality=92)
+    return out.getvalue()
+
+
+class FakeStrapi:
+    """
+    The in-memory store plus the injected behaviour. Thread-safe; run it with
+    start() / stop() from a benchmark, or serve_forever() from the command line.
+    """
+
+    def __init__(self, host='127.0.0.1', port=1337, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, error_status=503, retry_after=None, seed=0, capacity=None):
+        self.latency_ms = latency_ms
+        self.capacity = capacity
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._images = {}
+        self.reset()
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset(self):
+        with self._lock:
+            self.collections = {name: {} for name in COLLECTIONS}
+            self.files = {}
+            self._next_id = {name: 1 for name in COLLECTIONS + ('files',)}
+            self.latencies = {}
+            self.status_counts = {}
+            self.injected_errors = 0
+            self.upload_bytes = 0
+            self.upload_files = 0
+            self.image_downloads = 0
+            self.image_not_modified = 0
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.overload_rejections = 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name='fake-strapi', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def serve_forever(self):
+        self.server.serve_forever()
+
+    def stats(self):
+        with self._lock:
+            endpoints = {
+                name: {
+                    'requests': len(samples),
+                    'p50_ms': percentile(samples, 50),
+                    'p95_ms': percentile(samples, 95),
+                    'max_ms': max(samples),
+                }
+                for name, samples in sorted(self.latencies.items())
+            }
+            every = [s for samples in self.latencies.values() for s in samples]
+            return {
+                'requests': len(every),
+                'p50_ms': percentile(every, 50),
+                'p95_ms': percentile(every, 95),
+                'status_counts': dict(self.status_counts),
+                'injected_errors': self.injected_errors,
+                'upload_files': self.upload_files,
+                'upload_bytes': self.upload_bytes,
+                'image_downloads': self.image_downloads,
+                'image_not_modified': self.image_not_modified,
+                'peak_in_flight': self.peak_in_flight,
+                'overload_rejections': self.overload_rejections,
+                'entries': {name: len(items) for name, items in self.collections.items()},
+                'endpoints': endpoints,
+            }
+
+    # ---------- behaviour injection ----------
+
+    def _enter(self):
+        """Counts a request in; returns how many are in flight, or None when it is rejected for overload."""
+        with self._lock:
+            if self.capacity and self.in_flight >= 2 * self.capacity:
+                self.overload_rejections += 1
+                return None
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return self.in_flight
+
+    def _leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _delay(self, load=1):
+        delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if self.capacity and load > self.capacity:
+            # Past capacity requests share the instance: everyone gets slower
+            delay *= load / self.capacity
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def _injected_error(self):
+        with self._lock:
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.injected_errors += 1
+                return True
+        return False
+
+    def _record(self, name, status, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self.latencies.setdefault(name, []).append(round(elapsed_ms, 3))
+            self.status_counts[str(status)] = self.status_counts.get(str(status), 0) + 1
+
+    def image(self, n):
+        with self._lock:
+            cached = self._images.get(n)
+        if cached is None:
+            cached = bench_image(n)
+            with self._lock:
+                self._images[n] = cached
+        return cached
+
+    # ---------- collections ----------
+
+    def list_entries(self, collection, query):
+        params = dict(query)
+        page = max(1, int(params.get('pagination[page]', 1)))
+        page_size = min(MAX_PAGE_SIZE, max(1, int(params.get('pagination[pageSize]', DEFAULT_PAGE_SIZE))))
+        filters = parse_filters(query)
+        fields = [v for k, v in query if k.startswith('fields[')]
+        # populate[<relation>][fields][i]=<field>
+        populate = {}
+        for k, v in query:
+            match = re.match(r'populate\[(\w+)\](?:\[fields\]\[\d+\])?$', k)
+            if match and match.group(1) in RELATIONS:
+                populate.setdefault(match.group(1), set())
+                if '[fields]' in k:
+                    populate[match.group(1)].add(v)
+        with self._lock:
+            items = [e for e in self.collections[collection].values()
+                     if all(_matches(e, path, op, value) for path, op, value in filters)]
+        sort = params.get('sort[0]') or params.get('sort') or 'id:asc'
+        sort_field, _, direction = sort.partition(':')
+        items.sort(key=lambda e: (e.get(sort_field) is None, e.get(sort_field)), reverse=direction == 'desc')
+        total = len(items)
+        data = items[(page - 1) * page_size:page * page_size]
+        if fields:
+            keep = set(fields) | {'id', 'documentId'} | set(populate)
+            data = [{k: v for k, v in e.items() if k in keep} for e in data]
+        elif populate:
+            data = [dict(e) for e in data]
+        if populate:
+            with self._lock:
+                targets = {relation: {e['id']: e for e in (self.files if RELATIONS[relation] == 'files'
+                                                           else self.collections[RELATIONS[relation]]).values()}
+                           for relation in populate}
+            for entry in data:
+                for relation, rel_fields in populate.items():
+                    target = targets[relation].get(entry.get(relation))
+                    keep = rel_fields | {'id', 'documentId'} if rel_fields else None
+                    entry[relation] = None if target is None else \
+                        {k: v for k, v in target.items() if keep is None or k in keep}
+        return {
+            'data': data,
+            'meta': {'pagination': {
+                'page': page, 'pageSize': page_size,
+                'pageCount': max(1, -(-total // page_size)), 'total': total,
+            }},
+        }
+
+    def _unique_conflict(self, collection, payload, skip_doc_id=None):
+        for field in UNIQUE_FIELDS.get(collection, ()):
+            value = payload.get(field)
+            if value is None:
+                continue
+            for doc_id, entry in self.collections[collection].items():
+                if doc_id != skip_doc_id and entry.get(field) == value:
+                    return field
+        return None
+
+    def create_entry(self, collection, payload):
+        with self._lock:
+            conflict = self._unique_conflict(collection, payload)
+            if conflict:
+                return 400, {'data': None, 'error': {
+                    'status': 400, 'name': 'ValidationError', 'message': 'This attribute must be unique',
+                    'details': {'errors': [{'path': [conflict], 'message': 'This attribute must be unique'}]},
+                }}
+            entry = dict(payload)
+            entry['id'] = self._next_id[collection]
+            self._next_id[collection] += 1
+            entry['documentId'] = uuid.uuid4().hex[:24]
+            entry['createdAt'] = entry['updatedAt'] = entry['publishedAt'] = _now()
+            self.collections[collection][entry['documentId']] = entry
+        return 201, {'data': entry, 'meta': {}}
+
+    def update_entry(self, collection, doc_id, payload):
+        with self._lock:
+            entry = self.collections[collection].get(doc_id)
+            if entry is None:
+                return 404, {'data': None, 'error': {'status': 404, 'name': 'NotFoundError', 'message': 'Not Found'}}
+            conflict = self._unique_conflict(collection, payload, skip_doc_id=doc_id)
+            if conflict:
+                return 400, {'data': None, 'error': {'status': 400, 'name': 'ValidationError',
+                                                     'message': 'This attribute must be unique'}}
+            entry.update(payload)
+            entry['updatedAt'] = _now()
+            return 200, {'data': dict(entry), 'meta': {}}
+
+    def delete_entry(self, collection, doc_id):
+        with self._lock:
+            if self.collections[collection].pop(doc_id, None) is None:
+                return 404, {'data': None, 'error': {'status': 404, 'name': 'NotFoundError', 'message': 'Not Found'}}
+        return 204, None
+
+    def import_bundle(self, bundle, index):
+        """Mirrors the bulk-import service: all of a bundle's writes or none of them."""
+        created = []    # (collection, documentId) to drop on rollback
+        previous = None  # the consultant as it was before an update
+        try:
+            if bundle.get('documentId'):
+                with self._lock:
+                    previous = dict(self.collections['consultants'].get(bundle['documentId']) or {})
+                status, res = self.update_entry('consultants', bundle['documentId'], bundle['consultant'])
+                action = 'updated'
+            else:
+                status, res = self.create_entry('consultants', bundle['consultant'])
+                action = 'created'
+            if status >= 300:
+                raise ValueError(res['error']['message'])
+            consultant = res['data']
+            if action == 'created':
+                created.append(('consultants', consultant['documentId']))
+
+            def scope(uid):
+                return f"{uid}_{consultant['documentId']}" if bundle.get('scopeUids') and uid else uid
+
+            properties, property_ids = [], {}
+            for data in bundle.get('properties') or []:
+                status, res = self.create_entry('properties', dict(
+                    data, property_uid=scope(data.get('property_uid')), owner=consultant['id']))
+                if status >= 300:
+                    raise ValueError(res['error']['message'])
+                created.append(('properties', res['data']['documentId']))
+                property_ids[data.get('property_uid')] = res['data']['id']
+                properties.append({k: res['data'][k] for k in ('property_uid', 'id', 'documentId')})
+            timeline_items = []
+            for data in bundle.get('timelineItems') or []:
+                post = dict(data, post_id=scope(data.get('post_id')), author=consultant['id'])
+                if data.get('property_uid') in property_ids:
+                    post['property'] = property_ids[data['property_uid']]
+                status, res = self.create_entry('timeline-items', post)
+                if status >= 300:
+                    raise ValueError(res['error']['message'])
+                created.append(('timeline-items', res['data']['documentId']))
+                timeline_items.append({k: res['data'][k] for k in ('post_id', 'id', 'documentId')})
+        except (ValueError, KeyError, TypeError) as e:
+            with self._lock:
+                for collection, doc_id in created:
+                    self.collections[collection].pop(doc_id, None)
+                if previous:
+                    self.collections['consultants'][previous['documentId']] = previous
+            return {'index': index, 'key': bundle.get('key'), 'status': 'error', 'error': str(e)}
+        return {
+            'index': index, 'key': bundle.get('key'), 'status': 'ok', 'action': action,
+            'consultant': {'id': consultant['id'], 'documentId': consultant['documentId']},
+            'properties': properties, 'timelineItems': timeline_items,
+        }
+
+    def bulk_import(self, body):
+        results = []
+        for line in body.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            try:
+                bundle = json.loads(line)
+                if not isinstance(bundle, dict) or not isinstance(bundle.get('consultant'), dict):
+                    raise ValueError('Bundle is missing "consultant"')
+            except ValueError as e:
+                results.append({'index': len(results), 'status': 'error', 'error': str(e)})
+                continue
+            results.append(self.import_bundle(bundle, len(results)))
+        failed = sum(1 for r in results if r['status'] == 'error')
+        return 200, {'data': results, 'meta': {'received': len(results),
+                                              'imported': len(results) - failed, 'failed': failed}}
+
+    # ---------- media library ----------
+
+    def upload(self, content_type, body):
+        """Stores one file entry per multipart file part; returns them like Strapi does."""
+        match = re.search(r'boundary="?([^";]+)"?', content_type or '')
+        if not match:
+            return 400, {'data': None, 'error': {'status': 400, 'name': 'ValidationError',
+                                                 'message': 'Expected multipart/form-data'}}
+        created = []
+        for part in body.split(b'--' + match.group(1).encode()):
+            head, sep, content = part.partition(b'\r\n\r\n')
+            name = re.search(rb'filename="([^"]*)"', head)
+            if not sep or not name:
+                continue
+            content = content[:-2] if content.endswith(b'\r\n') else content
+            with self._lock:
+                file_id = self._next_id['files']
+                self._next_id['files'] += 1
+                entry = {
+                    'id': file_id,
+                    'documentId': uuid.uuid4().hex[:24],
+                    'name': name.group(1).decode('utf-8', 'replace'),
+                    'size': round(len(content) / 1000.0, 2),
+                    'url': f"/uploads/bench_{file_id}",
+                    'createdAt': _now(),
+                }
+                self.files[file_id] = entry
+                self.upload_files += 1
+                self.upload_bytes += len(content)
+            created.append(entry)
+        if not created:
+            return 400, {'data': None, 'error': {'status': 400, 'name': 'ValidationError', 'message': 'Files are empty'}}
+        return 201, created
+
+    def list_files(self, query):
+        filters = parse_filters(query)
+        with self._lock:
+            return [f for f in self.files.values()
+                    if all(_matches(f, path, op, value) for path, op, value in filters)]
+
+    def delete_file(self, file_id):
+        with self._lock:
+            entry = self.files.pop(file_id, None)
+        return (200, entry) if entry else (404, {'data': None, 'error': {'status': 404, 'message': 'Not Found'}})
+
+    # ---------- HTTP ----------
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=None, content_type='application/json', headers=None):
+                payload = b'' if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+                self.send_response(status)
+                if payload:
+                    self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _body(self):
+                if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                    # requests streams generator bodies (the --bulk NDJSON) chunked
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            return b''.join(chunks)
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                length = int(self.headers.get('Content-Length') or 0)
+                return self.rfile.read(length) if length else b''
+
+            def _handle(self, method):
+                started = time.perf_counter()
+                url = urlparse(self.path)
+                query = parse_qsl(url.query, keep_blank_values=True)
+                parts = url.path.strip('/').split('/')
+                body = self._body() if method in ('POST', 'PUT') else b''
+
+                if parts[0] == '__bench':
+                    return self._bench(method, parts[1:])
+
+                name = endpoint_name(method, url.path)
+                load = fake._enter()
+                if load is None:
+                    self._send(429, {'data': None, 'error': {'status': 429, 'message': 'Too Many Requests'}})
+                    return fake._record(name, 429, started)
+                try:
+                    self._respond(method, name, parts, query, body, load, started)
+                finally:
+                    fake._leave()
+
+            def _respond(self, method, name, parts, query, body, load, started):
+                fake._delay(load)
+                if fake._injected_error():
+                    headers = {}
+                    if fake.error_status == 429 or fake.retry_after is not None:
+                        headers['Retry-After'] = str(fake.retry_after or 0)
+                    status = fake.error_status
+                    self._send(status, {'data': None, 'error': {'status': status, 'message': 'Injected failure'}},
+                               headers=headers)
+                    return fake._record(name, status, started)
+
+                status, response = self._route(method, parts, query, body)
+                self._send(status, response)
+                fake._record(name, status, started)
+
+            def _route(self, method, parts, query, body):
+                if len(parts) < 2 or parts[0] != 'api':
+                    return 404, {'data': None, 'error': {'status': 404, 'message': 'Not Found'}}
+                if parts[1] == 'upload':
+                    if method == 'POST' and len(parts) == 2:
+                        return fake.upload(self.headers.get('Content-Type'), body)
+                    if method == 'GET' and parts[2:] == ['files']:
+                        return 200, fake.list_files(query)
+                    if method == 'DELETE' and len(parts) == 4 and parts[2] == 'files':
+                        return fake.delete_file(int(parts[3]))
+                    return 405, {'data': None, 'error': {'status': 405, 'message': 'Method Not Allowed'}}
+                collection = parts[1]
+                if collection not in COLLECTIONS:
+                    return 404, {'data': None, 'error': {'status': 404, 'message': 'Not Found'}}
+                doc_id = parts[2] if len(parts) > 2 else None
+                if collection == 'consultants' and doc_id == 'bulk-import' and method == 'POST':
+                    return fake.bulk_import(body)
+                if method == 'GET' and doc_id is None:
+                    return 200, fake.list_entries(collection, query)
+                if method == 'GET':
+                    with fake._lock:
+                        entry = fake.collections[collection].get(doc_id)
+                    return (200, {'data': entry, 'meta': {}}) if entry else \
+                        (404, {'data': None, 'error': {'status': 404, 'message': 'Not Found'}})
+                if method in ('POST', 'PUT'):
+                    try:
+                        payload = json.loads(body or b'{}')['data']
+                    except (ValueError, KeyError, TypeError):
+                        return 400, {'data': None, 'error': {'status': 400, 'name': 'ValidationError',
+                                                             'message': 'Missing "data" payload in the request body'}}
+                    if method == 'POST' and doc_id is None:
+                        return fake.create_entry(collection, payload)
+                    if method == 'PUT' and doc_id is not None:
+                        return fake.update_entry(collection, doc_id, payload)
+                if method == 'DELETE' and doc_id is not None:
+                    return fake.delete_entry(collection, doc_id)
+                return 405, {'data': None, 'error': {'status': 405, 'message': 'Method Not Allowed'}}
+
+            def _bench(self, method, parts):
+                if method == 'GET' and parts == ['stats']:
+                    return self._send(200, fake.stats())
+                if method == 'POST' and parts == ['reset']:
+                    fake.reset()
+                    return self._send(204)
+                if method == 'GET' and len(parts) == 2 and parts[0] == 'image':
+                    match = re.match(r'(\d+)', parts[1])
+                    if match:
+                        n = int(match.group(1))
+                        etag = f'"bench-image-{n}"'
+                        headers = {'ETag': etag, 'Last-Modified': 'Thu, 01 Jan 2026 00:00:00 GMT'}
+                        with fake._lock:
+                            if self.headers.get('If-None-Match') == etag:
+                                fake.image_not_modified += 1
+                            else:
+                                fake.image_downloads += 1
+                        if self.headers.get('If-None-Match') == etag:
+                            return self._send(304, headers=headers)
+                        return self._send(200, fake.image(n), content_type='image/jpeg', headers=headers)
+                return self._send(404, {'error': 'unknown bench endpoint'})
+
+            def do_GET(self):
+                self._handle('GET')
+
+            def do_POST(self):
+                self._handle('POST')
+
+            def do_PUT(self):
+                self._handle('PUT')
+
+            def do_DELETE(self):
+                self._handle('DELETE')
+
+        return Handler
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve an in-memory stand-in for the Strapi REST API.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=1337)
+    parser.add_argument('--latency-ms', type=float, default=0,
+                        help="fixed delay added to every API request (default: 0)")
+    parser.add_argument('--jitter-ms', type=float, default=0,
+                        help="extra uniform random delay of up to this many ms (default: 0)")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="fraction of API requests answered with --error-status (default: 0)")
+    parser.add_argument('--error-status', type=int, default=503,
+                        help="status code for injected failures, e.g. 429, 500, 503 (default: 503)")
+    parser.add_argument('--retry-after', type=float,
+                        help="Retry-After seconds sent with injected failures (always sent for 429)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed for the jitter and error injection (default: 0)")
+    parser.add_argument('--capacity', type=int,
+                        help="requests in flight before responses slow down; twice as many get 429s (default: unlimited)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fake = FakeStrapi(args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                      error_rate=args.error_rate, error_status=args.error_status,
+                      retry_after=args.retry_after, seed=args.seed, capacity=args.capacity)
+    print(f"Fake Strapi listening on {fake.url}")
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Seeded synthetic dataset generator for load tests of the feed.
+
+Writes N consultants with their properties, timeline posts and portfolio
+stats as sharded NDJSON, one consultant bundle per line in the format
+POST /api/consultants/bulk-import accepts:
+
+    {"key": ..., "consultant": {...}, "properties": [...], "timelineItems": [...]}
+
+Every field is drawn with vectorized NumPy calls for a whole shard at a time,
+and each shard is written and dropped before the next one is generated, so
+memory stays flat however large the dataset. Shard i is generated from
+(seed, i) alone: the same --seed and --shard-size always give the same files,
+and shards can be generated in parallel (--jobs).
+
+Portfolio stats are derived from the generated properties (deal_count,
+total_aum, total_gfa, avg_deal_size), so they agree with what the feed shows.
+Counts per consultant are heavy-tailed (negative binomial) like real usage.
+
+    python scripts/data-import/bench/make_dataset.py /tmp/feed-1m --consultants 100000 --posts 10 --jobs 4
+    curl -H "Authorization: Bearer $STRAPI_TOKEN" -H 'Content-Type: application/x-ndjson' \\
+         --data-binary @/tmp/feed-1m/bundles-00000.ndjson http://localhost:1337/api/consultants/bulk-import
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from make_workbook import COMPANIES, FIRST_NAMES, JOB_TYPES, LAST_NAMES, LOCATIONS, REGIONS, _to_alpha
+
+PROPERTY_TITLES = ['Harborview Retail Center', 'Riverside Office Complex', 'Dockside Industrial Park',
+                   'Urban Living Residences', 'Sunset Plaza', 'Greenfield Logistics Hub', 'Central Business Tower',
+                   'Lakeside Apartments', 'Innovation Park', 'Market Square Offices', 'City Center Mall',
+                   'Grandview Estates', 'Tech Valley Campus', 'Summit Heights', 'Parkside Villas']
+STREETS = ['Fenchurch St', 'King William St', 'Canal Rd', 'Harbour Way', 'Station Rd', 'Victoria Embankment',
+           'Market St', 'Park Lane', 'Broad St', 'Queen St']
+# Enumerations from the property and timeline-item schemas, with rough production weights
+PROPERTY_TYPES = (['Industrial', 'Office', 'Retail', 'Residential'], [0.25, 0.35, 0.15, 0.25])
+PROPERTY_STATUSES = (['Stabilised', 'Under Construction', 'Exited', 'Planning'], [0.45, 0.2, 0.2, 0.15])
+POST_TYPES = (['NewListing', 'ProgressUpdate', 'Insight', 'Closing'], [0.3, 0.3, 0.25, 0.15])
+SENTIMENTS = (['Bull', 'Neutral', 'Bear'], [0.55, 0.3, 0.15])
+VISIBILITIES = (['Public', 'Private', 'ProfileSpecific'], [0.8, 0.05, 0.15])
+REACTION_TYPES = (['like', 'celebrate', 'insightful', 'support'], [0.55, 0.2, 0.2, 0.05])
+ROLES = ['Developer', 'Asset Manager', 'Broker', 'Investor', 'Legal Counsel']
+TAGS = ['Prime', 'Investment', 'Luxury', 'Affordable', 'Green']
+POST_BODIES = {
+    'NewListing': "Excited to bring **{title}** to market at {metric}. A rare opportunity in {city}.",
+    'ProgressUpdate': "Construction update: **{title}** is now {completion}% complete and on programme.",
+    'Insight': "Market view from {city}: pricing for {ptype} assets continues to move. Thoughts on **{title}**?",
+    'Closing': "Pleased to have closed on **{title}**, {metric}. Thanks to everyone involved.",
+}
+IMAGE_URL = "https://images.unsplash.com/photo-{n}?w=800"
+# One encoder for every line; bundles are plain trees, so the circular-reference check is wasted work
+ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
+# Posts are spread over the two years up to this date
+END_DATE = np.datetime64('2026-01-01T00:00:00', 's')
+SPAN_SECONDS = 2 * 365 * 24 * 3600
+
+
+def _pick(rng, choices, size):
+    """size draws from choices; choices is a list or a (values, weights) pair."""
+    if isinstance(choices, tuple):
+        values, weights = choices
+        return np.asarray(values, dtype=object)[rng.choice(len(values), size=size, p=weights)]
+    return np.asarray(choices, dtype=object)[rng.integers(0, len(choices), size=size)]
+
+
+def _counts(rng, mean, size, minimum=0):
+    """Heavy-tailed per-consultant counts with the given mean (negative binomial, dispersion 2)."""
+    if mean <= 0:
+        return np.zeros(size, dtype=np.int64)
+    return np.maximum(rng.negative_binomial(2, 2 / (2 + mean), size=size), minimum)
+
+
+def _split(values, counts):
+    """Splits a flat list into consecutive chunks of the given sizes."""
+    out, start = [], 0
+    for count in counts:
+        out.append(values[start:start + count])
+        start += count
+    return out
+
+
+def generate_shard(shard, seed, first, count, properties_mean, posts_mean):
+    """
+    Returns the bundles for consultants first .. first+count-1. Everything is
+    drawn per field for the whole shard; only the final dict assembly loops.
+    """
+    rng = np.random.default_rng([seed, shard])
+    idx = np.arange(first, first + count)
+
+    # Consultants
+    first_names = _pick(rng, FIRST_NAMES, count)
+    last_names = _pick(rng, LAST_NAMES, count)
+    cities = _pick(rng, LOCATIONS, count)
+    companies = _pick(rng, COMPANIES, count)
+    roles = _pick(rng, JOB_TYPES, count)
+    regions = _pick(rng, REGIONS, count)
+    rates = (rng.integers(40, 61, size=count) * 5).tolist()
+
+    # Properties, grouped by owner (consultant i owns the next n_props[i] rows)
+    n_props = _counts(rng, properties_mean, count, minimum=1 if properties_mean > 0 else 0)
+    total_props = int(n_props.sum())
+    owner = np.repeat(np.arange(count), n_props)
+    prop_no = np.arange(total_props) - np.repeat(np.cumsum(n_props) - n_props, n_props)
+    titles = _pick(rng, PROPERTY_TITLES, total_props)
+    prop_cities = _pick(rng, LOCATIONS, total_props)
+    ptypes = _pick(rng, PROPERTY_TYPES, total_props)
+    statuses = _pick(rng, PROPERTY_STATUSES, total_props)
+    streets = _pick(rng, STREETS, total_props)
+    street_no = rng.integers(1, 400, size=total_props)
+    # Deal sizes are log-normal around £20m, rounded to £50k
+    deal_size = np.round(rng.lognormal(np.log(2e7), 0.8, size=total_props) / 5e4) * 5e4
+    gfa = np.round(rng.lognormal(np.log(120000), 0.7, size=total_props), -3).astype(np.int64)
+    irr = np.round(np.clip(rng.normal(12.5, 3.5, size=total_props), 2, 30), 2)
+    cap_rate = np.round(rng.uniform(3.5, 8.0, size=total_props), 2)
+    completion = np.where(statuses == 'Under Construction', rng.integers(10, 96, size=total_props),
+                          np.where(statuses == 'Planning', 0, 100))
+    n_images = rng.integers(1, 4, size=total_props)
+    image_ids = rng.integers(1_000_000, 9_999_999, size=int(n_images.sum()))
+    n_roles = rng.integers(1, 3, size=total_props)
+    role_ids = rng.integers(0, len(ROLES), size=int(n_roles.sum()))
+    tag_ids = rng.integers(0, len(TAGS), size=total_props)
+
+    # Portfolio stats per consultant, from their properties
+    deal_count = n_props
+    total_aum = np.bincount(owner, weights=deal_size, minlength=count)
+    total_gfa = np.bincount(owner, weights=gfa, minlength=count)
+    avg_deal = np.divide(total_aum, deal_count, out=np.zeros(count), where=deal_count > 0)
+
+    # Posts, grouped by author; most link to one of the author's properties
+    n_posts = _counts(rng, posts_mean, count)
+    total_posts = int(n_posts.sum())
+    author = np.repeat(np.arange(count), n_posts)
+    post_no = np.arange(total_posts) - np.repeat(np.cumsum(n_posts) - n_posts, n_posts)
+    author_props = n_props[author]
+    linked = (rng.random(total_posts) < 0.85) & (author_props > 0)
+    prop_offset = (np.cumsum(n_props) - n_props)[author]
+    linked_prop = prop_offset + (rng.random(total_posts) * np.maximum(author_props, 1)).astype(np.int64)
+    post_types = _pick(rng, POST_TYPES, total_posts)
+    sentiments = _pick(rng, SENTIMENTS, total_posts)
+    visibilities = _pick(rng, VISIBILITIES, total_posts)
+    created = np.datetime_as_string(
+        END_DATE - rng.integers(0, SPAN_SECONDS, size=total_posts).astype('timedelta64[s]'), unit='s')
+    n_reactions = np.minimum(rng.poisson(3, size=total_posts), 12)
+    reaction_types = _pick(rng, REACTION_TYPES, int(n_reactions.sum()))
+    reaction_users = rng.integers(1, 50000, size=int(n_reactions.sum()))
+
+    # Assemble; tolist() once per array is much cheaper than indexing NumPy scalars
+    titles, prop_cities, ptypes, statuses = titles.tolist(), prop_cities.tolist(), ptypes.tolist(), statuses.tolist()
+    streets, street_no, prop_no = streets.tolist(), street_no.tolist(), prop_no.tolist()
+    deal_size, irr, cap_rate, completion = deal_size.tolist(), irr.tolist(), cap_rate.tolist(), completion.tolist()
+    images_per_prop = _split([IMAGE_URL.format(n=n) for n in image_ids.tolist()], n_images.tolist())
+    roles_per_prop = _split([ROLES[r] for r in role_ids.tolist()], n_roles.tolist())
+    tag_ids = tag_ids.tolist()
+    owner_idx = idx[owner].tolist()
+
+    properties = []
+    for p in range(total_props):
+        properties.append({
+            'property_uid': f"pr_S{seed}.{owner_idx[p]}.{prop_no[p]}",
+            'title': f"{titles[p]} {prop_cities[p]}",
+            'address': f"{street_no[p]} {streets[p]}, {prop_cities[p]}",
+            'property_type': ptypes[p],
+            'status': statuses[p],
+            'headline_metric': f"{cap_rate[p]}% cap rate",
+            'media_urls': images_per_prop[p],
+            'roles': ', '.join(dict.fromkeys(roles_per_prop[p])),
+            'tags': TAGS[tag_ids[p]],
+            'deal_size': deal_size[p],
+            'irr': irr[p],
+            'completion_percentage': completion[p],
+        })
+
+    reactions = _split([{'id': f"r{i}", 'user_id': f"u{u}", 'reaction_type': t}
+                        for i, (u, t) in enumerate(zip(reaction_users.tolist(), reaction_types.tolist()))],
+                       n_reactions.tolist())
+    author_idx = idx[author].tolist()
+    post_no, linked, linked_prop = post_no.tolist(), linked.tolist(), linked_prop.tolist()
+    post_types, sentiments, visibilities = post_types.tolist(), sentiments.tolist(), visibilities.tolist()
+    created = created.tolist()
+    posts = []
+    for t in range(total_posts):
+        prop = properties[linked_prop[t]] if linked[t] else None
+        p = linked_prop[t]
+        body = POST_BODIES[post_types[t]].format(
+            title=prop['title'] if prop else 'our latest project',
+            metric=prop['headline_metric'] if prop else 'a competitive yield',
+            city=prop_cities[p] if prop else 'the market',
+            ptype=(ptypes[p] if prop else 'commercial').lower(),
+            completion=completion[p] if prop else 50)
+        posts.append({
+            'post_id': f"post_S{seed}.{author_idx[t]}.{post_no[t]}",
+            'created_at': created[t] + 'Z',
+            'body_md': body,
+            'media_urls': prop['media_urls'][:1] if prop else [],
+            'property_uid': prop['property_uid'] if prop else None,
+            'post_type': post_types[t],
+            'sentiment': sentiments[t],
+            'visibility': visibilities[t],
+            'reactions': reactions[t],
+            'comments': [],
+        })
+
+    properties_by_owner = _split(properties, n_props.tolist())
+    posts_by_author = _split(posts, n_posts.tolist())
+    first_names, last_names, cities = first_names.tolist(), last_names.tolist(), cities.tolist()
+    companies, roles, regions = companies.tolist(), roles.tolist(), regions.tolist()
+    deal_count, total_aum, total_gfa, avg_deal = (deal_count.tolist(), total_aum.tolist(),
+                                                  total_gfa.tolist(), avg_deal.tolist())
+    for i, n in enumerate(idx.tolist()):
+        # Suffix keeps every (first, last) pair unique so each bundle is its own consultant
+        last = f"{last_names[i]}{_to_alpha(n).capitalize()}"
+        yield {
+            'key': f"S{seed}.{n}",
+            'consultant': {
+                'firstName': first_names[i],
+                'lastName': last,
+                'location': cities[i],
+                'company': companies[i],
+                'currentRole': roles[i],
+                'geographicalExpertise': regions[i],
+                'countryExpertise': cities[i],
+                'rate': rates[i],
+                'bio': f"{first_names[i]} is a {roles[i]} at {companies[i]}, based in {cities[i]}.",
+                'total_gfa': int(total_gfa[i]),
+                'total_aum': int(total_aum[i]),
+                'deal_count': deal_count[i],
+                'avg_deal_size': int(avg_deal[i]),
+            },
+            'properties': properties_by_owner[i],
+            'timelineItems': posts_by_author[i],
+        }
+
+
+def write_shard(out_dir, shard, seed, first, count, properties_mean, posts_mean):
+    """Generates and writes one shard; returns (path name, consultants, properties, posts)."""
+    path = Path(out_dir) / f"bundles-{shard:05d}.ndjson"
+    properties = posts = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for bundle in generate_shard(shard, seed, first, count, properties_mean, posts_mean):
+            properties += len(bundle['properties'])
+            posts += len(bundle['timelineItems'])
+            f.write(ENCODER.encode(bundle) + '\n')
+    return path.name, count, properties, posts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic dataset as sharded NDJSON bundles.")
+    parser.add_argument('output', type=Path, help="output directory (created if missing)")
+    parser.add_argument('--consultants', type=int, default=10000, help="number of consultants (default: 10000)")
+    parser.add_argument('--properties', type=float, default=4,
+                        help="mean properties per consultant (default: 4)")
+    parser.add_argument('--posts', type=float, default=10,
+                        help="mean timeline posts per consultant (default: 10)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--shard-size', type=int, default=1000,
+                        help="consultants per file (default: 1000, the bulk-import limit per request)")
+    parser.add_argument('--jobs', type=int, default=1, help="shards generated in parallel (default: 1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.consultants < 0 or args.shard_size < 1 or args.properties < 0 or args.posts < 0:
+        print("Error: counts must be positive")
+        return 1
+    args.output.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    jobs = [(args.output, shard, args.seed, first, min(args.shard_size, args.consultants - first),
+             args.properties, args.posts)
+            for shard, first in enumerate(range(0, args.consultants, args.shard_size))]
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            shards = list(pool.map(write_shard, *zip(*jobs))) if jobs else []
+    else:
+        shards = [write_shard(*job) for job in jobs]
+
+    manifest = {
+        'seed': args.seed,
+        'shard_size': args.shard_size,
+        'consultants': sum(s[1] for s in shards),
+        'properties': sum(s[2] for s in shards),
+        'timeline_items': sum(s[3] for s in shards),
+        'shards': [{'file': name, 'consultants': c, 'properties': p, 'timeline_items': t}
+                   for name, c, p, t in shards],
+    }
+    with open(args.output / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Wrote {manifest['consultants']} consultants, {manifest['properties']} properties and "
+          f"{manifest['timeline_items']} timeline posts in {len(shards)} shard(s) to {args.output} "
+          f"({elapsed:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Synthetic input generator for importer benchmarks.
+
+Writes N rows with the same columns as the "Import Ready" sheet of
+expert_profile.xlsx. The output format follows the file suffix: .xlsx (written
+in openpyxl's write-only mode, so 100k rows stay cheap), .csv or .ndjson.
+Names are unique per row and the output is the same for the same --seed.
+
+    python scripts/data-import/bench/make_workbook.py bench-10k.xlsx --rows 10000
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+from pathlib import Path
+
+COLUMNS = ['id', 'First Name', 'Last Name', 'post_title', 'post_content', 'locations', 'company_name',
+           'job_type', 'tag', 'educational_requirement', 'geographical_expertise', 'country_expertise',
+           'salary', 'Rate']
+
+FIRST_NAMES = ['Wesley', 'Emmanuel', 'Sarah', 'Priya', 'James', 'Olivia', 'Mateo', 'Aisha', 'Chen', 'Hannah',
+               'Tom', 'Grace', 'Luca', 'Amara', 'Noah', 'Fatima', 'Oliver', 'Yuki', 'Daniel', 'Ingrid']
+LAST_NAMES = ['Davis', 'Blouin', 'Patel', 'Nakamura', 'Okafor', 'Schmidt', 'Rossi', 'Haddad', 'Walsh', 'Kim',
+              'Fernandes', 'Lindqvist', 'Moreau', 'Adeyemi', 'Clarke', 'Novak', 'Byrne', 'Silva', 'Khan', 'Webb']
+LOCATIONS = ['London', 'Paris', 'New York', 'Dubai', 'Singapore', 'Frankfurt', 'Madrid', 'Sydney']
+COMPANIES = ['Saville, ltd', 'Esterel Capital LLP', 'Northbank Advisory', 'Harbour & Co', 'Meridian Partners']
+JOB_TYPES = ['Investment Modelling Manager', 'Advisor', 'Asset Manager', 'Development Director', 'Valuer']
+TAGS = ['Corporate Real Estate Management', 'Real Estate Investment', 'Real Estate Law', 'Development',
+        'Asset Management', 'Valuation', 'Capital Markets']
+EDUCATION = ['HEC Paris, Finance', 'LSE, MSc Real Estate', 'MIT, MBA', 'Cambridge, Land Economy', None]
+REGIONS = ['North America', 'South America', 'Asia', 'Europe', 'Africa', 'Oceania', 'Middle East']
+RATES = [200, 215, 225, 235, 250, 265, 270, 290, 300]
+BIO_SENTENCES = [
+    "{first} has spent fifteen years advising on commercial property transactions.",
+    "Previously at a global investment bank, {first} led deals across Europe and the Middle East.",
+    "{first} specialises in repositioning underperforming office and logistics assets.",
+    "A regular speaker at investor conferences, {first} sits on two advisory boards.",
+    "{first} holds a degree in finance and speaks three languages fluently.",
+]
+
+
+def _to_alpha(n):
+    """0 -> 'a', 25 -> 'z', 26 -> 'ba': keeps generated names letters-only and unique."""
+    out = ''
+    while True:
+        n, rem = divmod(n, 26)
+        out = chr(ord('a') + rem) + out
+        if n == 0:
+            return out
+
+
+def generate_rows(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        # Suffix keeps every (first, last) pair unique so each row is its own consultant
+        last = f"{rng.choice(LAST_NAMES)}{_to_alpha(i).capitalize()}"
+        job = rng.choice(JOB_TYPES)
+        rate = rng.choice(RATES)
+        yield {
+            'id': str(i + 1),
+            'First Name': first,
+            'Last Name': last,
+            'post_title': f"{first} {last} - {job}",
+            'post_content': ' '.join(s.format(first=first) for s in rng.sample(BIO_SENTENCES, 3)),
+            'locations': rng.choice(LOCATIONS),
+            'company_name': rng.choice(COMPANIES),
+            'job_type': job,
+            'tag': ', '.join(rng.sample(TAGS, rng.randint(1, 3))),
+            'educational_requirement': rng.choice(EDUCATION),
+            'geographical_expertise': rng.choice(REGIONS),
+            'country_expertise': rng.choice(LOCATIONS),
+            'salary': f"${rate}/hr",
+            'Rate': str(rate),
+        }
+
+
+def write_rows(path, rows, sheet_name='Import Ready'):
+    """Writes rows in the format implied by the suffix; returns how many were written."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = path.suffix.lower()
+    count = 0
+    if suffix == '.csv':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({k: ('' if v is None else v) for k, v in row.items()})
+                count += 1
+    elif suffix in ('.ndjson', '.jsonl'):
+        with open(path, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                count += 1
+    elif suffix == '.xlsx':
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(COLUMNS)
+        for row in rows:
+            sheet.append([row[c] for c in COLUMNS])
+            count += 1
+        workbook.save(path)
+    else:
+        raise ValueError(f"Unsupported output type '{path.suffix}' (use .xlsx, .csv or .ndjson)")
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic expert sheet for benchmarks.")
+    parser.add_argument('output', type=Path, help="output file (.xlsx, .csv or .ndjson)")
+    parser.add_argument('--rows', type=int, default=10000, help="number of rows (default: 10000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--sheet', default='Import Ready', help="worksheet name for .xlsx output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        count = write_rows(args.output, generate_rows(args.rows, args.seed), sheet_name=args.sheet)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"✅ Wrote {count} rows to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Benchmark runner for upload_experts.py.
+
+Starts the fake Strapi in-process, points the importer at it (with a throwaway
+cache directory and a copy of mockData whose image URLs are served by the fake
+server, so nothing leaves the machine) and reports, per run:
+rows/sec, requests per row, files and bytes uploaded, p50/p95 request latency
+as seen by the server, and the importer's own per-phase timings.
+
+    # 1,000 generated rows, sequential vs 8 workers, 30 ms per request
+    python scripts/data-import/bench/run_bench.py --rows 1000 --workers 1 8 --latency-ms 30
+
+Every run starts from an empty server and cold caches. Arguments after `--`
+are passed to upload_experts.py unchanged.
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+IMPORT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(IMPORT_DIR))
+
+from fake_strapi import FakeStrapi  # noqa: E402
+from make_workbook import generate_rows, write_rows  # noqa: E402
+from expert_import.row_reader import RowReader  # noqa: E402
+
+IMPORTER = IMPORT_DIR / 'upload_experts.py'
+MOCK_DATA_DIR = IMPORT_DIR / 'mockData'
+
+
+def local_mock_data(dest, base_url):
+    """
+    Copies mockData to dest with every property image URL replaced by an image
+    from the fake server. Each distinct URL maps to its own image, so media
+    deduplication behaves as it would against the real URLs.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    numbered = {}
+    for src in sorted(MOCK_DATA_DIR.glob('*.json')):
+        if not src.name.startswith('mockProperties'):
+            shutil.copy(src, dest / src.name)
+            continue
+        with open(src, 'r', encoding='utf-8') as f:
+            properties = json.load(f)
+        for prop in properties:
+            if isinstance(prop, dict) and isinstance(prop.get('images'), list):
+                prop['images'] = [f"{base_url}/__bench/image/{numbered.setdefault(url, len(numbered) + 1)}.jpg"
+                                  for url in prop['images']]
+        with open(dest / src.name, 'w', encoding='utf-8') as f:
+            json.dump(properties, f, indent=2)
+    return dest
+
+
+def count_rows(path):
+    return sum(1 for row in RowReader(path) if row.get('First Name') and row.get('Last Name'))
+
+
+def run_once(fake, input_path, workers, work_dir, extra_args, log_path):
+    """One cold import against an empty server; returns the result dict."""
+    fake.reset()
+    cache_dir = work_dir / f"cache-w{workers}"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cmd = [sys.executable, str(IMPORTER),
+           '--input', str(input_path),
+           '--strapi-url', fake.url,
+           '--strapi-token', 'bench',  # the fake accepts any token
+           '--cache-dir', str(cache_dir),
+           '--mock-data-dir', str(work_dir / 'mockData'),
+           '--workers', str(workers),
+           '--seed', 'bench'] + list(extra_args)
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        exit_code = subprocess.call(cmd, stdout=log, stderr=subprocess.STDOUT, cwd=str(IMPORT_DIR))
+    elapsed = time.perf_counter() - started
+    stats = fake.stats()
+    rows = count_rows(input_path)
+    # Phase totals from the importer's own run summary, when it got far enough to write one
+    phases = {}
+    summary_path = cache_dir / 'metrics' / 'last-run.json'
+    if summary_path.exists():
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            phases = {name: h['sum_seconds'] for name, h in json.load(f).get('phases', {}).items()}
+    return {
+        'workers': workers,
+        'exit_code': exit_code,
+        'rows': rows,
+        'seconds': round(elapsed, 3),
+        'rows_per_sec': round(rows / elapsed, 2) if elapsed else None,
+        'requests': stats['requests'],
+        'requests_per_row': round(stats['requests'] / rows, 2) if rows else None,
+        'upload_files': stats['upload_files'],
+        'upload_bytes': stats['upload_bytes'],
+        'image_downloads': stats['image_downloads'],
+        'p50_ms': stats['p50_ms'],
+        'p95_ms': stats['p95_ms'],
+        'injected_errors': stats['injected_errors'],
+        'peak_in_flight': stats['peak_in_flight'],
+        'overload_rejections': stats['overload_rejections'],
+        'status_counts': stats['status_counts'],
+        'entries': stats['entries'],
+        'phase_seconds': phases,
+        'endpoints': stats['endpoints'],
+        'log': str(log_path),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark upload_experts.py against a local fake Strapi.")
+    parser.add_argument('--input', type=Path,
+                        help="sheet to import (default: generate one with --rows rows)")
+    parser.add_argument('--rows', type=int, default=1000,
+                        help="rows to generate when --input is not given (default: 1000)")
+    parser.add_argument('--format', choices=['xlsx', 'csv', 'ndjson'], default='xlsx',
+                        help="format of the generated sheet (default: xlsx)")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1],
+                        help="one run per value, e.g. --workers 1 4 8 (default: 1)")
+    parser.add_argument('--latency-ms', type=float, default=0, help="server latency per request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="extra random server latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument('--error-status', type=int, default=503, help="status for injected failures")
+    parser.add_argument('--capacity', type=int,
+                        help="server slows down past this many requests in flight and answers 429 past twice that")
+    parser.add_argument('--port', type=int, default=0, help="fake server port (default: any free port)")
+    parser.add_argument('--work-dir', type=Path,
+                        help="keep generated input, caches and logs here instead of a temp dir")
+    parser.add_argument('--output', type=Path, help="also write the JSON report to this file")
+    parser.add_argument('importer_args', nargs=argparse.REMAINDER,
+                        help="arguments after -- are passed to upload_experts.py")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    extra_args = args.importer_args[1:] if args.importer_args[:1] == ['--'] else args.importer_args
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix='import-bench-'))
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    input_path = args.input
+    if input_path is None:
+        input_path = work_dir / f"bench-{args.rows}.{args.format}"
+        started = time.perf_counter()
+        write_rows(input_path, generate_rows(args.rows))
+        print(f"Generated {args.rows} rows in {input_path} ({time.perf_counter() - started:.1f}s)")
+
+    fake = FakeStrapi(port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                      error_rate=args.error_rate, error_status=args.error_status, capacity=args.capacity).start()
+    local_mock_data(work_dir / 'mockData', fake.url)
+    results = []
+    try:
+        for workers in args.workers:
+            print(f"Running with {workers} worker(s) against {fake.url} ...")
+            result = run_once(fake, input_path, workers, work_dir, extra_args,
+                              work_dir / f"import-w{workers}.log")
+            results.append(result)
+            mark = '✅' if result['exit_code'] == 0 else '❌'
+            print(f"{mark} workers={workers}: {result['rows_per_sec']} rows/s, "
+                  f"{result['requests_per_row']} requests/row, "
+                  f"{result['upload_files']} files / {result['upload_bytes']} bytes uploaded, "
+                  f"p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms")
+    finally:
+        fake.stop()
+
+    report = {
+        'input': str(input_path),
+        'server': {'latency_ms': args.latency_ms, 'jitter_ms': args.jitter_ms,
+                   'error_rate': args.error_rate, 'error_status': args.error_status, 'capacity': args.capacity},
+        'importer_args': extra_args,
+        'runs': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + '\n', encoding='utf-8')
+        print(f"Report written to {args.output}")
+    else:
+        print(text)
+    return 0 if all(r['exit_code'] == 0 for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
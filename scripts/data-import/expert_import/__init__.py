@@ -0,0 +1,33 @@
+"""
+Expert profile import into Strapi.
+
+Command line: python -m expert_import <command> (see cli.py), or the older
+scripts/data-import/upload_experts.py, which runs the import command.
+
+As a library, configure the client and caches once, then work row by row:
+
+    import expert_import as ei
+
+    ei.configure(strapi_url='https://cms.example.com', strapi_token=token, seed='nightly')
+    for idx, row in ei.load_rows('expert_profile.xlsx'):
+        prepared = ei.prepare_row(idx, row)
+        if prepared:
+            consultant_id, document_id, action = ei.upsert_consultant(prepared)
+
+The first prepare_row() reads the consultants already in Strapi, so rows for
+existing consultants are updated rather than created again. The importer (and
+with it requests and Pillow) is loaded on first use of one of these names, so
+importing the package itself is cheap.
+"""
+
+API = ('load_rows', 'prepare_row', 'build_payload', 'upsert_consultant', 'build_bundle', 'import_bundle',
+       'configure', 'run')
+
+__all__ = list(API)
+
+
+def __getattr__(name):
+    if name in API:
+        from . import importer
+        return getattr(importer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
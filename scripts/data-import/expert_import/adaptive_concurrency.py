@@ -0,0 +1,96 @@
+"""
+AIMD concurrency limits for Strapi requests.
+
+A fixed number of workers either leaves a healthy backend idle or knocks over
+a small one. AdaptiveLimit caps the requests in flight for one class of
+endpoint and moves the cap with what the server reports:
+
+  - additive increase: every full window of fast responses (latency under the
+    target) sent while the limit was in use raises the limit by one; until the
+    first decrease every such response does (slow start, doubling per window)
+  - multiplicative decrease: a 429, a 5xx, a transport error or a latency
+    spike (over spike_factor x target) cuts it by `backoff` (halves it), at
+    most once per round trip so one burst of failures counts once
+  - anything in between holds the limit
+
+Without an explicit target the limit tracks the best latency it has seen for
+the class (a slowly rising floor, so it follows a backend that got slower for
+good) and treats twice that as the target.
+"""
+import threading
+import time
+
+
+class AdaptiveLimit:
+    """Limit for one endpoint class. Safe to share between threads."""
+
+    def __init__(self, name, initial=2, minimum=1, maximum=64, target=None,
+                 spike_factor=2.0, backoff=0.5):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.target = target
+        self.spike_factor = spike_factor
+        self.backoff = backoff
+        self.in_flight = 0
+        self.peak = int(self.limit)
+        self.increases = 0
+        self.decreases = 0
+        self._floor = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def _target(self):
+        if self.target:
+            return self.target
+        return 2 * self._floor if self._floor is not None else None
+
+    def acquire(self):
+        """Blocks until a slot is free. Returns whether the limit was in full use (pass it to release())."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            return self.in_flight >= int(self.limit)
+
+    def release(self, saturated, latency, overloaded=False):
+        """
+        Frees the slot and adapts the limit to this response: latency in seconds,
+        overloaded for 429 / 5xx / transport errors.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if not overloaded:
+                # Slowly rising floor: a permanent slowdown eventually becomes the new normal
+                if self._floor is None or latency < self._floor:
+                    self._floor = latency
+                else:
+                    self._floor += (latency - self._floor) * 0.001
+            target = self._target()
+            now = time.monotonic()
+            if overloaded or (target and latency > self.spike_factor * target):
+                if now - self._last_decrease > max(latency, target or 0):
+                    self.limit = max(self.minimum, self.limit * self.backoff)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif saturated and target and latency <= target and self.limit < self.maximum:
+                before = int(self.limit)
+                step = 1.0 if not self.decreases else 1.0 / self.limit
+                self.limit = min(self.maximum, self.limit + step)
+                if int(self.limit) > before:
+                    self.increases += 1
+                    self.peak = max(self.peak, int(self.limit))
+            self._cond.notify_all()
+
+    def current(self):
+        return int(self.limit)
+
+    def summary(self):
+        return {
+            'limit': int(self.limit),
+            'peak': self.peak,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'latency_floor_ms': round(self._floor * 1000, 1) if self._floor is not None else None,
+        }
@@ -0,0 +1,139 @@
+"""
+Properties and timeline items that already exist for the consultants being updated.
+
+Children are written with their consultant's documentId appended to the
+template uid (`<property_uid>_<documentId>`, `<post_id>_<documentId>`), and
+both uids are unique. Re-importing an existing consultant therefore has to
+know which of its children are already there. They are read a batch of
+consultants at a time, with one filtered query per collection
+(filters[owner][id][$in][i]=...), and each row then sends only the
+differences: creates for missing uids, updates for entries whose fields
+changed, and deletes for imported children its mock dataset no longer has.
+Only attributes of the content type's schema are compared: the mock data also
+carries keys such as a post's created_at that Strapi never returns, and those
+would make every existing child look changed.
+"""
+import json
+import threading
+from pathlib import Path
+
+# collection -> (relation to the consultant, uid field)
+CHILDREN = {
+    'properties': ('owner', 'property_uid'),
+    'timeline-items': ('author', 'post_id'),
+}
+
+# collection -> Strapi content type, whose schema lists the attributes to compare
+CONTENT_TYPES = {
+    'properties': 'property',
+    'timeline-items': 'timeline-item',
+}
+
+
+def related_id(item, relation):
+    related = item.get(relation)
+    return related.get('id') if isinstance(related, dict) else related
+
+
+def load_attributes(schema_path):
+    """Attribute names of a Strapi content-type schema.json (None if absent: compare every key)."""
+    schema_path = Path(schema_path)
+    if not schema_path.exists():
+        return None
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        return set(json.load(f).get('attributes', {}))
+
+
+def unchanged(entry, payload, relations=(), attributes=None):
+    """
+    True when entry already holds every value in payload; relations compare by
+    id. attributes limits the comparison to those keys (the schema's attributes).
+    """
+    for key, value in payload.items():
+        if attributes is not None and key not in attributes:
+            continue
+        current = related_id(entry, key) if key in relations else entry.get(key)
+        if current != value:
+            return False
+    return True
+
+
+def diff_children(existing, expected, suffix):
+    """
+    Splits a consultant's children by uid: (uids to create, uids to update or
+    keep, entries to delete). existing maps uid -> entry, expected is the set
+    of uids the import writes. Only entries carrying the consultant's suffix
+    are deleted; children created by hand are left alone.
+    """
+    creates = expected - existing.keys()
+    updates = expected & existing.keys()
+    deletes = [entry for uid, entry in existing.items() if uid not in expected and uid.endswith(suffix)]
+    return creates, updates, deletes
+
+
+class ChildIndex:
+    """
+    Existing children per consultant id, {collection: {uid: entry}}. load()
+    prefetches a batch; get() hands one consultant's children to its row (or
+    reads them alone when no batch covered it) and release() forgets them once
+    the row is written, so a later row for the same consultant reads them fresh.
+    """
+
+    def __init__(self, keep_batches=2):
+        self.keep_batches = keep_batches
+        self.children = {}  # consultant id -> (batch number, {collection: {uid: entry}})
+        self.in_use = set()
+        self.batches = 0
+        self.single = 0
+        self._lock = threading.Lock()
+
+    def load(self, consultant_ids, fetch_all):
+        """
+        Reads the children of the consultants not loaded or in use yet.
+        fetch_all(collection, filters, populate) returns every matching entry.
+        Batches older than keep_batches that no row claimed are dropped.
+        """
+        with self._lock:
+            wanted = [cid for cid in dict.fromkeys(consultant_ids)
+                      if cid is not None and cid not in self.children and cid not in self.in_use]
+            self.batches += 1
+            batch = self.batches
+            for cid in [cid for cid, (loaded_in, _) in self.children.items()
+                        if loaded_in <= batch - self.keep_batches]:
+                del self.children[cid]
+        if wanted:
+            loaded = self._fetch(wanted, fetch_all)
+            with self._lock:
+                for cid, children in loaded.items():
+                    if cid not in self.in_use:
+                        self.children.setdefault(cid, (batch, children))
+        return len(wanted)
+
+    def get(self, consultant_id, fetch_all):
+        """{collection: {uid: entry}} of one consultant; the row holds it until release()."""
+        with self._lock:
+            self.in_use.add(consultant_id)
+            loaded = self.children.get(consultant_id)
+            if loaded is None:
+                self.single += 1
+        if loaded is not None:
+            return loaded[1]
+        return self._fetch([consultant_id], fetch_all)[consultant_id]
+
+    def release(self, consultant_id):
+        with self._lock:
+            self.in_use.discard(consultant_id)
+            self.children.pop(consultant_id, None)
+
+    def _fetch(self, consultant_ids, fetch_all):
+        loaded = {cid: {collection: {} for collection in CHILDREN} for cid in consultant_ids}
+        for collection, (relation, uid_field) in CHILDREN.items():
+            filters = {f"filters[{relation}][id][$in][{i}]": cid for i, cid in enumerate(consultant_ids)}
+            populate = {relation: ['documentId']}
+            if collection == 'timeline-items':
+                populate['property'] = ['documentId']
+            for item in fetch_all(collection, filters, populate):
+                cid = related_id(item, relation)
+                if cid in loaded and item.get(uid_field):
+                    loaded[cid][collection][item[uid_field]] = item
+        return loaded
@@ -0,0 +1,297 @@
+"""
+Command line for the expert import: python -m expert_import <command> [options].
+
+  import    import the sheet into Strapi (the default of upload_experts.py)
+  plan      list the creates, updates and unchanged consultants without writing
+  validate  check the sheet and write the validation report; no Strapi needed
+  purge     delete what the importer wrote
+  rollup    recompute every consultant's portfolio totals from their properties
+  export    write consultants, properties and timeline items to Parquet
+
+Building the parser and `validate` only load the standard library and the
+light helper modules; requests, Pillow and pyarrow are imported with the
+importer, once a command actually talks to Strapi.
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from . import settings
+from .import_metrics import ImportMetrics, configure_logging
+from .row_reader import RowReader
+from .sheet_validation import validate_sheet
+
+log = logging.getLogger('expert_import')
+
+# Keys of image_preprocess.FORMATS, spelled out so --help does not load Pillow
+IMAGE_FORMATS = ('jpeg', 'webp')
+
+
+def _connection_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('Strapi')
+    group.add_argument('--strapi-url',
+                       help=f"Strapi base URL (default: $STRAPI_URL, else {settings.DEFAULT_STRAPI_URL})")
+    group.add_argument('--strapi-token',
+                       help="Strapi API token (default: $STRAPI_TOKEN; both may also be set in a .env file)")
+    group.add_argument('--adaptive-concurrency', action='store_true',
+                       help="limit requests in flight per endpoint class (uploads, consultant writes, property and "
+                            "timeline writes, reads) with AIMD limits that grow while latency stays under target and "
+                            "halve on 429/5xx or latency spikes; --max-inflight becomes the ceiling")
+    group.add_argument('--latency-target-ms', type=float,
+                       help="with --adaptive-concurrency, latency under which limits grow "
+                            "(default: twice the best latency seen for each class)")
+    return parser
+
+
+def _sheet_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('input')
+    group.add_argument('--input', type=Path, default=settings.DEFAULT_INPUT,
+                       help="workbook (.xlsx), .csv or .ndjson file to import (default: expert_profile.xlsx)")
+    group.add_argument('--sheet', default=settings.DEFAULT_SHEET,
+                       help=f"worksheet to read from an .xlsx input (default: {settings.DEFAULT_SHEET})")
+    group.add_argument('--cache-dir', type=Path, default=settings.CACHE_DIR,
+                       help="where the media cache, journal and other local caches live "
+                            "(default: scripts/data-import/.cache)")
+    group.add_argument('--mock-data-dir', type=Path, default=settings.MOCK_DATA_DIR,
+                       help="folder with the mockPortfolioStats/mockProperties/mockTimelinePosts sets")
+    return parser
+
+
+def _output_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('logging and metrics')
+    group.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help="DEBUG also logs request bodies and responses (default: INFO)")
+    group.add_argument('--log-format', default='text', choices=['text', 'json'],
+                       help="plain messages or one JSON object per line (default: text)")
+    group.add_argument('--metrics-json', type=Path,
+                       help="where to write the run summary (default: <cache-dir>/metrics/last-run.json)")
+    group.add_argument('--metrics-prom', type=Path,
+                       help="where to write the Prometheus textfile, e.g. node_exporter's textfile directory "
+                            "(default: <cache-dir>/metrics/consultant_import.prom)")
+    return parser
+
+
+def _validation_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('validation')
+    group.add_argument('--on-invalid', choices=['abort', 'skip', 'warn'], default='abort',
+                       help="what to do when the pre-flight validation flags rows: refuse to start (default), "
+                            "import only the clean rows, or import everything as before")
+    group.add_argument('--validation-report', type=Path,
+                       help="where to write the validation report (default: <cache-dir>/validation/last-report.json)")
+    return parser
+
+
+def _import_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('import')
+    group.add_argument('--workers', type=int, default=1,
+                       help="number of rows imported concurrently (default: 1, sequential)")
+    group.add_argument('--max-inflight', type=int, default=8,
+                       help="uploads and writes in flight at once across all rows; within a row, independent "
+                            "properties, timeline items and uploads run in parallel (default: 8, 1 = one at a time)")
+    group.add_argument('--seed',
+                       help="generate the random profile fields deterministically from this seed, "
+                            "so unchanged consultants can be skipped on later runs")
+    group.add_argument('--resume', action='store_true',
+                       help="continue the previous run from its journal instead of starting over")
+    group.add_argument('--bulk', action='store_true',
+                       help="send each consultant with its properties and timeline items as one bundle to "
+                            "/api/consultants/bulk-import, in chunks, instead of one request per entity")
+    group.add_argument('--bulk-size', type=int, default=25,
+                       help="bundles per bulk-import request (default: 25)")
+    group.add_argument('--child-batch-size', type=int, default=100,
+                       help="consultants whose existing properties and timeline items are read per filtered query; "
+                            "an updated consultant's children are then created, updated or deleted as needed "
+                            "instead of posted again (default: 100)")
+    group.add_argument('--no-rollup', action='store_true',
+                       help="skip recomputing the imported consultants' portfolio totals from their properties "
+                            "after the import")
+    group.add_argument('--full-rollup', action='store_true',
+                       help="after the import, recompute the totals of every consultant in Strapi, not just the "
+                            "ones this run wrote")
+    group.add_argument('--rollup-batch-size', type=int, default=100,
+                       help="consultants read per filtered query and updated per bulk-import request "
+                            "(default: 100)")
+
+    group = parser.add_argument_group('media')
+    group.add_argument('--image-match-threshold', type=float, default=0.7,
+                       help="minimum similarity (0-1) of a fuzzy image match; its given name and surname must "
+                            "also each be the consultant's own or one typo away (default: 0.7)")
+    group.add_argument('--max-image-dim', type=int, default=1024,
+                       help="downscale images so neither side exceeds this many pixels (default: 1024)")
+    group.add_argument('--image-format', choices=IMAGE_FORMATS, default='webp',
+                       help="format images are transcoded to before upload (default: webp)")
+    group.add_argument('--image-quality', type=int, default=82,
+                       help="encoder quality for transcoded images (default: 82)")
+    group.add_argument('--no-image-preprocess', action='store_true',
+                       help="upload images as-is instead of resizing and transcoding them locally")
+    group.add_argument('--max-transcode-mb', type=float, default=25,
+                       help="images larger than this are streamed up unchanged instead of being decoded and "
+                            "resized in memory (default: 25)")
+    group.add_argument('--batch-uploads', action='store_true',
+                       help="upload each consultant's profile and property images together in as few multipart "
+                            "requests as --upload-batch-mb allows, instead of one request per file")
+    group.add_argument('--upload-batch-mb', type=float, default=20,
+                       help="size cap per batched upload request in MB (default: 20)")
+    group.add_argument('--download-max-age', type=float, default=24,
+                       help="hours a downloaded image URL is used without asking the origin again; older copies "
+                            "are revalidated with ETag/Last-Modified (default: 24, 0 = always revalidate)")
+    group.add_argument('--prefetch-workers', type=int, default=8,
+                       help="parallel downloads when prefetching remote images (default: 8)")
+    group.add_argument('--verify-media-cache', action='store_true',
+                       help="check cached upload ids against /api/upload/files and drop stale ones before importing")
+    return parser
+
+
+def _purge_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('purge')
+    group.add_argument('--purge-scope', choices=['imported', 'all'], default='imported',
+                       help="'imported' (default): only children carrying their consultant's documentId suffix and "
+                            "consultants named in the sheet; 'all': every entry of those collections")
+    group.add_argument('--purge-workers', type=int, default=16,
+                       help="deletes in flight at once during a purge (default: 16)")
+    return parser
+
+
+def _export_options():
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('export')
+    group.add_argument('--export-since', metavar='TIME',
+                       help="only entries whose updatedAt is after TIME (ISO 8601), or 'last' to continue from the "
+                            "newest updatedAt of the previous export into DIR")
+    group.add_argument('--export-workers', type=int, default=8,
+                       help="page requests in flight during an export (default: 8)")
+    group.add_argument('--export-page-size', type=int, default=100,
+                       help="entries per page during an export; Strapi caps it at rest.maxLimit in config/api.ts "
+                            "(default: 100)")
+    return parser
+
+
+def build_parser():
+    """The top-level parser and its `import` subparser, whose defaults every other command falls back to."""
+    connection, sheet, output = _connection_options(), _sheet_options(), _output_options()
+    validation, imports, purge, export = _validation_options(), _import_options(), _purge_options(), _export_options()
+
+    parser = argparse.ArgumentParser(prog='python -m expert_import',
+                                     description="Import expert profiles from the Excel sheet into Strapi.")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+
+    import_parser = commands.add_parser(
+        'import', parents=[sheet, connection, imports, validation, purge, export, output],
+        help="import the sheet into Strapi",
+        description="Import the sheet into Strapi, then recompute the portfolio totals. The mode flags below "
+                    "predate the subcommands and are kept for existing scripts.")
+    modes = import_parser.add_argument_group('modes (same as the plan, validate, purge, rollup and export commands)')
+    modes.add_argument('--plan', action='store_true',
+                       help="list the creates, updates and unchanged consultants, then exit without writing; "
+                            "with --purge only count what would be deleted")
+    modes.add_argument('--validate-only', action='store_true',
+                       help="validate the sheet, write the report and exit (1 if any row is flagged)")
+    modes.add_argument('--purge', action='store_true',
+                       help="delete what the importer wrote (timeline items, properties, consultants, then "
+                            "uploads nothing uses any more) and exit")
+    modes.add_argument('--rollup-only', action='store_true',
+                       help="only recompute every consultant's portfolio totals (total_aum, deal_count, "
+                            "avg_deal_size) and exit")
+    modes.add_argument('--export', type=Path, metavar='DIR',
+                       help="write consultants, properties and timeline items to Parquet files under DIR and exit "
+                            "(needs pyarrow)")
+
+    plan_parser = commands.add_parser(
+        'plan', parents=[sheet, connection, imports, validation, output],
+        help="list what an import would create, update or skip, without writing")
+    plan_parser.set_defaults(plan=True)
+
+    commands.add_parser(
+        'validate', parents=[sheet, validation, output],
+        help="check the sheet and write the validation report (exit 1 if any row is flagged)")
+
+    purge_parser = commands.add_parser(
+        'purge', parents=[sheet, connection, purge, output],
+        help="delete what the importer wrote",
+        description="Delete timeline items, properties and consultants the importer wrote, then uploads nothing "
+                    "uses any more.")
+    purge_parser.add_argument('--dry-run', dest='plan', action='store_true',
+                              help="only count what would be deleted")
+    purge_parser.set_defaults(purge=True)
+
+    rollup_parser = commands.add_parser(
+        'rollup', parents=[connection, output],
+        help="recompute every consultant's portfolio totals (total_aum, deal_count, avg_deal_size)")
+    rollup_parser.add_argument('--workers', type=int, default=4,
+                               help="parallel page requests while reading properties (default: 4)")
+    rollup_parser.add_argument('--rollup-batch-size', type=int, default=100,
+                               help="consultants whose totals changed updated per bulk-import request (default: 100)")
+    rollup_parser.set_defaults(rollup_only=True)
+
+    export_parser = commands.add_parser(
+        'export', parents=[connection, export, output],
+        help="write consultants, properties and timeline items to Parquet (needs pyarrow)")
+    export_parser.add_argument('export', type=Path, metavar='DIR', help="output directory")
+
+    return parser, import_parser
+
+
+def _fill_defaults(args, import_parser):
+    """Options a command does not take get the import defaults, so the importer sees one shape of namespace."""
+    for name, value in vars(import_parser.parse_args([])).items():
+        if not hasattr(args, name):
+            setattr(args, name, value)
+    args.strapi_url = args.strapi_url or settings.strapi_url()
+    args.strapi_token = args.strapi_token or settings.strapi_token()
+    return args
+
+
+def import_options(**overrides):
+    """
+    The import command's options with its defaults, as an argparse namespace
+    (e.g. for importer.configure()); keyword arguments override single options.
+    """
+    _, import_parser = build_parser()
+    args = import_parser.parse_args([])
+    for name, value in overrides.items():
+        if not hasattr(args, name):
+            raise TypeError(f"unknown import option: {name}")
+        setattr(args, name, value)
+    return _fill_defaults(args, import_parser)
+
+
+def validate(args):
+    """The validate command: reads and checks the sheet without loading the importer."""
+    if not args.input.exists():
+        log.error(f"Error: input file not found at {args.input}")
+        return 1
+    reader = RowReader(args.input, sheet_name=args.sheet, cache_dir=args.cache_dir / 'rows')
+    log.info(f"Reading rows from {args.input} ({reader.source})")
+    return 1 if validate_sheet(args, reader, ImportMetrics()) else 0
+
+
+def main(argv=None):
+    settings.load_env()
+    parser, import_parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 2
+    args = _fill_defaults(args, import_parser)
+    configure_logging(args.log_level, args.log_format)
+
+    if args.command == 'validate':
+        return validate(args)
+    if not args.strapi_token and not args.validate_only:
+        log.error("Error: no Strapi API token: set STRAPI_TOKEN (in the environment or a .env file) "
+                  "or pass --strapi-token")
+        return 1
+
+    from . import importer
+    return importer.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+In-memory index of the consultants already in Strapi.
+
+Built once at startup by paging through /api/consultants (large pages, fetched
+in parallel) so upsert decisions are answered locally instead of with one
+filtered GET per spreadsheet row.
+"""
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def normalize_name(firstName, lastName):
+    combined = f"{firstName or ''}{lastName or ''}"
+    return re.sub(r'[^A-Za-z0-9]', '', combined).lower()
+
+
+def normalize_email(email):
+    return email.strip().lower() if email else None
+
+
+class ConsultantIndex:
+    """Consultants keyed by contact email and by normalized first+last name."""
+
+    # Only what upsert decisions need; id and documentId are always returned
+    FIELDS = ['firstName', 'lastName', 'contactInfo']
+
+    def __init__(self):
+        self.by_email = {}
+        self.by_name = {}
+        self.pages_fetched = 0
+        self.loaded = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.by_name)
+
+    def add(self, item):
+        """Adds a consultant entry (as returned by the REST API) to the index."""
+        entry = {'id': item.get('id'), 'documentId': item.get('documentId')}
+        contact = item.get('contactInfo') or {}
+        email = normalize_email(contact.get('Email')) if isinstance(contact, dict) else None
+        name_key = normalize_name(item.get('firstName'), item.get('lastName'))
+        with self._lock:
+            # Keep the first (oldest) entry when names or emails collide
+            if email:
+                self.by_email.setdefault(email, entry)
+            if name_key:
+                self.by_name.setdefault(name_key, entry)
+        return entry
+
+    def lookup(self, email, firstName, lastName):
+        """
+        Returns dict with 'id' and 'documentId' if found, None otherwise.
+        Email wins over name when both match different entries, so only pass an
+        email that really identifies the person (not a generated one).
+        """
+        email = normalize_email(email)
+        with self._lock:
+            if email and email in self.by_email:
+                return self.by_email[email]
+            return self.by_name.get(normalize_name(firstName, lastName))
+
+    def load(self, fetch_page, page_size=100, workers=4):
+        """
+        Pages through every consultant. fetch_page(page, page_size, fields) must
+        return the parsed REST response ({'data': [...], 'meta': {'pagination': ...}}).
+        The first page tells us the page count; the rest are fetched concurrently.
+        """
+        first = fetch_page(1, page_size, self.FIELDS)
+        pages = [first]
+        page_count = first.get('meta', {}).get('pagination', {}).get('pageCount', 1) or 1
+        if page_count > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch') as pool:
+                pages.extend(pool.map(lambda p: fetch_page(p, page_size, self.FIELDS), range(2, page_count + 1)))
+        items = [item for page in pages for item in (page.get('data') or [])]
+        items.sort(key=lambda item: item.get('id') or 0)
+        for item in items:
+            self.add(item)
+        self.pages_fetched = len(pages)
+        self.loaded = True
+        return self
+
+    def ensure_loaded(self, fetch_page, workers=4):
+        """Loads the index unless that already happened; safe to call from every worker."""
+        if self.loaded:
+            return self
+        with self._load_lock:
+            if not self.loaded:
+                self.load(fetch_page, workers=workers)
+        return self
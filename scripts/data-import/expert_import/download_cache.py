@@ -0,0 +1,209 @@
+"""
+On-disk cache of remote images.
+
+The property photos in mockData and any Profile Image URL column point at a
+small set of remote URLs shared by many rows. prefetch() downloads every
+distinct URL once, in parallel, before the import starts, and upload_media()
+then works from the file on disk. Bodies are streamed to disk in chunks and
+hashed on the way, so a large video never has to fit in memory. Entries younger than max_age are used without
+any request; older ones are revalidated with If-None-Match / If-Modified-Since,
+so an unchanged image costs a 304 and no body. The index is rewritten every
+flush_every downloads or revalidations and at exit, rather than after each
+one; a crash only means those images are fetched or revalidated again.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+
+
+class DownloadCache:
+    """
+    url -> file on disk, with the validators needed to revalidate it.
+    Safe to share between import worker threads.
+    """
+
+    def __init__(self, cache_dir, max_age=24 * 3600, timeout=30, pool_size=16, flush_every=50):
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / 'index.json'
+        self.max_age = max_age
+        self.timeout = timeout
+        self.flush_every = flush_every
+        self.entries = {}
+        self.fresh = 0
+        self.revalidated = 0
+        self.downloaded = 0
+        self.failed = 0
+        self.bytes_downloaded = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # orders index writes; taken before _lock
+        self._unsaved = 0
+        self._key_locks = {}
+        self._checked = set()  # urls downloaded or revalidated by this run: never asked about twice
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                log.warning("⚠️ Ignoring unreadable download cache index %s: %s", self.index_path, e)
+                self.entries = {}
+        atexit.register(self.flush)
+
+    def _path(self, url):
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.bin"
+
+    def _lock_for(self, url):
+        with self._lock:
+            return self._key_locks.setdefault(url, threading.Lock())
+
+    def get(self, url):
+        """
+        Returns the bytes behind url, from disk when possible. Raises
+        requests.RequestException when it has to download and cannot.
+        """
+        return self.path(url).read_bytes()
+
+    def path(self, url):
+        """
+        Like get(), but returns the Path of the cached file instead of reading it.
+        """
+        path = self._path(url)
+        with self._lock_for(url):
+            with self._lock:
+                entry = self.entries.get(url)
+            if entry and path.exists():
+                if url in self._checked or time.time() - entry.get('checkedAt', 0) < self.max_age:
+                    with self._lock:
+                        self.fresh += 1
+                    return path
+                try:
+                    return self._fetch(url, path, entry)
+                except requests.RequestException as e:
+                    # A stale copy beats no image when the origin is unreachable
+                    log.warning("⚠️ Could not revalidate %s (%s); using the cached copy", url, e)
+                    return path
+            return self._fetch(url, path, None)
+
+    def cached(self, url):
+        """Path of url's body if it is on disk, without any request (None otherwise)."""
+        path = self._path(url)
+        with self._lock:
+            entry = self.entries.get(url)
+        return path if entry and path.exists() else None
+
+    def digest(self, url):
+        """SHA-256 of the cached body of url, recorded when it was downloaded (None if unknown)."""
+        with self._lock:
+            return (self.entries.get(url) or {}).get('sha256')
+
+    def _fetch(self, url, path, entry):
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('lastModified'):
+                headers['If-Modified-Since'] = entry['lastModified']
+        with self.session.get(url, timeout=self.timeout, headers=headers, stream=True) as resp:
+            if resp.status_code == 304 and entry:
+                with self._lock:
+                    self.revalidated += 1
+                    self._checked.add(url)
+                    entry['checkedAt'] = time.time()
+                    self._unsaved += 1
+                    due = self._unsaved >= self.flush_every
+                if due:
+                    self._save(self.flush_every)
+                return path
+            resp.raise_for_status()
+            # Write to a temp file and rename so a crash never leaves a truncated image
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".tmp{threading.get_ident()}")
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                with open(tmp_path, 'wb') as f:
+                    for chunk in resp.iter_content(CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            os.replace(tmp_path, path)
+        with self._lock:
+            self.downloaded += 1
+            self._checked.add(url)
+            self.bytes_downloaded += size
+            self.entries[url] = {
+                'file': path.name,
+                'etag': resp.headers.get('ETag'),
+                'lastModified': resp.headers.get('Last-Modified'),
+                'size': size,
+                'sha256': digest.hexdigest(),
+                'checkedAt': time.time(),
+            }
+            self._unsaved += 1
+            due = self._unsaved >= self.flush_every
+        if due:
+            self._save(self.flush_every)
+        return path
+
+    def flush(self):
+        """Writes the index if anything changed since the last save; called at exit and after prefetch()."""
+        self._save(1)
+
+    def _save(self, at_least):
+        with self._save_lock:
+            with self._lock:
+                # Another worker may have saved while this one waited
+                if self._unsaved < at_least:
+                    return
+                entries = {url: dict(entry) for url, entry in self.entries.items()}
+                self._unsaved = 0
+            # Serialised outside _lock so other downloads carry on meanwhile
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+
+    def prefetch(self, urls, workers=8):
+        """
+        Makes sure every url is on disk and current, downloading concurrently.
+        Failures are logged and counted; the row that needs the image will try
+        again and report it. Returns how many urls could not be fetched.
+        """
+        urls = sorted(set(urls))
+
+        def fetch(url):
+            try:
+                self.path(url)
+                return True
+            except requests.RequestException as e:
+                log.warning("⚠️ Could not prefetch %s: %s", url, e)
+                with self._lock:
+                    self.failed += 1
+                return False
+
+        if not urls:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='prefetch') as pool:
+            missing = sum(1 for ok in pool.map(fetch, urls) if not ok)
+        self.flush()
+        return missing
@@ -0,0 +1,261 @@
+"""
+Fuzzy name -> headshot index for the images folder.
+
+Built once from the directory listing: every file gets a normalized key (its
+stem without a "ProfilePicture"-style suffix, alphanumerics only, lowercase),
+its name tokens, and character trigrams. Lookups try an exact key, then the
+last name alone, then the candidates that share a name token or trigrams with
+the query. A fuzzy candidate has to split into a given name and a surname
+that are each the consultant's own or one typo away from it (Tim -> TimeWebb,
+Higgins -> higins, Muhammad -> Muhammed), and score above a confidence
+threshold (Dice coefficient of the keys). A typo is one letter inserted or
+dropped, or one letter replaced in a name of six letters or more: short names
+a letter apart are usually different people (John / Joan, Mario / Maria), and
+a stranger's headshot is worse than the default avatar. When several files
+qualify equally the name is reported as ambiguous and gets no image. Only
+candidates reached through the query's postings are scored, so lookups stay
+sublinear in the folder size.
+
+The index is saved next to the other caches and rebuilt only when the folder's
+mtime changes (files added, removed or renamed).
+"""
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+INDEX_VERSION = 3
+
+# Shortest name in which one replaced letter still counts as a typo
+MIN_SUBSTITUTION_LEN = 6
+
+# Suffixes photographers and HR exports tend to add after the name
+SUFFIX_RE = re.compile(r'(?i)(profile[\s_-]*picture|profile[\s_-]*photo|headshot|portrait|photo)$')
+
+
+def normalize_key(text):
+    return re.sub(r'[^A-Za-z0-9]', '', text or '').lower()
+
+
+def name_tokens(text):
+    """'TimeWebbProfilePicture' -> ['time', 'webb']; 'pellham-higins' -> ['pellham', 'higins']."""
+    spaced = re.sub(r'([a-z])([A-Z])', r'\1 \2', text or '')
+    return [t.lower() for t in re.split(r'[^A-Za-z0-9]+', spaced) if t]
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _strip_suffix(stem):
+    return SUFFIX_RE.sub('', stem).rstrip(' _-') or stem
+
+
+def one_typo_apart(a, b):
+    """
+    True when a and b differ by one typo: a letter inserted or dropped (names of
+    three letters or more) or replaced (names of MIN_SUBSTITUTION_LEN or more).
+    """
+    if len(a) == len(b):
+        return len(a) >= MIN_SUBSTITUTION_LEN and sum(x != y for x, y in zip(a, b)) == 1
+    if abs(len(a) - len(b)) != 1:
+        return False
+    shorter, longer = sorted((a, b), key=len)
+    return len(shorter) >= 3 and any(longer[:i] + longer[i + 1:] == shorter for i in range(len(longer)))
+
+
+def typos(name, wanted):
+    """0 when name is wanted, 1 when it is one typo away, None otherwise."""
+    if name == wanted:
+        return 0
+    return 1 if one_typo_apart(name, wanted) else None
+
+
+def given_name_of(key, surname):
+    """The rest of a file key around the surname ('timewebb', 'webb' -> 'time'), or None if it lacks it."""
+    if key.endswith(surname):
+        return key[:-len(surname)]
+    if key.startswith(surname):
+        return key[len(surname):]
+    return None
+
+
+class ImageIndex:
+
+    def __init__(self, threshold=0.7):
+        self.threshold = threshold
+        self.files = []          # index -> Path
+        self.keys = []           # index -> normalized key
+        self.gram_counts = []    # index -> number of trigrams in the key
+        self.tokens = []         # index -> name tokens
+        self.key_to_file = {}    # normalized key -> index
+        self.token_postings = {}
+        self.trigram_postings = {}
+        self.matches = {}        # "First Last" -> (Path or None, score, kind)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.files)
+
+    # ---------- building / persistence ----------
+
+    def _add(self, path):
+        stem = _strip_suffix(path.stem)
+        key = normalize_key(stem)
+        if not key or key in self.key_to_file:
+            return
+        i = len(self.files)
+        self.files.append(path)
+        self.keys.append(key)
+        self.key_to_file[key] = i
+        tokens = name_tokens(stem)
+        self.tokens.append(tokens)
+        for token in dict.fromkeys(tokens):
+            self.token_postings.setdefault(token, []).append(i)
+        grams = trigrams(key)
+        self.gram_counts.append(len(grams))
+        for gram in grams:
+            self.trigram_postings.setdefault(gram, []).append(i)
+
+    def load_or_build(self, images_dir, cache_path=None, exclude=()):
+        """
+        Loads the saved index when it was built for the folder's current mtime,
+        otherwise scans the folder and saves a fresh one. Returns self.
+        """
+        images_dir = Path(images_dir)
+        if not images_dir.is_dir():
+            return self
+        mtime_ns = images_dir.stat().st_mtime_ns
+        exclude = {Path(p).name for p in exclude}
+        cache_path = Path(cache_path) if cache_path else None
+
+        if cache_path and cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                if (saved.get('version') == INDEX_VERSION and saved.get('dir') == str(images_dir)
+                        and saved.get('mtime_ns') == mtime_ns and saved.get('exclude') == sorted(exclude)):
+                    self._restore(images_dir, saved)
+                    return self
+            except (OSError, json.JSONDecodeError, KeyError):
+                pass
+
+        for name in sorted(f.name for f in images_dir.iterdir() if f.is_file() and f.name not in exclude):
+            self._add(images_dir / name)
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': INDEX_VERSION,
+                    'dir': str(images_dir),
+                    'mtime_ns': mtime_ns,
+                    'exclude': sorted(exclude),
+                    'files': [p.name for p in self.files],
+                    'keys': self.keys,
+                    'gram_counts': self.gram_counts,
+                    'tokens': self.tokens,
+                    'token_postings': self.token_postings,
+                    'trigram_postings': self.trigram_postings,
+                }, f)
+        return self
+
+    def _restore(self, images_dir, saved):
+        self.files = [images_dir / name for name in saved['files']]
+        self.keys = saved['keys']
+        self.gram_counts = saved['gram_counts']
+        self.key_to_file = {key: i for i, key in enumerate(self.keys)}
+        self.tokens = saved['tokens']
+        self.token_postings = saved['token_postings']
+        self.trigram_postings = saved['trigram_postings']
+
+    # ---------- lookups ----------
+
+    def _splits(self, i, last_key):
+        """(given name, surname) readings of file i: at every token boundary, either way round."""
+        tokens = self.tokens[i]
+        splits = set()
+        for k in range(1, len(tokens)):
+            head, tail = ''.join(tokens[:k]), ''.join(tokens[k:])
+            splits.update(((head, tail), (tail, head)))
+        # Keys without word boundaries ('timewebb') still split around an exact surname
+        given = given_name_of(self.keys[i], last_key)
+        if given:
+            splits.add((given, last_key))
+        return splits
+
+    def _fuzzy(self, first_key, last_key, query_tokens):
+        """
+        (file indexes that qualify, best score) for the fewest typos any file
+        needs: both names exact, then one typo, then one in each name. Several
+        indexes mean a tie, whatever their scores; the threshold only applies
+        to a single match.
+        """
+        query_key = first_key + last_key
+        grams = trigrams(query_key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.trigram_postings.get(gram, ()))
+        for token in query_tokens:
+            for i in self.token_postings.get(token, ()):
+                shared.setdefault(i, 0)
+        levels = {}
+        best_score = 0.0
+        for i, overlap in shared.items():
+            score = 2.0 * overlap / (len(grams) + self.gram_counts[i])
+            best_score = max(best_score, score)
+            costs = [typos(given, first_key) + typos(surname, last_key)
+                     for given, surname in self._splits(i, last_key)
+                     if given and typos(given, first_key) is not None and typos(surname, last_key) is not None]
+            if costs:
+                levels.setdefault(min(costs), []).append((score, i))
+        if not levels:
+            return [], best_score
+        qualifying = levels[min(levels)]
+        top = max(score for score, _ in qualifying)
+        return [i for score, i in sorted(qualifying, reverse=True)], top
+
+    def match(self, firstName, lastName):
+        """
+        Returns (Path or None, score, kind) where kind is 'exact', 'last-name',
+        'fuzzy', 'ambiguous' or 'none'. The result is also recorded for report().
+        """
+        first_key, last_key = normalize_key(firstName), normalize_key(lastName)
+        query_key = first_key + last_key
+        if query_key in self.key_to_file:
+            result = (self.files[self.key_to_file[query_key]], 1.0, 'exact')
+        elif last_key in self.key_to_file:
+            result = (self.files[self.key_to_file[last_key]], 0.9, 'last-name')
+        else:
+            candidates, score = (self._fuzzy(first_key, last_key, name_tokens(f"{firstName} {lastName}"))
+                                 if first_key and last_key else ([], 0.0))
+            if len(candidates) == 1 and score >= self.threshold:
+                result = (self.files[candidates[0]], score, 'fuzzy')
+            elif len(candidates) > 1:
+                log.warning("Image for %s %s is ambiguous (%s); using none", firstName, lastName,
+                            ', '.join(self.files[i].name for i in candidates))
+                result = (None, score, 'ambiguous')
+            else:
+                result = (None, score, 'none')
+        with self._lock:
+            self.matches[f"{firstName} {lastName}"] = result
+        return result
+
+    def report(self):
+        """Logs every match made so far in one batch, grouped by how it was found."""
+        with self._lock:
+            matches = dict(self.matches)
+        by_kind = {}
+        for name, (path, score, kind) in sorted(matches.items()):
+            by_kind.setdefault(kind, []).append((name, path, score))
+        log.info("Image matches for %d consultants: %s", len(matches),
+                 ', '.join(f"{len(by_kind.get(k, []))} {k}"
+                           for k in ('exact', 'last-name', 'fuzzy', 'ambiguous', 'none')))
+        for kind in ('last-name', 'fuzzy', 'ambiguous', 'none'):
+            for name, path, score in by_kind.get(kind, []):
+                target = path.name if path else 'default avatar'
+                log.info("  %-9s %s -> %s (score %.2f)", kind, name, target, score)
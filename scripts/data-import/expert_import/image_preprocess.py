@@ -0,0 +1,201 @@
+"""
+Local image preprocessing before upload.
+
+Detects the real MIME type from the file's magic bytes, downscales images to the
+maximum profile dimensions and transcodes them to WebP or JPEG, so Strapi's
+sharp pipeline on the web dyno has less to do and uploads carry fewer bytes.
+Derivatives are written to an on-disk cache keyed by the source content hash
+and the output settings; the startup warm-up runs in a process pool over the
+local images and the remote ones the download cache has already fetched.
+
+Pillow is optional: without it files are uploaded unchanged, but still with
+the correct MIME type.
+"""
+import hashlib
+import logging
+import mimetypes
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+log = logging.getLogger(__name__)
+
+FORMATS = {
+    'webp': ('WEBP', 'image/webp', '.webp'),
+    'jpeg': ('JPEG', 'image/jpeg', '.jpg'),
+}
+
+# Image types we re-encode; anything else (GIF, SVG, video, audio) is uploaded as-is
+TRANSCODABLE = {'image/jpeg', 'image/png', 'image/webp', 'image/bmp', 'image/tiff'}
+
+
+def detect_mime(content, filename=None):
+    """MIME type from magic bytes, falling back to the file extension."""
+    head = content[:16]
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head.startswith((b'GIF87a', b'GIF89a')):
+        return 'image/gif'
+    if head.startswith(b'BM'):
+        return 'image/bmp'
+    if head.startswith((b'II*\x00', b'MM\x00*')):
+        return 'image/tiff'
+    guessed = mimetypes.guess_type(filename or '')[0]
+    return guessed or 'application/octet-stream'
+
+
+def _encode(content, max_dim, fmt, quality):
+    """
+    Downscales (never upscales) and re-encodes. Returns the new bytes, or None
+    when the original is already within limits and no larger than the result.
+    """
+    pil_format, _, _ = FORMATS[fmt]
+    with Image.open(BytesIO(content)) as img:
+        img = ImageOps.exif_transpose(img)
+        resized = max(img.size) > max_dim
+        if resized:
+            img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+        if pil_format == 'JPEG' and img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        elif img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+            img = img.convert('RGBA')
+        out = BytesIO()
+        if pil_format == 'WEBP':
+            img.save(out, format=pil_format, quality=quality, method=4)
+        else:
+            img.save(out, format=pil_format, quality=quality, optimize=True, progressive=True)
+    encoded = out.getvalue()
+    if not resized and len(encoded) >= len(content):
+        return None
+    return encoded
+
+
+def _derive_file(src_path, dest_path, max_dim, fmt, quality):
+    """Process-pool worker: writes the derivative (or an empty marker meaning 'keep original')."""
+    with open(src_path, 'rb') as f:
+        content = f.read()
+    try:
+        encoded = _encode(content, max_dim, fmt, quality)
+    except Exception:
+        encoded = None  # undecodable: upload the original
+    tmp_path = f"{dest_path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(encoded or b'')
+    os.replace(tmp_path, dest_path)
+    return dest_path
+
+
+class ImagePreprocessor:
+
+    def __init__(self, cache_dir, max_dim=1024, fmt='webp', quality=82, enabled=True, max_input_bytes=None):
+        self.cache_dir = Path(cache_dir)
+        self.max_input_bytes = max_input_bytes
+        self.max_dim = max_dim
+        self.fmt = fmt
+        self.quality = quality
+        self.enabled = enabled and Image is not None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._lock = threading.Lock()  # upload workers share the byte counters
+        if enabled and Image is None:
+            log.warning("⚠️ Pillow is not installed; images will be uploaded without resizing or transcoding")
+
+    def _derivative_path(self, digest):
+        return self.cache_dir / f"{digest[:32]}-{self.max_dim}-{self.fmt}-q{self.quality}.bin"
+
+    def transcodes(self, filename, head, size):
+        """
+        Whether process() would re-encode a file of this size starting with these
+        bytes. Files it would not touch can be uploaded straight from disk; so are
+        images above max_input_bytes, rather than decoded in memory.
+        """
+        if not self.enabled or (self.max_input_bytes and size > self.max_input_bytes):
+            return False
+        return detect_mime(head, filename) in TRANSCODABLE
+
+    def _count(self, size_in, size_out):
+        with self._lock:
+            self.bytes_in += size_in
+            self.bytes_out += size_out
+
+    def count_unchanged(self, size):
+        """Accounts for a file uploaded as-is without going through process()."""
+        self._count(size, size)
+
+    def process(self, filename, content):
+        """
+        Returns (filename, content, mime) ready for upload. A cached derivative is
+        reused when present; otherwise it is produced in-process and cached.
+        """
+        mime = detect_mime(content, filename)
+        if not self.enabled or mime not in TRANSCODABLE:
+            self._count(len(content), len(content))
+            return filename, content, mime
+
+        digest = hashlib.sha256(content).hexdigest()
+        derivative = self._derivative_path(digest)
+        if derivative.exists():
+            with open(derivative, 'rb') as f:
+                encoded = f.read()
+        else:
+            try:
+                encoded = _encode(content, self.max_dim, self.fmt, self.quality) or b''
+            except Exception as e:
+                log.warning("⚠️ Could not preprocess %s: %s; uploading original", filename, e)
+                encoded = b''
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = derivative.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, 'wb') as f:
+                f.write(encoded)
+            os.replace(tmp_path, derivative)
+
+        if not encoded:
+            # Empty derivative: the original was already small enough
+            self._count(len(content), len(content))
+            return filename, content, mime
+        _, out_mime, ext = FORMATS[self.fmt]
+        self._count(len(content), len(encoded))
+        return f"{Path(filename).stem}{ext}", encoded, out_mime
+
+    def warm(self, paths, workers=None):
+        """
+        Builds missing derivatives for the given files on disk in a process pool,
+        skipping the ones process() would not see: files that are not transcodable
+        images and those above max_input_bytes. Returns how many were produced.
+        """
+        if not self.enabled:
+            return 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        jobs = []
+        for path in paths:
+            path = Path(path)
+            with open(path, 'rb') as f:
+                head = f.read(16)
+            if not self.transcodes(path.name, head, path.stat().st_size):
+                continue
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            derivative = self._derivative_path(digest.hexdigest())
+            if not derivative.exists():
+                jobs.append((str(path), str(derivative)))
+        if not jobs:
+            return 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_derive_file, src, dest, self.max_dim, self.fmt, self.quality)
+                       for src, dest in jobs]
+            for future in futures:
+                future.result()
+        return len(jobs)
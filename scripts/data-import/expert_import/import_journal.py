@@ -0,0 +1,166 @@
+"""
+Crash-resumable import journal.
+
+A local SQLite file recording, per spreadsheet row, the consultant it wrote and
+every child entity created for it (properties, timeline items, uploaded media).
+With --resume the importer reads it back: finished rows are skipped without a
+single network call, and a half-finished row continues from its last checkpoint
+instead of re-POSTing properties and timeline items that already exist.
+
+The same file keeps the payload fingerprint and the mock dataset of every
+consultant that was fully imported. Unlike the per-row tables these survive
+across runs, so an incremental sync can skip consultants whose payload has not
+changed, and an updated consultant keeps the properties and timeline items it
+already has instead of drawing a new dataset.
+"""
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    row_key           TEXT PRIMARY KEY,
+    row_number        INTEGER NOT NULL,
+    status            TEXT NOT NULL,
+    mock_n            INTEGER,
+    action            TEXT,
+    consultant_id     INTEGER,
+    consultant_doc_id TEXT,
+    updated_at        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    row_key    TEXT NOT NULL,
+    kind       TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    strapi_id  INTEGER,
+    uid        TEXT,
+    PRIMARY KEY (row_key, kind, source_key)
+);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    consultant_doc_id TEXT PRIMARY KEY,
+    fingerprint       TEXT NOT NULL,
+    updated_at        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mock_datasets (
+    consultant_doc_id TEXT PRIMARY KEY,
+    mock_n            INTEGER NOT NULL,
+    updated_at        TEXT NOT NULL
+);
+"""
+
+
+def _now():
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+class ImportJournal:
+    """
+    Row status moves 'started' -> 'done'. Entities are keyed by the source
+    identifier from the mock data (original property_uid / post_id, media path
+    or URL) so a resumed row can tell what it already created.
+    Every write commits immediately; the connection is shared between workers.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Starts a fresh run: forget the rows of previous runs (fingerprints are kept)."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM rows')
+            self._conn.execute('DELETE FROM entities')
+
+    def get_row(self, row_key):
+        with self._lock:
+            cur = self._conn.execute('SELECT * FROM rows WHERE row_key = ?', (row_key,))
+            found = cur.fetchone()
+        return dict(found) if found else None
+
+    def start_row(self, row_key, row_number, mock_n):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR IGNORE INTO rows (row_key, row_number, status, mock_n, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (row_key, row_number, 'started', mock_n, _now()))
+
+    def set_consultant(self, row_key, consultant_id, consultant_doc_id, action):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE rows SET consultant_id = ?, consultant_doc_id = ?, action = ?, updated_at = ? '
+                'WHERE row_key = ?',
+                (consultant_id, consultant_doc_id, action, _now(), row_key))
+
+    def finish_row(self, row_key):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE rows SET status = 'done', updated_at = ? WHERE row_key = ?",
+                (_now(), row_key))
+
+    def done_consultants(self):
+        """{consultant id: mock_n} of every row this run (or the one it resumes) finished."""
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT consultant_id, mock_n FROM rows WHERE status = 'done' AND consultant_id IS NOT NULL")
+            return {r['consultant_id']: r['mock_n'] for r in cur.fetchall()}
+
+    def record(self, row_key, kind, source_key, strapi_id, uid=None):
+        """kind is 'property', 'timeline' or 'media'. Failed uploads (no id) are not recorded."""
+        if strapi_id is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entities (row_key, kind, source_key, strapi_id, uid) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (row_key, kind, str(source_key), strapi_id, uid))
+
+    def entities(self, row_key, kind):
+        """Returns {source_key: (strapi_id, uid)} for one row and kind."""
+        with self._lock:
+            cur = self._conn.execute(
+                'SELECT source_key, strapi_id, uid FROM entities WHERE row_key = ? AND kind = ?',
+                (row_key, kind))
+            return {r['source_key']: (r['strapi_id'], r['uid']) for r in cur.fetchall()}
+
+    def get_fingerprint(self, consultant_doc_id):
+        with self._lock:
+            cur = self._conn.execute(
+                'SELECT fingerprint FROM fingerprints WHERE consultant_doc_id = ?', (consultant_doc_id,))
+            found = cur.fetchone()
+        return found['fingerprint'] if found else None
+
+    def set_fingerprint(self, consultant_doc_id, fingerprint):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO fingerprints (consultant_doc_id, fingerprint, updated_at) '
+                'VALUES (?, ?, ?)',
+                (consultant_doc_id, fingerprint, _now()))
+
+    def get_mock_n(self, consultant_doc_id):
+        """The mock dataset the consultant was last imported with, or None."""
+        with self._lock:
+            cur = self._conn.execute(
+                'SELECT mock_n FROM mock_datasets WHERE consultant_doc_id = ?', (consultant_doc_id,))
+            found = cur.fetchone()
+        return found['mock_n'] if found else None
+
+    def set_mock_n(self, consultant_doc_id, mock_n):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO mock_datasets (consultant_doc_id, mock_n, updated_at) '
+                'VALUES (?, ?, ?)',
+                (consultant_doc_id, mock_n, _now()))
+
+    def counts(self):
+        with self._lock:
+            cur = self._conn.execute('SELECT status, COUNT(*) AS n FROM rows GROUP BY status')
+            return {r['status']: r['n'] for r in cur.fetchall()}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,247 @@
+"""
+Run metrics and logging setup for the importer.
+
+Phase timers (sheet load, image match, media upload, consultant upsert,
+property and timeline creation), free-form counters, and per-endpoint request
+counts and latency histograms collected from StrapiClient. At the end of a run
+they are written as a JSON summary and as a Prometheus textfile (the format
+node_exporter's textfile collector reads), so scheduled imports can be graphed
+and slow phases spotted.
+
+Phase times are summed across workers, so with --workers > 1 they can add up
+to more than the wall-clock time of the run. Phases may nest (property creation
+includes the uploads of its images).
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Upper bounds in seconds; one more implicit +Inf bucket
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = 'consultant_import'
+
+
+class Histogram:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation (None when empty)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets + (float('inf'),), self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float('inf')
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum_seconds': round(self.sum, 6),
+            'p50_seconds': self.quantile(0.5),
+            'p95_seconds': self.quantile(0.95),
+            'buckets': {str(b): n for b, n in zip(self.buckets + ('+Inf',), self.counts)},
+        }
+
+
+class ImportMetrics:
+    """Thread-safe collector shared by the main loop, the workers and StrapiClient."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.phases = {}      # name -> Histogram of durations
+        self.counters = {}    # name -> int
+        self.endpoints = {}   # endpoint label -> {'histogram': Histogram, 'statuses': {status: n}}
+        self.gauges = {}      # name -> number
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_phase(name, time.perf_counter() - started)
+
+    def timed(self, name):
+        """Decorator form of phase()."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.phase(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def observe_phase(self, name, seconds):
+        with self._lock:
+            self.phases.setdefault(name, Histogram()).observe(seconds)
+
+    def timed_iter(self, name, iterable):
+        """Yields from iterable, charging the time spent producing each item to a phase."""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.observe_phase(name, time.perf_counter() - started)
+                return
+            self.observe_phase(name, time.perf_counter() - started)
+            yield item
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe_request(self, endpoint, seconds, status):
+        """Called by StrapiClient for every attempt; status is the HTTP code or the error name."""
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, {'histogram': Histogram(), 'statuses': {}})
+            stats['histogram'].observe(seconds)
+            stats['statuses'][str(status)] = stats['statuses'].get(str(status), 0) + 1
+
+    # ---------- output ----------
+
+    def summary(self):
+        with self._lock:
+            return {
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started_at)),
+                'duration_seconds': round(time.perf_counter() - self._started, 3),
+                'phases': {name: h.to_dict() for name, h in sorted(self.phases.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'gauges': dict(sorted(self.gauges.items())),
+                'endpoints': {
+                    name: dict(stats['histogram'].to_dict(), statuses=dict(stats['statuses']))
+                    for name, stats in sorted(self.endpoints.items())
+                },
+            }
+
+    def prometheus_text(self):
+        summary = self.summary()
+        p = METRIC_PREFIX
+        lines = [
+            f"# HELP {p}_last_run_timestamp_seconds Unix time the last import started.",
+            f"# TYPE {p}_last_run_timestamp_seconds gauge",
+            f"{p}_last_run_timestamp_seconds {int(self.started_at)}",
+            f"# HELP {p}_duration_seconds Wall-clock duration of the last import.",
+            f"# TYPE {p}_duration_seconds gauge",
+            f"{p}_duration_seconds {summary['duration_seconds']}",
+        ]
+        with self._lock:
+            phases = {name: h for name, h in self.phases.items()}
+            endpoints = {name: stats for name, stats in self.endpoints.items()}
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+
+        if counters:
+            lines += [f"# HELP {p}_events_total Importer events by kind (rows created, media reused, ...).",
+                      f"# TYPE {p}_events_total counter"]
+            lines += [f'{p}_events_total{{event="{_escape(name)}"}} {value}' for name, value in sorted(counters.items())]
+        if gauges:
+            lines += [f"# HELP {p}_value Importer values from the last run (bytes uploaded, ...).",
+                      f"# TYPE {p}_value gauge"]
+            lines += [f'{p}_value{{name="{_escape(name)}"}} {value}' for name, value in sorted(gauges.items())]
+
+        lines += [f"# HELP {p}_phase_seconds Time spent per import phase, summed across workers.",
+                  f"# TYPE {p}_phase_seconds histogram"]
+        for name, h in sorted(phases.items()):
+            lines += _histogram_lines(f"{p}_phase_seconds", f'phase="{_escape(name)}"', h)
+
+        lines += [f"# HELP {p}_request_seconds Strapi request latency per endpoint (every attempt).",
+                  f"# TYPE {p}_request_seconds histogram"]
+        for name, stats in sorted(endpoints.items()):
+            lines += _histogram_lines(f"{p}_request_seconds", f'endpoint="{_escape(name)}"', stats['histogram'])
+        lines += [f"# HELP {p}_requests_total Strapi requests per endpoint and status.",
+                  f"# TYPE {p}_requests_total counter"]
+        for name, stats in sorted(endpoints.items()):
+            for status, n in sorted(stats['statuses'].items()):
+                lines.append(f'{p}_requests_total{{endpoint="{_escape(name)}",status="{_escape(status)}"}} {n}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, json_path=None, prom_path=None):
+        """Writes the JSON summary and/or Prometheus textfile atomically."""
+        if json_path:
+            _atomic_write(json_path, json.dumps(self.summary(), indent=2) + '\n')
+        if prom_path:
+            _atomic_write(prom_path, self.prometheus_text())
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _histogram_lines(metric, labels, h):
+    lines = []
+    cumulative = 0
+    for bound, n in zip(h.buckets + ('+Inf',), h.counts):
+        cumulative += n
+        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{{labels}}} {round(h.sum, 6)}')
+    lines.append(f'{metric}_count{{{labels}}} {h.count}')
+    return lines
+
+
+def _atomic_write(path, text):
+    # The textfile collector may read at any moment; never let it see a partial file
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp{os.getpid()}")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, thread, message (+ exception)."""
+
+    def format(self, record):
+        entry = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_logging(level='INFO', fmt='text'):
+    """Root logging for a run: plain messages (as print() used to show them) or JSON lines."""
+    handler = logging.StreamHandler()
+    if fmt == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(message)s'))
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(getattr(logging, str(level).upper(), logging.INFO))
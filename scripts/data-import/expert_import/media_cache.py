@@ -0,0 +1,145 @@
+"""
+Content-addressed cache of media already uploaded to Strapi.
+
+Maps the SHA-256 of a file's bytes to the Strapi file id it was uploaded as, so
+identical images (the shared Unsplash property photos, the default avatar) are
+uploaded once and every later row or rerun reuses the same file id.
+
+Every put() appends one JSON line to a log next to the cache file and flushes
+it, so an upload is on disk as soon as it is recorded (a killed run never
+uploads it again) without rewriting the whole cache each time. Loading replays
+the log over the JSON file; flush(), at exit and when an import ends, folds the
+log back into the JSON file and removes it.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+def sha256_bytes(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+class MediaCache:
+    """
+    Persistent sha256 -> {id, name, size} map stored as JSON plus an append-only log.
+    Safe to share between import worker threads.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(self.path.suffix + '.log')
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._log = None
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                log.warning("⚠️ Ignoring unreadable media cache %s: %s", self.path, e)
+                self.entries = {}
+        if self.log_path.exists():
+            self._replay()
+        atexit.register(self.flush)
+
+    def _replay(self):
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line of a run that died mid-write
+                if record.get('entry') is None:
+                    self.entries.pop(record.get('digest'), None)
+                else:
+                    self.entries[record['digest']] = record['entry']
+
+    def lock_for(self, digest):
+        """
+        Per-digest lock so two workers holding the same bytes don't both upload them.
+        Hold it around the get() / upload / put() sequence.
+        """
+        with self._lock:
+            return self._key_locks.setdefault(digest, threading.Lock())
+
+    def get(self, digest):
+        """Returns the cached Strapi file id for this digest, or None."""
+        with self._lock:
+            entry = self.entries.get(digest)
+            if entry:
+                self.hits += 1
+                return entry['id']
+            self.misses += 1
+            return None
+
+    def put(self, digest, file_id, name, size):
+        entry = {
+            'id': file_id,
+            'name': name,
+            'size': size,
+            'uploadedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }
+        with self._lock:
+            self.entries[digest] = entry
+            self._append([{'digest': digest, 'entry': entry}])
+
+    def discard(self, digests):
+        with self._lock:
+            records = [{'digest': digest, 'entry': None} for digest in digests if digest in self.entries]
+            for record in records:
+                del self.entries[record['digest']]
+            self._append(records)
+
+    def _append(self, records):
+        # Caller holds self._lock
+        if not records:
+            return
+        if self._log is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, 'a', encoding='utf-8')
+        self._log.write(''.join(json.dumps(record, sort_keys=True) + '\n' for record in records))
+        self._log.flush()
+
+    def flush(self):
+        """Folds the log into the JSON file; called at exit, and by run() when an import ends."""
+        with self._lock:
+            if self._log is None and not self.log_path.exists():
+                return
+            # Write to a temp file and rename so a crash never leaves a truncated cache
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            self.log_path.unlink(missing_ok=True)
+
+    def verify(self, fetch_existing_ids, batch_size=100):
+        """
+        Checks every cached file id against Strapi and drops the stale ones.
+        fetch_existing_ids(ids) must return the subset of ids that still exist.
+        Returns the list of digests that were removed.
+        """
+        with self._lock:
+            by_id = {entry['id']: digest for digest, entry in self.entries.items()}
+        ids = sorted(by_id)
+        existing = set()
+        for start in range(0, len(ids), batch_size):
+            existing.update(fetch_existing_ids(ids[start:start + batch_size]))
+        stale = [by_id[file_id] for file_id in ids if file_id not in existing]
+        if stale:
+            self.discard(stale)
+        return stale
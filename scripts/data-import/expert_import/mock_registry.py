@@ -0,0 +1,178 @@
+"""
+Registry of the mock portfolio datasets in mockData/.
+
+Every mockPortfolioStats{n} / mockProperties{n} / mockTimelinePosts{n} set is
+loaded and checked once at startup, so a malformed file stops the run before
+any write instead of mid-import. The sets are pre-transformed into payload
+templates (roles/tags joined, person_id stripped, images split out) that each
+row only has to copy and fill in with its own ids.
+"""
+import json
+import re
+from pathlib import Path
+
+STATS_FIELDS = ('total_gfa', 'total_aum', 'deal_count', 'avg_deal_size')
+PROPERTY_NUMERIC_FIELDS = ('deal_size', 'irr', 'completion_percentage')
+
+
+class MockDataError(ValueError):
+    """Raised when a mock dataset is missing, unreadable or fails validation."""
+
+
+def load_enums(schema_path):
+    """Enum attribute -> allowed values from a Strapi content-type schema.json ({} if absent)."""
+    schema_path = Path(schema_path)
+    if not schema_path.exists():
+        return {}
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        attributes = json.load(f).get('attributes', {})
+    return {name: attr['enum'] for name, attr in attributes.items() if attr.get('type') == 'enumeration'}
+
+
+class MockDataset:
+    """
+    One numbered set, ready to use:
+      - stats:      the portfolio stats dict
+      - properties: list of (payload template, image URLs)
+      - timeline:   list of payload templates
+    """
+
+    def __init__(self, n, stats, properties, timeline):
+        self.n = n
+        self.stats = stats
+        self.properties = properties
+        self.timeline = timeline
+
+
+class MockRegistry:
+
+    def __init__(self):
+        self.datasets = {}
+
+    @property
+    def numbers(self):
+        return sorted(self.datasets)
+
+    def get(self, n):
+        return self.datasets[n]
+
+    def load(self, base_dir, property_enums=None, timeline_enums=None):
+        """
+        Loads and validates every numbered set in base_dir. Collects all problems
+        and raises a single MockDataError listing them.
+        """
+        base_dir = Path(base_dir)
+        property_enums = property_enums or {}
+        timeline_enums = timeline_enums or {}
+        numbers = sorted(int(m.group(1)) for m in
+                         (re.match(r'mockProperties(\d+)\.json$', p.name) for p in base_dir.glob('mockProperties*.json'))
+                         if m)
+        if not numbers:
+            raise MockDataError(f"No mockProperties*.json files found in {base_dir}")
+
+        errors = []
+        for n in numbers:
+            try:
+                stats = self._read(base_dir / f"mockPortfolioStats{n}.json", dict)
+                properties = self._read(base_dir / f"mockProperties{n}.json", list)
+                timeline = self._read(base_dir / f"mockTimelinePosts{n}.json", list)
+            except MockDataError as e:
+                errors.append(str(e))
+                continue
+            problems = (self._check_stats(stats)
+                        + self._check_properties(properties, property_enums)
+                        + self._check_timeline(timeline, properties, timeline_enums))
+            if problems:
+                errors.extend(f"dataset {n}: {p}" for p in problems)
+                continue
+            self.datasets[n] = MockDataset(
+                n, stats,
+                [self._property_template(p) for p in properties],
+                [self._timeline_template(p) for p in timeline])
+
+        if errors:
+            raise MockDataError("Invalid mock data:\n  " + "\n  ".join(errors))
+        return self
+
+    @staticmethod
+    def _read(path, expected_type):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise MockDataError(f"{path.name}: missing")
+        except json.JSONDecodeError as e:
+            raise MockDataError(f"{path.name}: invalid JSON ({e})")
+        if not isinstance(data, expected_type):
+            raise MockDataError(f"{path.name}: expected a JSON {expected_type.__name__}")
+        return data
+
+    @staticmethod
+    def _check_enums(label, item, enums):
+        return [f"{label}: {field} '{item[field]}' not in {allowed}"
+                for field, allowed in enums.items()
+                if item.get(field) is not None and item[field] not in allowed]
+
+    def _check_stats(self, stats):
+        return [f"stats: {field} must be a number" for field in STATS_FIELDS
+                if not isinstance(stats.get(field), (int, float))]
+
+    def _check_properties(self, properties, enums):
+        problems = []
+        seen = set()
+        for i, prop in enumerate(properties):
+            if not isinstance(prop, dict):
+                problems.append(f"property #{i}: not an object")
+                continue
+            uid = prop.get('property_uid')
+            label = f"property {uid or '#' + str(i)}"
+            if not uid or not isinstance(uid, str):
+                problems.append(f"{label}: missing property_uid")
+            elif uid in seen:
+                problems.append(f"{label}: duplicate property_uid")
+            seen.add(uid)
+            images = prop.get('images')
+            if images is not None and not (isinstance(images, list) and all(isinstance(u, str) for u in images)):
+                problems.append(f"{label}: images must be a list of URLs")
+            for field in PROPERTY_NUMERIC_FIELDS:
+                if prop.get(field) is not None and not isinstance(prop[field], (int, float)):
+                    problems.append(f"{label}: {field} must be a number")
+            problems.extend(self._check_enums(label, prop, enums))
+        return problems
+
+    def _check_timeline(self, timeline, properties, enums):
+        problems = []
+        seen = set()
+        property_uids = {p.get('property_uid') for p in properties if isinstance(p, dict)}
+        for i, post in enumerate(timeline):
+            if not isinstance(post, dict):
+                problems.append(f"post #{i}: not an object")
+                continue
+            post_id = post.get('post_id')
+            label = f"post {post_id or '#' + str(i)}"
+            if not post_id or not isinstance(post_id, str):
+                problems.append(f"{label}: missing post_id")
+            elif post_id in seen:
+                problems.append(f"{label}: duplicate post_id")
+            seen.add(post_id)
+            if post.get('property_uid') and post['property_uid'] not in property_uids:
+                problems.append(f"{label}: property_uid '{post['property_uid']}' is not in the matching properties set")
+            problems.extend(self._check_enums(label, post, enums))
+        return problems
+
+    @staticmethod
+    def _property_template(prop):
+        template = dict(prop)
+        images = template.pop('images', None) or []
+        # roles and tags are sent as comma-separated strings
+        for field in ('roles', 'tags'):
+            if isinstance(template.get(field), list):
+                template[field] = ', '.join(str(v) for v in template[field])
+        return template, list(images)
+
+    @staticmethod
+    def _timeline_template(post):
+        template = dict(post)
+        # Not part of the Strapi model
+        template.pop('person_id', None)
+        return template
@@ -0,0 +1,80 @@
+"""
+Portfolio rollup: consultant totals recomputed from the properties they own.
+
+total_aum, deal_count and avg_deal_size are derived from the properties whose
+owner is the consultant, so they cannot drift from what profile pages list.
+Properties carry no floor area, so total_gfa comes from the mock portfolio
+stats of the dataset each consultant was imported with in this run, and is
+left alone for everyone else.
+
+After an import the stage covers only the consultants that run wrote; the
+rollup command covers every consultant. It pages through their properties
+(deal_size and owner only) and the consultants themselves (current totals
+only), folds the properties into per-owner totals in one pass, and reports
+just the consultants whose stored values differ, so a rerun with nothing
+changed writes nothing.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+STAT_FIELDS = ('total_gfa', 'total_aum', 'deal_count', 'avg_deal_size')
+
+
+def fetch_all(fetch_page, page_size=100, workers=4):
+    """
+    Every item of a paged collection. fetch_page(page, page_size) returns the
+    parsed REST response; the first page gives the page count and the rest are
+    fetched concurrently.
+    """
+    first = fetch_page(1, page_size)
+    pages = [first]
+    page_count = first.get('meta', {}).get('pagination', {}).get('pageCount', 1) or 1
+    if page_count > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rollup') as pool:
+            pages.extend(pool.map(lambda p: fetch_page(p, page_size), range(2, page_count + 1)))
+    return [item for page in pages for item in (page.get('data') or [])]
+
+
+def _owner_id(prop):
+    owner = prop.get('owner')
+    if isinstance(owner, dict):
+        return owner.get('id')
+    return owner
+
+
+def rollup(properties, gfa_by_owner=None):
+    """
+    Per-owner totals from a list of properties, keyed by the owner's numeric id.
+    gfa_by_owner (owner id -> total_gfa) adds total_gfa where it is known.
+    """
+    sums = {}
+    for prop in properties:
+        owner = _owner_id(prop)
+        if owner is None:
+            continue
+        total, count = sums.get(owner, (0.0, 0))
+        sums[owner] = (total + float(prop.get('deal_size') or 0), count + 1)
+
+    totals = {}
+    for owner, (total, count) in sums.items():
+        totals[owner] = {
+            'total_aum': int(round(total)),
+            'deal_count': count,
+            'avg_deal_size': int(round(total / count)),
+        }
+    for owner, gfa in (gfa_by_owner or {}).items():
+        totals.setdefault(owner, {'total_aum': 0, 'deal_count': 0, 'avg_deal_size': 0})['total_gfa'] = int(gfa)
+    return totals
+
+
+def changed_totals(consultants, totals):
+    """
+    (documentId, changed fields) for every consultant whose stored totals differ
+    from the computed ones. Consultants that own no property get zero totals, so
+    pass only the consultants whose properties were all read.
+    """
+    empty = {'total_aum': 0, 'deal_count': 0, 'avg_deal_size': 0}
+    for consultant in consultants:
+        wanted = totals.get(consultant.get('id'), empty)
+        changes = {field: value for field, value in wanted.items() if consultant.get(field) != value}
+        if changes:
+            yield consultant['documentId'], changes
@@ -0,0 +1,99 @@
+"""
+Purge of what the importer wrote, for re-seeding an environment.
+
+Stages run in dependency order (timeline items, properties, consultants, then
+media nothing references any more) and each deletes its entries concurrently
+with a bounded number of requests in flight. Every stage reports how many
+entries it removed and how fast.
+
+Scoping: the importer suffixes every property_uid and post_id with the
+documentId of the consultant that owns it (`<template uid>_<documentId>`), so
+entries carrying their own owner's/author's suffix are known to be imported;
+anything created by hand is left alone.
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+log = logging.getLogger(__name__)
+
+
+def _related_doc_id(item, relation):
+    related = item.get(relation)
+    return related.get('documentId') if isinstance(related, dict) else None
+
+
+def imported_by_suffix(items, uid_field, relation):
+    """Items whose uid_field ends with `_<documentId of item[relation]>`."""
+    for item in items:
+        doc_id = _related_doc_id(item, relation)
+        if doc_id and str(item.get(uid_field) or '').endswith(f"_{doc_id}"):
+            yield item
+
+
+def referenced_media_ids(consultants, properties):
+    """Upload ids still used by a consultant's profileImage or a property's media_urls."""
+    ids = set()
+    for consultant in consultants:
+        image = consultant.get('profileImage')
+        if isinstance(image, dict) and image.get('id') is not None:
+            ids.add(image['id'])
+    for prop in properties:
+        for media in prop.get('media_urls') or []:
+            if isinstance(media, dict):
+                media = media.get('id')
+            if isinstance(media, int):
+                ids.add(media)
+    return ids
+
+
+class Purger:
+
+    def __init__(self, strapi, workers=8, metrics=None):
+        self.strapi = strapi
+        self.workers = max(1, workers)
+        self.metrics = metrics
+        self.deleted = 0
+        self.failed = 0
+        self.seconds = 0.0
+
+    def _delete(self, path):
+        try:
+            res = self.strapi.delete(path)
+        except requests.RequestException as e:
+            # Still failing after the client's retries: report it and carry on with the rest
+            log.error(f"❌ DELETE {path}: {e}")
+            return False
+        # Already gone counts as deleted: a rerun after an interrupted purge finishes the job
+        if res.status_code == 404:
+            return True
+        if not res.ok:
+            log.error(f"❌ DELETE {path}: {res.status_code} {res.text[:200]}")
+            return False
+        return True
+
+    def delete_all(self, label, paths):
+        """
+        Deletes every path with at most `workers` requests in flight. Returns the
+        paths that were deleted (or already gone).
+        """
+        paths = list(paths)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='purge') as pool:
+            results = list(pool.map(self._delete, paths))
+        elapsed = time.perf_counter() - started
+        done = [path for path, ok in zip(paths, results) if ok]
+        failed = len(paths) - len(done)
+        self.deleted += len(done)
+        self.failed += failed
+        self.seconds += elapsed
+        if self.metrics:
+            self.metrics.observe_phase(f"purge_{label.replace(' ', '_')}", elapsed)
+            self.metrics.incr('purge_deleted', len(done))
+            self.metrics.incr('purge_failed', failed)
+        rate = f", {len(done) / elapsed:.0f}/s" if elapsed and done else ''
+        log.info(f"🗑️ Deleted {len(done)} {label} in {elapsed:.1f}s{rate}"
+                 + (f" ({failed} failed)" if failed else ''))
+        return done
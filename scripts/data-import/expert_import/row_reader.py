@@ -0,0 +1,148 @@
+"""
+Streaming row source for the importer.
+
+Reads the "Import Ready" sheet with openpyxl in read-only mode and yields one
+plain dict per row (column header -> str or None), so the whole workbook never
+has to sit in memory and pandas is not needed at all. The first read of a
+workbook also writes an NDJSON copy of its rows under the cache directory,
+keyed by the workbook's content hash; later passes (validation, the remote
+image scan and the import itself all iterate the same reader) and later runs
+stream that file and skip XLSX parsing entirely. CSV and NDJSON inputs are read directly.
+"""
+import csv
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+
+def _cell_to_str(value):
+    """Matches read_excel(dtype=str): integral floats lose their '.0', blanks become None."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    text = str(value)
+    return text if text != '' else None
+
+
+def _file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RowReader:
+    """
+    Iterable of row dicts from an .xlsx, .csv or .ndjson/.jsonl file.
+    `source` tells where the rows come from: 'xlsx', 'cache', 'csv' or 'ndjson'.
+    A workbook reader turns from 'xlsx' to 'cache' once a full pass has cached it.
+    """
+
+    def __init__(self, path, sheet_name='Import Ready', cache_dir=None):
+        self.path = Path(path)
+        self.sheet_name = sheet_name
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        suffix = self.path.suffix.lower()
+        if suffix == '.csv':
+            self.source = 'csv'
+        elif suffix in NDJSON_SUFFIXES:
+            self.source = 'ndjson'
+        else:
+            cached = self._cache_path()
+            self.source = 'cache' if cached and cached.exists() else 'xlsx'
+
+    def __iter__(self):
+        if self.source == 'xlsx':
+            # An earlier full pass (or another reader) may have written the cache since
+            cached = self._cache_path()
+            if cached and cached.exists():
+                self.source = 'cache'
+        if self.source == 'csv':
+            return self._iter_csv()
+        if self.source == 'ndjson':
+            return self._iter_ndjson(self.path)
+        if self.source == 'cache':
+            return self._iter_ndjson(self._cache_path())
+        return self._iter_xlsx()
+
+    def _cache_path(self):
+        """
+        Cache file named after the workbook's SHA-256. The hash is only recomputed
+        when the workbook's mtime or size differ from the last time it was seen.
+        """
+        if not self.cache_dir:
+            return None
+        stat = self.path.stat()
+        meta_path = self.cache_dir / f"{self.path.name}.meta.json"
+        meta = {}
+        if meta_path.exists():
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                meta = {}
+        if meta.get('mtime_ns') != stat.st_mtime_ns or meta.get('size') != stat.st_size:
+            meta = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': _file_sha256(self.path)}
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        sheet_slug = ''.join(c if c.isalnum() else '-' for c in self.sheet_name)
+        return self.cache_dir / f"{self.path.stem}-{sheet_slug}-{meta['sha256'][:16]}.ndjson"
+
+    def _iter_csv(self):
+        with open(self.path, 'r', encoding='utf-8-sig', newline='') as f:
+            for record in csv.DictReader(f):
+                yield {k: (v if v != '' else None) for k, v in record.items()}
+
+    @staticmethod
+    def _iter_ndjson(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _iter_xlsx(self):
+        from openpyxl import load_workbook  # only needed on a cache miss
+
+        cache_path = self._cache_path()
+        tmp_path = cache_path.with_suffix('.ndjson.tmp') if cache_path else None
+        out = open(tmp_path, 'w', encoding='utf-8') if tmp_path else None
+        workbook = load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[self.sheet_name]
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            columns = [str(h) if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+            blank_run = []
+            for values in rows:
+                record = {col: _cell_to_str(v) for col, v in zip(columns, values)}
+                # Blank rows keep their place (row numbers must match the sheet),
+                # but trailing ones are dropped like read_excel does
+                if not any(v is not None for v in record.values()):
+                    blank_run.append(record)
+                    continue
+                for pending in blank_run + [record]:
+                    if out:
+                        out.write(json.dumps(pending, ensure_ascii=False) + '\n')
+                    yield pending
+                blank_run = []
+        except BaseException:
+            # Partial read (error or abandoned generator): never publish a truncated cache
+            if out:
+                out.close()
+                os.remove(tmp_path)
+                out = None
+            raise
+        finally:
+            workbook.close()
+            if out:
+                out.close()
+                os.replace(tmp_path, cache_path)
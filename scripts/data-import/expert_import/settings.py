@@ -0,0 +1,53 @@
+"""
+Paths and connection settings shared by the CLI and the importer.
+
+Nothing here reads the environment or touches the disk at import time: the
+Strapi URL and token come from STRAPI_URL / STRAPI_TOKEN (optionally loaded
+from a .env file by load_env(), which only the CLI calls) or from the command
+line, so importing the package never picks up credentials by accident.
+"""
+import os
+from pathlib import Path
+
+# scripts/data-import, which holds images/, mockData/ and the local .cache
+DATA_DIR = Path(__file__).resolve().parent.parent
+REPO_DIR = DATA_DIR.parent.parent
+
+# Input sheet: streamed row by row; override with --input / --sheet
+DEFAULT_INPUT = REPO_DIR / 'expert_profile.xlsx'
+DEFAULT_SHEET = 'Import Ready'
+
+# Folder where profile images live, and the avatar used for names without one
+IMAGES_DIR = DATA_DIR / 'images'
+DEFAULT_AVATAR = IMAGES_DIR / 'default-avatar-icon-of-social-media-user-vector.jpg'
+
+# Media cache, journal, derivatives, downloads, reports and metrics; override with --cache-dir
+CACHE_DIR = DATA_DIR / '.cache'
+
+MOCK_DATA_DIR = DATA_DIR / 'mockData'
+SCHEMA_DIR = REPO_DIR / 'src' / 'api'
+
+DEFAULT_STRAPI_URL = 'http://localhost:1337'
+
+
+def schema_path(content_type):
+    """schema.json of a Strapi content type, e.g. schema_path('consultant')."""
+    return SCHEMA_DIR / content_type / 'content-types' / content_type / 'schema.json'
+
+
+def load_env():
+    """Loads a .env file into os.environ if python-dotenv is installed; variables already set win."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - optional dependency
+        return
+    load_dotenv()
+
+
+def strapi_url():
+    return os.environ.get('STRAPI_URL') or DEFAULT_STRAPI_URL
+
+
+def strapi_token():
+    token = os.environ.get('STRAPI_TOKEN')
+    return token.strip() if token else None
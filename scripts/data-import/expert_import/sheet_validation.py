@@ -0,0 +1,212 @@
+"""
+Pre-flight validation of the whole input sheet.
+
+Runs before the importer sends a single request, so a bad row is found up
+front instead of after the rows before it were written. Checks run column by
+column over every row at once:
+
+  - required:  First Name and Last Name are present
+  - enum:      geographical_expertise is one of the consultant schema's values
+  - rate:      Rate parses as an amount, with or without a currency ($ 250, 250 GBP, 1.200,50 €)
+  - length:    values of string attributes fit the column (255 unless the schema says otherwise)
+  - json:      tag cells that look like JSON ('[' or '{') actually parse
+
+The result is a report (JSON-serialisable) listing every issue with its sheet
+row number, plus the set of flagged rows the importer can refuse or skip.
+"""
+import json
+import logging
+import re
+from pathlib import Path
+
+from .mock_registry import load_enums
+from .settings import schema_path
+
+log = logging.getLogger(__name__)
+
+# Strapi stores string attributes in varchar(255) unless maxLength says otherwise
+DEFAULT_STRING_LIMIT = 255
+STRING_TYPES = ('string', 'email', 'uid', 'password')
+
+# Sheet column -> consultant attribute it is imported into
+COLUMN_FIELDS = {
+    'First Name': 'firstName',
+    'Last Name': 'lastName',
+    'locations': 'location',
+    'company_name': 'company',
+    'job_type': 'currentRole',
+    'tag': 'functionalExpertise',
+    'geographical_expertise': 'geographicalExpertise',
+    'country_expertise': 'countryExpertise',
+    'Rate': 'rate',
+    'post_content': 'bio',
+    'educational_requirement': 'education',
+}
+
+CURRENCY_SYMBOLS = {'$': 'USD', '£': 'GBP', '€': 'EUR', '¥': 'JPY', '₹': 'INR'}
+_CURRENCY_CODE = re.compile(r'\b([A-Z]{3})\b')
+_RATE_SUFFIX = re.compile(r'(/\s*(hr|hour|h|day|d)|per\s+(hour|day)|p/?h)\.?$', re.IGNORECASE)
+
+
+def parse_rate(text):
+    """
+    (amount, currency or None) from a rate cell such as '$250', '£1,250/hr',
+    '250 GBP', 'EUR 1.200,50' or '1 200 €'. Raises ValueError when there is no
+    single amount in it.
+    """
+    cell = str(text).strip()
+    currency = None
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in cell:
+            currency = code
+            cell = cell.replace(symbol, ' ')
+    match = _CURRENCY_CODE.search(cell)
+    if match:
+        currency = currency or match.group(1)
+        cell = _CURRENCY_CODE.sub(' ', cell)
+    cell = _RATE_SUFFIX.sub('', cell.strip())
+    number = re.sub(r"[\s']", '', cell)
+    if not re.fullmatch(r'\d[\d.,]*', number):
+        raise ValueError(f"cannot parse rate {str(text)!r}")
+    if ',' in number and '.' in number:
+        # Whichever separator comes last is the decimal one
+        decimal = ',' if number.rfind(',') > number.rfind('.') else '.'
+        thousands = '.' if decimal == ',' else ','
+        number = number.replace(thousands, '').replace(decimal, '.')
+    elif ',' in number:
+        # '250,50' is a decimal comma, '1,250' a thousands separator
+        head, _, tail = number.rpartition(',')
+        number = f"{head.replace(',', '')}.{tail}" if len(tail) == 2 and number.count(',') == 1 \
+            else number.replace(',', '')
+    elif number.count('.') > 1:
+        number = number.replace('.', '')
+    return float(number), currency
+
+
+def load_string_limits(schema_path):
+    """String attribute -> maximum length from a content-type schema.json ({} if absent)."""
+    schema_path = Path(schema_path)
+    if not schema_path.exists():
+        return {}
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        attributes = json.load(f).get('attributes', {})
+    return {name: attr.get('maxLength', DEFAULT_STRING_LIMIT)
+            for name, attr in attributes.items() if attr.get('type') in STRING_TYPES}
+
+
+class SheetValidator:
+
+    def __init__(self, enums=None, string_limits=None):
+        self.enums = enums or {}
+        self.string_limits = string_limits or {}
+
+    def validate(self, rows, first_row=2):
+        """
+        Validates an iterable of row dicts (sheet row numbers start at first_row)
+        and returns the report dict.
+        """
+        columns = {column: [] for column in COLUMN_FIELDS}
+        count = 0
+        for row in rows:
+            for column, values in columns.items():
+                value = row.get(column)
+                values.append(value.strip() if isinstance(value, str) else value)
+            count += 1
+        numbers = range(first_row, first_row + count)
+
+        issues = []
+        for check in (self._check_required, self._check_enum, self._check_rate,
+                      self._check_lengths, self._check_json):
+            issues.extend(check(columns, numbers))
+        issues.sort(key=lambda issue: (issue['row'], issue['column']))
+
+        by_check = {}
+        for issue in issues:
+            by_check[issue['check']] = by_check.get(issue['check'], 0) + 1
+        flagged = sorted({issue['row'] for issue in issues})
+        return {
+            'rows': count,
+            'valid_rows': count - len(flagged),
+            'flagged_rows': flagged,
+            'issues_by_check': by_check,
+            'issues': issues,
+        }
+
+    @staticmethod
+    def _issue(row, column, check, value, message):
+        return {'row': row, 'column': column, 'check': check,
+                'value': value if not isinstance(value, str) or len(value) <= 80 else value[:77] + '...',
+                'message': message}
+
+    def _check_required(self, columns, numbers):
+        for column in ('First Name', 'Last Name'):
+            for number, value in zip(numbers, columns[column]):
+                if not value:
+                    yield self._issue(number, column, 'required', value, f"{column} is required")
+
+    def _check_enum(self, columns, numbers):
+        for column, field in COLUMN_FIELDS.items():
+            allowed = self.enums.get(field)
+            if not allowed:
+                continue
+            allowed_set = set(allowed)
+            for number, value in zip(numbers, columns[column]):
+                if value and value not in allowed_set:
+                    yield self._issue(number, column, 'enum', value, f"{field} must be one of {allowed}")
+
+    def _check_rate(self, columns, numbers):
+        for number, value in zip(numbers, columns['Rate']):
+            if not value:
+                continue
+            try:
+                parse_rate(value)
+            except ValueError as e:
+                yield self._issue(number, 'Rate', 'rate', value, str(e))
+
+    def _check_lengths(self, columns, numbers):
+        for column, field in COLUMN_FIELDS.items():
+            limit = self.string_limits.get(field)
+            if not limit:
+                continue
+            for number, value in zip(numbers, columns[column]):
+                if isinstance(value, str) and len(value) > limit:
+                    yield self._issue(number, column, 'length', value,
+                                      f"{field} is {len(value)} characters; the limit is {limit}")
+
+    def _check_json(self, columns, numbers):
+        for number, value in zip(numbers, columns['tag']):
+            if value and value[0] in '[{':
+                try:
+                    json.loads(value)
+                except json.JSONDecodeError as e:
+                    yield self._issue(number, 'tag', 'json', value, f"invalid JSON ({e.msg})")
+
+
+def validate_sheet(args, rows, metrics):
+    """
+    Pre-flight check of every row before anything is sent; writes the JSON
+    report and returns the set of flagged sheet row numbers.
+    """
+    consultant_schema = schema_path('consultant')
+    validator = SheetValidator(enums=load_enums(consultant_schema),
+                               string_limits=load_string_limits(consultant_schema))
+    with metrics.phase('validation'):
+        report = validator.validate(rows)
+    report = dict(input=str(args.input), on_invalid=args.on_invalid, **report)
+    report_path = args.validation_report or args.cache_dir / 'validation' / 'last-report.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    flagged = report['flagged_rows']
+    metrics.set_gauge('rows_invalid', len(flagged))
+    if not flagged:
+        log.info(f"✅ Validated {report['rows']} rows: no issues (report: {report_path})")
+        return set()
+    checks = ', '.join(f"{check}: {n}" for check, n in sorted(report['issues_by_check'].items()))
+    log.warning(f"⚠️ Validated {report['rows']} rows: {len(flagged)} flagged ({checks}); report: {report_path}")
+    for issue in report['issues'][:10]:
+        log.warning(f"   Row {issue['row']} {issue['column']}: {issue['message']}")
+    if len(report['issues']) > 10:
+        log.warning(f"   ... and {len(report['issues']) - 10} more")
+    return set(flagged)
@@ -0,0 +1,234 @@
+"""
+Snapshot export of Strapi collections to Parquet.
+
+Pages through a collection with several page requests in flight, turns every
+entry into one flat row and writes the rows to a Parquet file in row groups as
+the pages arrive, so only a few pages are in memory at any time. The column
+layout comes from the content type's schema.json, so every file of a
+collection has the same schema whatever the data:
+
+  - scalar attributes map to string / int64 / float64 / bool / timestamp columns
+  - relations to other api:: types become <name>_id and <name>_documentId
+  - single media fields become <name>_id and <name>_url
+  - JSON attributes with a known shape are flattened (JSON_SHAPES): objects into
+    one column per key, string lists into list<string>, lists of records into
+    list<struct>; any other JSON attribute is kept as JSON text
+
+Incremental exports only ask for entries whose updatedAt is after a given
+time. The state file next to the exports remembers the newest updatedAt of
+every collection, so `since='last'` picks up where the previous export ended.
+
+pyarrow is optional for the importer as a whole and only needed here.
+"""
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+log = logging.getLogger(__name__)
+
+# JSON attribute -> ('object', keys) | ('strings',) | ('records', keys)
+JSON_SHAPES = {
+    'contactInfo': ('object', ('Email', 'Phone', 'LinkedIn')),
+    'certifications': ('strings',),
+    'languages': ('strings',),
+    'functionalExpertise': ('strings',),
+    'roles': ('strings',),
+    'tags': ('strings',),
+    'testimonials': ('records', ('name', 'company', 'text')),
+    'caseStudies': ('records', ('title', 'description')),
+}
+
+STRING_TYPES = {'string', 'text', 'richtext', 'email', 'uid', 'enumeration', 'password', 'date', 'time'}
+SYSTEM_TIMESTAMPS = ('createdAt', 'updatedAt', 'publishedAt')
+
+
+def _timestamp(value):
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+
+
+def _int(value):
+    return None if value is None or value == '' else int(value)
+
+
+def _float(value):
+    return None if value is None or value == '' else float(value)
+
+
+def _text(value):
+    if value is None:
+        return None
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def _related(value, key):
+    return value.get(key) if isinstance(value, dict) else (value if key == 'id' else None)
+
+
+class CollectionLayout:
+    """Parquet schema of one content type and the conversion of its entries into rows."""
+
+    def __init__(self, attributes):
+        fields = [pa.field('id', pa.int64()), pa.field('documentId', pa.string())]
+        # (column, converter(entry) -> value)
+        columns = [('id', lambda e: _int(e.get('id'))), ('documentId', lambda e: e.get('documentId'))]
+        self.populate = {}
+
+        def add(name, arrow_type, convert):
+            fields.append(pa.field(name, arrow_type))
+            columns.append((name, convert))
+
+        for name, attr in attributes.items():
+            kind = attr.get('type')
+            get = (lambda n: lambda e: e.get(n))(name)
+            if kind == 'relation':
+                if not str(attr.get('target', '')).startswith('api::') or attr.get('relation', '').endswith('ToMany'):
+                    continue
+                self.populate[name] = ['documentId']
+                add(f"{name}_id", pa.int64(), lambda e, g=get: _int(_related(g(e), 'id')))
+                add(f"{name}_documentId", pa.string(), lambda e, g=get: _related(g(e), 'documentId'))
+            elif kind == 'media':
+                if attr.get('multiple'):
+                    continue
+                self.populate[name] = ['url']
+                add(f"{name}_id", pa.int64(), lambda e, g=get: _int(_related(g(e), 'id')))
+                add(f"{name}_url", pa.string(), lambda e, g=get: _related(g(e), 'url'))
+            elif kind == 'json':
+                self._add_json(name, get, add)
+            elif kind in ('integer', 'biginteger'):
+                add(name, pa.int64(), lambda e, g=get: _int(g(e)))
+            elif kind in ('decimal', 'float'):
+                add(name, pa.float64(), lambda e, g=get: _float(g(e)))
+            elif kind == 'boolean':
+                add(name, pa.bool_(), lambda e, g=get: None if g(e) is None else bool(g(e)))
+            elif kind == 'datetime':
+                add(name, pa.timestamp('ms', tz='UTC'), lambda e, g=get: _timestamp(g(e)))
+            elif kind in STRING_TYPES:
+                add(name, pa.string(), lambda e, g=get: _text(g(e)))
+            else:
+                # blocks, components and anything newer: keep the JSON
+                add(name, pa.string(), lambda e, g=get: _text(g(e)))
+
+        for name in SYSTEM_TIMESTAMPS:
+            add(name, pa.timestamp('ms', tz='UTC'), (lambda n: lambda e: _timestamp(e.get(n)))(name))
+        self.schema = pa.schema(fields)
+        self.columns = columns
+
+    @staticmethod
+    def _add_json(name, get, add):
+        shape = JSON_SHAPES.get(name)
+        if shape is None:
+            add(name, pa.string(), lambda e: _text(get(e)))
+        elif shape[0] == 'object':
+            for key in shape[1]:
+                add(f"{name}_{key}", pa.string(),
+                    lambda e, k=key: _text((get(e) or {}).get(k)) if isinstance(get(e), dict) else None)
+        elif shape[0] == 'strings':
+            add(name, pa.list_(pa.string()),
+                lambda e: [_text(v) for v in get(e)] if isinstance(get(e), list) else None)
+        else:
+            keys = shape[1]
+            add(name, pa.list_(pa.struct([pa.field(k, pa.string()) for k in keys])),
+                lambda e: [{k: _text(r.get(k)) for k in keys} for r in get(e) if isinstance(r, dict)]
+                if isinstance(get(e), list) else None)
+
+    def row(self, entry):
+        return {column: convert(entry) for column, convert in self.columns}
+
+
+class SnapshotExporter:
+
+    def __init__(self, out_dir, workers=8, page_size=100, row_group_size=10000):
+        if pa is None:
+            raise RuntimeError("pyarrow is not installed; run `pip install pyarrow` to export to Parquet")
+        self.out_dir = Path(out_dir)
+        self.workers = max(1, workers)
+        self.page_size = page_size
+        self.row_group_size = row_group_size
+        self.state_path = self.out_dir / 'export-state.json'
+        self.state = {}
+        if self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    def since(self, collection, since):
+        """updatedAt lower bound to use: None (full), an ISO time, or 'last' for the previous export's newest."""
+        if since == 'last':
+            return (self.state.get(collection) or {}).get('max_updatedAt')
+        return since
+
+    def _pages(self, fetch_page):
+        """Yields pages in order, keeping at most `workers` requests in flight."""
+        first = fetch_page(1, self.page_size)
+        yield first
+        page_count = first.get('meta', {}).get('pagination', {}).get('pageCount', 1) or 1
+        if page_count < 2:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='export') as pool:
+            pending = deque()
+            next_page = 2
+            while next_page <= page_count or pending:
+                while next_page <= page_count and len(pending) < self.workers:
+                    pending.append(pool.submit(fetch_page, next_page, self.page_size))
+                    next_page += 1
+                yield pending.popleft().result()
+
+    def export(self, collection, layout, fetch_page, since=None):
+        """
+        Writes every entry fetch_page returns to <out_dir>/<collection>/ and returns
+        the stats. fetch_page(page, page_size) must already apply the since filter.
+        """
+        started = time.perf_counter()
+        kind = 'delta' if since else 'snapshot'
+        stamp = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+        path = self.out_dir / collection / f"{kind}-{stamp}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.parquet.tmp')
+
+        rows, buffered, max_updated = 0, [], None
+        with pq.ParquetWriter(tmp_path, layout.schema, compression='zstd') as writer:
+            for page in self._pages(fetch_page):
+                for entry in page.get('data') or []:
+                    buffered.append(layout.row(entry))
+                    updated = entry.get('updatedAt')
+                    if updated and (max_updated is None or _timestamp(updated) > _timestamp(max_updated)):
+                        max_updated = updated
+                if len(buffered) >= self.row_group_size:
+                    writer.write_table(pa.Table.from_pylist(buffered, schema=layout.schema))
+                    rows += len(buffered)
+                    buffered = []
+            if buffered:
+                writer.write_table(pa.Table.from_pylist(buffered, schema=layout.schema))
+                rows += len(buffered)
+        os.replace(tmp_path, path)
+
+        previous = self.state.get(collection) or {}
+        self.state[collection] = {
+            'file': str(path.relative_to(self.out_dir)),
+            'rows': rows,
+            'since': since,
+            # An empty delta keeps the previous high-water mark
+            'max_updatedAt': max_updated or previous.get('max_updatedAt'),
+            'exportedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }
+        self._save()
+        elapsed = time.perf_counter() - started
+        return {'collection': collection, 'path': path, 'rows': rows, 'seconds': elapsed}
+
+    def _save(self):
+        tmp_path = self.state_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,240 @@
+"""
+Shared HTTP client for every Strapi call the importer makes.
+
+One pooled requests.Session (keep-alive, one TLS handshake per connection rather
+than per request), per-endpoint timeouts, and retries with jittered exponential
+backoff on connection errors, 429 and 5xx responses. POSTs create entries and
+uploads, so replaying one the server may have processed could write it twice:
+they are only retried on 429/503 (refused before any work) and on connection
+errors raised before the request went out. Retry-After is honoured when the
+server sends it. Every attempt's latency and status can be reported
+to an ImportMetrics collector. With `adaptive` set, each concurrency class
+(limit_class) gets an AIMD limit on requests in flight that follows the
+server's latency and 429/5xx responses.
+"""
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from .adaptive_concurrency import AdaptiveLimit
+
+log = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Methods that may be replayed after any failure; the rest only get POST_RETRY_STATUSES
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+POST_RETRY_STATUSES = {429, 503}
+
+# Custom route segment that must not be collapsed into ':id'
+BULK_ACTION = 'bulk-import'
+
+# Seconds; uploads carry file bodies and get processed by sharp server-side,
+# bulk imports write a whole chunk of consultant bundles
+DEFAULT_TIMEOUTS = {
+    'upload': 120,
+    'bulk': 300,
+    'read': 30,
+    'write': 30,
+}
+
+
+def endpoint_class(method, path):
+    """Groups requests for timeouts and stats: 'upload', 'bulk', 'read' or 'write'."""
+    if path.startswith('/api/upload') and method != 'GET':
+        return 'upload'
+    if path.split('?')[0].rstrip('/').endswith(BULK_ACTION):
+        return 'bulk'
+    return 'read' if method == 'GET' else 'write'
+
+
+def limit_class(method, path):
+    """
+    Groups requests for adaptive concurrency: 'upload', 'bulk', 'read',
+    'consultant_write', 'child_write' (properties, timeline items) or 'write'.
+    """
+    group = endpoint_class(method, path)
+    if group != 'write':
+        return group
+    parts = path.split('?')[0].split('/')
+    collection = parts[2] if len(parts) > 2 and parts[1] == 'api' else None
+    if collection == 'consultants':
+        return 'consultant_write'
+    if collection in ('properties', 'timeline-items'):
+        return 'child_write'
+    return 'write'
+
+
+def endpoint_name(method, path):
+    """Stable per-endpoint label, e.g. 'PUT /api/consultants/:id'."""
+    parts = path.split('?')[0].rstrip('/').split('/')
+    # /api/<collection>/<documentId> -> /api/<collection>/:id
+    if len(parts) > 3 and parts[1] == 'api' and parts[2] != 'upload' and parts[3] != BULK_ACTION:
+        parts = parts[:3] + [':id'] + parts[4:]
+    return f"{method} {'/'.join(parts)}"
+
+
+def never_sent(error):
+    """True when a transport error happened while connecting, before any of the request reached the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError):
+        return False
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def retry_after_seconds(res):
+    """Parses a Retry-After header (seconds or HTTP date); None if absent or invalid."""
+    value = res.headers.get('Retry-After') if res is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class StrapiClient:
+    """
+    Thin wrapper over a pooled Session. Methods return the final Response
+    (callers still call raise_for_status()); only transport errors that survive
+    every retry are raised.
+    """
+
+    def __init__(self, base_url, token, pool_size=10, max_retries=5,
+                 backoff_base=0.5, backoff_max=30.0, timeouts=None, metrics=None, adaptive=None):
+        """adaptive: AdaptiveLimit keyword arguments (initial, maximum, target, ...) to enable per-class limits."""
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.metrics = metrics
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f"Bearer {token}"
+        self.set_pool_size(pool_size)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.by_endpoint = {}
+        self.adaptive = adaptive
+        self.limits = {}
+        self._lock = threading.Lock()
+
+    def set_pool_size(self, size):
+        """Keep at least one connection per concurrent worker so none has to reconnect."""
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _count(self, name, retried=False, failed=False):
+        with self._lock:
+            stats = self.by_endpoint.setdefault(name, {'requests': 0, 'retries': 0, 'failures': 0})
+            stats['requests'] += 1
+            self.requests += 1
+            if retried:
+                stats['retries'] += 1
+                self.retries += 1
+            if failed:
+                stats['failures'] += 1
+                self.failures += 1
+
+    def _limit_for(self, method, path):
+        if self.adaptive is None:
+            return None
+        group = limit_class(method, path)
+        with self._lock:
+            limit = self.limits.get(group)
+            if limit is None:
+                limit = self.limits[group] = AdaptiveLimit(group, **self.adaptive)
+            return limit
+
+    def concurrency_limits(self):
+        """Current limit per concurrency class seen so far ({} unless adaptive)."""
+        with self._lock:
+            return {group: limit.current() for group, limit in sorted(self.limits.items())}
+
+    def _backoff(self, attempt, res=None):
+        delay = retry_after_seconds(res)
+        if delay is None:
+            # Full jitter: uniform over [0, base * 2^attempt], capped
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        return min(delay, self.backoff_max)
+
+    def request(self, method, path, timeout=None, max_retries=None, **kwargs):
+        """max_retries overrides the client default, e.g. 0 for requests that must not be replayed."""
+        name = endpoint_name(method, path)
+        idempotent = method in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else POST_RETRY_STATUSES
+        timeout = timeout or self.timeouts[endpoint_class(method, path)]
+        max_retries = self.max_retries if max_retries is None else max_retries
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        body = kwargs.get('data')
+        limit = self._limit_for(method, path)
+        while True:
+            res = None
+            if attempt and hasattr(body, 'seek'):
+                # A streamed body was (partly) consumed by the failed attempt
+                body.seek(0)
+            saturated = limit.acquire() if limit else False
+            overloaded = False
+            started = time.perf_counter()
+            try:
+                res = self.session.request(method, url, timeout=timeout, **kwargs)
+                overloaded = res.status_code in RETRY_STATUSES
+            except (requests.ConnectionError, requests.Timeout) as e:
+                overloaded = True
+                if self.metrics:
+                    self.metrics.observe_request(name, time.perf_counter() - started, type(e).__name__)
+                if attempt >= max_retries or not (idempotent or never_sent(e)):
+                    self._count(name, retried=attempt > 0, failed=True)
+                    raise
+                reason = type(e).__name__
+            else:
+                if self.metrics:
+                    self.metrics.observe_request(name, time.perf_counter() - started, res.status_code)
+                if res.status_code not in retry_statuses or attempt >= max_retries:
+                    self._count(name, retried=attempt > 0, failed=not res.ok)
+                    return res
+                reason = res.status_code
+            finally:
+                if limit:
+                    limit.release(saturated, time.perf_counter() - started, overloaded)
+            self._count(name, retried=attempt > 0, failed=True)
+            delay = self._backoff(attempt, res)
+            attempt += 1
+            log.warning("↻ %s -> %s; retry %d/%d in %.1fs", name, reason, attempt, max_retries, delay)
+            time.sleep(delay)
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request('PUT', path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request('DELETE', path, **kwargs)
+
+    def summary(self):
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'by_endpoint': self.by_endpoint,
+            'concurrency': {group: limit.summary() for group, limit in sorted(self.limits.items())},
+        }
@@ -0,0 +1,128 @@
+"""
+Streaming multipart/form-data bodies for /api/upload.
+
+requests builds a `files=` upload in memory, so a 300 MB video in a
+profileImage costs 300 MB of RSS for every upload in flight. MultipartStream
+is a file-like body of known length instead: requests sends it with a
+Content-Length header and reads it a block at a time, and file parts are read
+from disk as they go out, so memory stays at a few blocks per upload whatever
+the file size. Every file part is hashed while it is sent, giving the digest
+of exactly the bytes Strapi received.
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+CHUNK_SIZE = 256 * 1024
+
+
+def sha256_file(path, chunk_size=CHUNK_SIZE):
+    """SHA-256 of a file on disk, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _quote(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\r', ' ').replace('\n', ' ')
+
+
+class MultipartStream:
+    """
+    Form fields plus (filename, content, mime) file parts, where content is
+    bytes or the Path of a file to stream. Read it like a file; seek(0) starts
+    it over, which is what a retried request needs.
+    """
+
+    def __init__(self, fields=None, files=(), field_name='files'):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        # (file part index or None, bytes or Path, length)
+        self._segments = []
+        for name, value in (fields or {}).items():
+            self._add_bytes(f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{_quote(name)}\"\r\n\r\n"
+                            f"{value}\r\n".encode('utf-8'))
+        self.sizes = []
+        for index, (filename, content, mime) in enumerate(files):
+            self._add_bytes(f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{_quote(field_name)}\"; "
+                            f"filename=\"{_quote(filename)}\"\r\nContent-Type: {mime}\r\n\r\n".encode('utf-8'))
+            if isinstance(content, (bytes, bytearray)):
+                size = len(content)
+                self._segments.append((index, bytes(content), size))
+            else:
+                size = os.path.getsize(content)
+                self._segments.append((index, Path(content), size))
+            self.sizes.append(size)
+            self._add_bytes(b'\r\n')
+        self._add_bytes(f"--{self.boundary}--\r\n".encode('utf-8'))
+        self.length = sum(length for _, _, length in self._segments)
+        self._file = None
+        self.seek(0)
+
+    def _add_bytes(self, data):
+        self._segments.append((None, data, len(data)))
+
+    def __len__(self):
+        return self.length
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        if offset != 0 or whence != 0:
+            raise OSError("MultipartStream can only be rewound to the start")
+        self._close_file()
+        self._segment = 0
+        self._offset = 0
+        self._pos = 0
+        self._hashes = [hashlib.sha256() for _ in self.sizes]
+        return 0
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.length - self._pos
+        out = []
+        while size > 0 and self._segment < len(self._segments):
+            index, source, length = self._segments[self._segment]
+            if self._offset >= length:
+                self._close_file()
+                self._segment += 1
+                self._offset = 0
+                continue
+            n = min(size, length - self._offset)
+            if isinstance(source, bytes):
+                chunk = source[self._offset:self._offset + n]
+            else:
+                if self._file is None:
+                    self._file = open(source, 'rb')
+                chunk = self._file.read(n)
+                if len(chunk) < n:
+                    # Content-Length is already on the wire; a short body would hang the request
+                    raise OSError(f"{source} shrank while it was being uploaded")
+            if index is not None:
+                self._hashes[index].update(chunk)
+            self._offset += n
+            self._pos += n
+            size -= n
+            out.append(chunk)
+        return b''.join(out)
+
+    def __iter__(self):
+        for chunk in iter(lambda: self.read(CHUNK_SIZE), b''):
+            yield chunk
+
+    @property
+    def digests(self):
+        """SHA-256 of each file part as sent (complete once the whole body was read)."""
+        return [digest.hexdigest() for digest in self._hashes]
+
+    def close(self):
+        self._close_file()
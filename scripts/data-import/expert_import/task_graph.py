@@ -0,0 +1,67 @@
+"""
+Small dependency-graph executor for the writes of one spreadsheet row.
+
+A row is modelled as a DAG: media uploads depend on nothing, the consultant
+depends on its profile image, each property on the consultant and its own
+images, and each timeline item on the consultant and (when linked) its
+property. Nodes whose dependencies are done are submitted to a thread pool
+shared by every row, so a row takes as long as its critical path instead of
+the sum of its requests. The pool's size is the global cap on in-flight work.
+
+Nodes never wait on each other inside the pool (the calling thread does the
+scheduling), so sharing one pool between many rows cannot deadlock.
+"""
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+class TaskGraph:
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.nodes = {}  # name -> (func, deps)
+
+    def add(self, name, func, deps=()):
+        """
+        Adds a node. func receives one dict argument with the results of its
+        dependencies (by name). Dependencies must already be in the graph.
+        Returns the name so it can be used as a dependency.
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate task {name!r}")
+        missing = [d for d in deps if d not in self.nodes]
+        if missing:
+            raise ValueError(f"Task {name!r} depends on unknown task(s) {missing}")
+        self.nodes[name] = (func, tuple(deps))
+        return name
+
+    def run(self):
+        """
+        Runs every node and returns {name: result}. On the first failure no
+        further nodes are started; the ones already running are awaited and the
+        exception is re-raised.
+        """
+        results = {}
+        waiting = dict(self.nodes)
+        running = {}
+        error = None
+
+        def submit_ready():
+            for name, (func, deps) in list(waiting.items()):
+                if all(d in results for d in deps):
+                    del waiting[name]
+                    running[self.executor.submit(func, {d: results[d] for d in deps})] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    error = error or e
+            if error is None:
+                submit_ready()
+        if error is not None:
+            raise error
+        return results
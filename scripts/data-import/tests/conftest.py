@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The expert_import package and the bench's fake Strapi live in scripts/data-import
+DATA_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DATA_DIR))
+sys.path.insert(0, str(DATA_DIR / 'bench'))
+
+
+@pytest.fixture
+def fake_strapi():
+    from fake_strapi import FakeStrapi
+    fake = FakeStrapi(port=0).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def importer(monkeypatch, fake_strapi, tmp_path):
+    """The importer configured against a fresh fake Strapi, with fresh in-memory state."""
+    from expert_import import importer
+    from expert_import.child_index import ChildIndex
+    from expert_import.consultant_index import ConsultantIndex
+    monkeypatch.setattr(importer, 'consultant_index', ConsultantIndex())
+    monkeypatch.setattr(importer, 'child_index', ChildIndex())
+    monkeypatch.setattr(importer, 'portfolio_gfa', {})
+    importer.configure(strapi_url=fake_strapi.url, strapi_token='test', cache_dir=tmp_path / 'cache',
+                       seed='tests', no_image_preprocess=True)
+    return importer
+
+
+@pytest.fixture
+def run_import(monkeypatch, fake_strapi, tmp_path):
+    """
+    run_import(rows_path, *args) runs the import command against the fake Strapi,
+    with mock data whose images it serves, as a fresh process would: the
+    importer's in-memory state is reset before every run, its cache dir kept.
+    """
+    from run_bench import local_mock_data
+    from expert_import import cli, importer
+    from expert_import.child_index import ChildIndex
+    from expert_import.consultant_index import ConsultantIndex
+    mock_data = local_mock_data(tmp_path / 'mock', fake_strapi.url)
+
+    def run(rows_path, *args):
+        monkeypatch.setattr(importer, 'consultant_index', ConsultantIndex())
+        monkeypatch.setattr(importer, 'child_index', ChildIndex())
+        monkeypatch.setattr(importer, 'portfolio_gfa', {})
+        return cli.main(['import', '--input', str(rows_path), '--strapi-url', fake_strapi.url,
+                         '--strapi-token', 'test', '--cache-dir', str(tmp_path / 'cache'),
+                         '--mock-data-dir', str(mock_data), '--no-image-preprocess', *args])
+    return run
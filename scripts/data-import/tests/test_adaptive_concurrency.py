@@ -0,0 +1,55 @@
+import time
+
+from expert_import.adaptive_concurrency import AdaptiveLimit
+
+
+def respond(limit, latency, overloaded=False):
+    limit.acquire()
+    # As if every slot were in use, so a fast response counts towards an increase
+    limit.release(True, latency, overloaded)
+
+
+def test_slow_start_raises_the_limit_on_every_fast_response():
+    limit = AdaptiveLimit('reads', initial=2, target=0.1)
+    for _ in range(3):
+        respond(limit, 0.01)
+    assert limit.current() == 5
+    assert limit.summary()['increases'] == 3
+
+
+def test_after_a_decrease_the_limit_grows_by_about_one_per_window():
+    limit = AdaptiveLimit('writes', initial=8, target=0.1)
+    respond(limit, 0.01, overloaded=True)
+    assert limit.current() == 4
+    # 1/limit per response: two windows of 4-5 responses add two, where slow start would add ten
+    for _ in range(10):
+        respond(limit, 0.01)
+    assert limit.current() == 6
+
+
+def test_429_and_5xx_halve_the_limit_once_per_round_trip():
+    limit = AdaptiveLimit('writes', initial=16, target=0.1)
+    # One burst: a 429 and a 503 from the same round trip
+    respond(limit, 0.01, overloaded=True)
+    respond(limit, 0.01, overloaded=True)
+    assert limit.current() == 8
+    time.sleep(0.15)
+    respond(limit, 0.01, overloaded=True)
+    assert limit.current() == 4
+    assert limit.summary()['decreases'] == 2
+
+
+def test_latency_spike_halves_and_the_minimum_holds():
+    limit = AdaptiveLimit('uploads', initial=2, minimum=1, target=0.01)
+    respond(limit, 0.05)
+    assert limit.current() == 1
+    time.sleep(0.06)
+    respond(limit, 0.01, overloaded=True)
+    assert limit.current() == 1
+
+
+def test_slow_responses_hold_the_limit():
+    limit = AdaptiveLimit('reads', initial=4, target=0.1)
+    respond(limit, 0.15)
+    assert limit.current() == 4
+    assert limit.summary()['increases'] == limit.summary()['decreases'] == 0
@@ -0,0 +1,73 @@
+from expert_import.child_index import load_attributes, unchanged
+from expert_import.settings import schema_path
+
+
+def write_rows(path, names):
+    path.write_text('First Name,Last Name\n' + ''.join(f"{first},{last}\n" for first, last in names),
+                    encoding='utf-8')
+    return path
+
+
+def child_requests(fake):
+    """Requests per method against properties and timeline items so far."""
+    counts = {}
+    for name, samples in fake.latencies.items():
+        method, path = name.split(' ', 1)
+        if path.startswith(('/api/properties', '/api/timeline-items')):
+            counts[method] = counts.get(method, 0) + len(samples)
+    return counts
+
+
+def as_strapi_stores(fake):
+    """Drops what real Strapi would not have kept: keys that are not schema attributes."""
+    for collection, content_type in (('properties', 'property'), ('timeline-items', 'timeline-item')):
+        attributes = load_attributes(schema_path(content_type)) | {'id', 'documentId', 'createdAt',
+                                                                   'updatedAt', 'publishedAt'}
+        for entry in fake.collections[collection].values():
+            for key in set(entry) - attributes:
+                del entry[key]
+
+
+def test_unchanged_ignores_keys_outside_the_schema():
+    attributes = load_attributes(schema_path('timeline-item'))
+    entry = {'post_id': 'post_1_abc', 'body_md': 'Hello', 'author': {'id': 3}}
+    payload = {'post_id': 'post_1_abc', 'body_md': 'Hello', 'author': 3, 'created_at': '2024-01-15T10:30:00Z'}
+    assert not unchanged(entry, payload, ('author',))
+    assert unchanged(entry, payload, ('author',), attributes)
+    assert not unchanged(entry, dict(payload, body_md='Bye'), ('author',), attributes)
+
+
+def test_missing_schema_compares_every_key(tmp_path):
+    assert load_attributes(tmp_path / 'schema.json') is None
+
+
+def test_rerun_without_seed_keeps_existing_children(run_import, fake_strapi, tmp_path):
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace'), ('Alan', 'Turing'), ('Grace', 'Hopper')])
+    assert run_import(rows) == 0
+    as_strapi_stores(fake_strapi)
+    children = {collection: set(fake_strapi.collections[collection]) for collection in ('properties',
+                                                                                         'timeline-items')}
+    before = child_requests(fake_strapi)
+    assert before.get('POST')
+
+    # No --seed: every rerun draws new random fields, but not a new mock dataset
+    for _ in range(3):
+        assert run_import(rows) == 0
+    after = child_requests(fake_strapi)
+    # Reads only: no child is posted, put or deleted again
+    assert {method for method in after if after[method] != before.get(method, 0)} == {'GET'}
+    assert {collection: set(fake_strapi.collections[collection]) for collection in children} == children
+
+
+def test_mock_dataset_is_journaled_per_consultant(run_import, fake_strapi, tmp_path):
+    from expert_import import importer
+
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace')])
+    assert run_import(rows) == 0
+    (doc_id,) = fake_strapi.collections['consultants']
+    mock_n = importer.journal.get_mock_n(doc_id)
+    assert mock_n in importer.mock_registry.numbers
+    uids = sorted(entry['property_uid'] for entry in fake_strapi.collections['properties'].values())
+    expected = sorted(f"{template['property_uid']}_{doc_id}"
+                      for template, _ in importer.mock_registry.get(mock_n).properties)
+    assert uids == expected
@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from expert_import import download_cache as download_cache_module
+from expert_import.download_cache import DownloadCache
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def index_writes(monkeypatch):
+    writes = []
+    real_replace = download_cache_module.os.replace
+
+    def replace(src, dst):
+        if str(dst).endswith('index.json'):
+            writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(download_cache_module.os, 'replace', replace)
+    return writes
+
+
+def saved(cache):
+    return json.loads(cache.index_path.read_text(encoding='utf-8'))
+
+
+def test_prefetch_writes_the_index_in_batches(tmp_path, origin, index_writes):
+    cache = DownloadCache(tmp_path / 'downloads', flush_every=10)
+    urls = [f"{origin}/photo{n}.jpg" for n in range(25)]
+    assert cache.prefetch(urls, workers=4) == 0
+    assert cache.downloaded == 25
+    # Two batches of 10, then the rest once prefetch() is done
+    assert len(index_writes) == 3
+    assert sorted(saved(cache)) == sorted(urls)
+
+
+def test_revalidations_are_batched_too(tmp_path, origin, index_writes):
+    urls = [f"{origin}/photo{n}.jpg" for n in range(5)]
+    DownloadCache(tmp_path / 'downloads').prefetch(urls)
+    del index_writes[:]
+
+    cache = DownloadCache(tmp_path / 'downloads', max_age=0, flush_every=100)
+    for url in urls:
+        assert cache.get(url) == url[len(origin):].encode('utf-8')
+    assert cache.revalidated == 5
+    assert index_writes == []
+    cache.flush()
+    assert len(index_writes) == 1
+
+
+def test_flushed_index_is_reused_without_requests(tmp_path, origin):
+    url = f"{origin}/avatar.jpg"
+    cache = DownloadCache(tmp_path / 'downloads', flush_every=100)
+    cache.path(url)
+    cache.flush()
+
+    again = DownloadCache(tmp_path / 'downloads')
+    assert again.get(url) == b'/avatar.jpg'
+    assert (again.fresh, again.downloaded, again.revalidated) == (1, 0, 0)
+    assert again.digest(url) == saved(cache)[url]['sha256']
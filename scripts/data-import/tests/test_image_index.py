@@ -0,0 +1,86 @@
+import logging
+
+import pytest
+
+from expert_import.image_index import ImageIndex, name_tokens, one_typo_apart
+from expert_import.settings import IMAGES_DIR
+
+
+@pytest.fixture
+def index(tmp_path):
+    images = tmp_path / 'images'
+    images.mkdir()
+    for name in ('JaneSmith.jpg', 'DavidBrown.png', 'MariaGarcia.jpg', 'TimeWebbProfilePicture.webp',
+                 'KevinLee.jpg', 'pellham-higins.jpg', 'MariaLopez.jpg', 'MarieLopez.jpg'):
+        (images / name).write_bytes(b'')
+    return ImageIndex().load_or_build(images)
+
+
+@pytest.mark.parametrize('first, last', [
+    ('John', 'Smith'),      # different given name, same surname
+    ('Daniel', 'Brown'),
+    ('Mario', 'Garcia'),    # one letter replaced in a short name is another person
+    ('Jane', 'Smyth'),      # ... in a short surname too
+    ('Kevin', 'Leeds'),     # surname must match exactly
+    ('Kevi', 'Le'),
+])
+def test_other_peoples_headshots_are_not_matched(index, first, last):
+    path, _, kind = index.match(first, last)
+    assert path is None
+    assert kind == 'none'
+
+
+def test_given_name_typo_matches(index):
+    path, _, kind = index.match('Tim', 'Webb')
+    assert path.name == 'TimeWebbProfilePicture.webp'
+    assert kind == 'fuzzy'
+
+
+def test_exact_name_matches_across_separators(index):
+    path, score, kind = index.match('Pellham', 'Higins')
+    assert (path.name, score, kind) == ('pellham-higins.jpg', 1.0, 'exact')
+
+
+def test_ties_are_ambiguous_and_reported(index, caplog):
+    caplog.set_level(logging.INFO)
+    # Maria and Marie are both one letter from Mari
+    path, _, kind = index.match('Mari', 'Lopez')
+    assert path is None
+    assert kind == 'ambiguous'
+    assert 'ambiguous' in caplog.text
+    index.report()
+    assert '1 ambiguous' in caplog.text
+
+
+@pytest.mark.parametrize('first, last, filename', [
+    ('Pelham', 'Higgins', 'pellham-higins.jpg'),      # a typo in each name
+    ('Dominic', 'MacPhail', 'DominicMacPhil.jpg'),    # surname split over two tokens
+    ('Muhammad', 'Akram', 'MuhammedAkram.jpg'),       # one letter replaced in a long name
+])
+def test_real_headshots_with_typos_match(first, last, filename):
+    path, score, kind = ImageIndex().load_or_build(IMAGES_DIR).match(first, last)
+    assert (path.name, kind) == (filename, 'fuzzy')
+    assert score >= 0.7
+
+
+def test_saved_index_keeps_token_postings(tmp_path, index):
+    cache = tmp_path / 'index.json'
+    ImageIndex().load_or_build(index.files[0].parent, cache)
+    restored = ImageIndex().load_or_build(index.files[0].parent, cache)
+    assert restored.token_postings == index.token_postings
+    assert restored.match('Tim', 'Webb')[0].name == 'TimeWebbProfilePicture.webp'
+
+
+def test_name_tokens():
+    assert name_tokens('TimeWebbProfilePicture') == ['time', 'webb', 'profile', 'picture']
+    assert name_tokens('pellham-higins') == ['pellham', 'higins']
+
+
+def test_one_typo_apart():
+    assert one_typo_apart('tim', 'time')
+    assert one_typo_apart('john', 'jon')
+    assert one_typo_apart('muhammad', 'muhammed')
+    assert not one_typo_apart('mario', 'maria')
+    assert not one_typo_apart('john', 'joan')
+    assert not one_typo_apart('john', 'john')
+    assert not one_typo_apart('le', 'lee')
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from expert_import.image_preprocess import ImagePreprocessor
+
+
+def jpeg(path, size):
+    out = BytesIO()
+    Image.new('RGB', (size, size), (200, 40, 40)).save(out, format='JPEG')
+    path.write_bytes(out.getvalue())
+    return path
+
+
+@pytest.fixture
+def preprocessor(tmp_path):
+    return ImagePreprocessor(tmp_path / 'derivatives', max_dim=64, max_input_bytes=50_000)
+
+
+def derivatives(preprocessor):
+    return sorted(preprocessor.cache_dir.glob('*.bin'))
+
+
+def test_warm_covers_downloaded_files_by_their_bytes(preprocessor, tmp_path):
+    # The download cache names files <url hash>.bin: the type comes from the magic bytes
+    downloaded = jpeg(tmp_path / '3f2a9c.bin', 200)
+    assert preprocessor.warm([downloaded], workers=1) == 1
+    assert len(derivatives(preprocessor)) == 1
+    # Cached from now on
+    assert preprocessor.warm([downloaded], workers=1) == 0
+
+    filename, content, mime = preprocessor.process('house.jpg', downloaded.read_bytes())
+    assert (filename, mime) == ('house.webp', 'image/webp')
+    assert content == derivatives(preprocessor)[0].read_bytes()
+
+
+def test_warm_skips_files_above_max_input_bytes(preprocessor, tmp_path):
+    large = tmp_path / 'large.jpg'
+    jpeg(large, 200)
+    large.write_bytes(large.read_bytes() + b'\0' * 60_000)
+    small = jpeg(tmp_path / 'small.jpg', 200)
+    video = tmp_path / 'clip.mp4'
+    video.write_bytes(b'\0\0\0\x18ftypmp42' + b'\0' * 100)
+
+    assert preprocessor.warm([large, small, video], workers=1) == 1
+    assert not preprocessor.transcodes(large.name, large.read_bytes()[:16], large.stat().st_size)
+
+
+def test_byte_counters_add_up_across_threads(preprocessor, tmp_path):
+    content = jpeg(tmp_path / 'avatar.jpg', 200).read_bytes()
+    preprocessor.warm([tmp_path / 'avatar.jpg'], workers=1)
+    encoded = derivatives(preprocessor)[0].stat().st_size
+
+    def upload(n):
+        if n % 2:
+            preprocessor.count_unchanged(1000)
+        else:
+            preprocessor.process('avatar.jpg', content)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(upload, range(400)))
+    assert preprocessor.bytes_in == 200 * 1000 + 200 * len(content)
+    assert preprocessor.bytes_out == 200 * 1000 + 200 * encoded
@@ -0,0 +1,23 @@
+from expert_import.image_preprocess import ImagePreprocessor
+
+
+def test_warm_runs_after_the_prefetch_and_covers_downloads(run_import, monkeypatch, tmp_path):
+    warmed = []
+    real_warm = ImagePreprocessor.warm
+
+    def warm(self, paths, workers=None):
+        paths = list(paths)
+        # Recorded with whether each file was already on disk at the time
+        warmed.extend((path, path.exists()) for path in paths)
+        return real_warm(self, paths, workers)
+
+    monkeypatch.setattr(ImagePreprocessor, 'warm', warm)
+    rows = tmp_path / 'rows.csv'
+    rows.write_text('First Name,Last Name\nAda,Lovelace\n', encoding='utf-8')
+    assert run_import(rows) == 0
+
+    downloads = tmp_path / 'cache' / 'downloads'
+    downloaded = [path for path, _ in warmed if path.parent == downloads]
+    assert downloaded
+    assert sorted(downloaded) == sorted(downloads.glob('*.bin'))
+    assert all(on_disk for _, on_disk in warmed)
@@ -0,0 +1,49 @@
+from expert_import.import_journal import ImportJournal
+
+
+def test_interrupted_run_is_read_back_by_the_next_one(tmp_path):
+    path = tmp_path / 'journal.sqlite'
+    journal = ImportJournal(path)
+    journal.start_row('2:ada lovelace', 2, mock_n=4)
+    journal.set_consultant('2:ada lovelace', 11, 'doc-ada', 'created')
+    journal.record('2:ada lovelace', 'media', 'avatar.jpg', 31)
+    journal.record('2:ada lovelace', 'property', 'prop_1', 41, uid='prop_1_doc-ada')
+    journal.finish_row('2:ada lovelace')
+    journal.set_mock_n('doc-ada', 4)
+    # Killed halfway through the second row
+    journal.start_row('3:alan turing', 3, mock_n=7)
+    journal.set_consultant('3:alan turing', 12, 'doc-alan', 'updated')
+    journal.record('3:alan turing', 'property', 'prop_2', 42, uid='prop_2_doc-alan')
+    journal.record('3:alan turing', 'media', 'house.jpg', None)
+
+    resumed = ImportJournal(path)
+    assert resumed.counts() == {'done': 1, 'started': 1}
+    assert resumed.done_consultants() == {11: 4}
+    alan = resumed.get_row('3:alan turing')
+    assert (alan['status'], alan['consultant_doc_id'], alan['mock_n']) == ('started', 'doc-alan', 7)
+    assert resumed.entities('3:alan turing', 'property') == {'prop_2': (42, 'prop_2_doc-alan')}
+    # The failed upload was not journaled, so the resumed row retries it
+    assert resumed.entities('3:alan turing', 'media') == {}
+    assert resumed.entities('2:ada lovelace', 'media') == {'avatar.jpg': (31, None)}
+
+    # Restarting a row does not forget what it already wrote
+    resumed.start_row('3:alan turing', 3, mock_n=9)
+    assert resumed.get_row('3:alan turing')['mock_n'] == 7
+    journal.close()
+    resumed.close()
+
+
+def test_a_fresh_run_forgets_rows_but_keeps_fingerprints(tmp_path):
+    journal = ImportJournal(tmp_path / 'journal.sqlite')
+    journal.start_row('2:ada lovelace', 2, mock_n=4)
+    journal.record('2:ada lovelace', 'property', 'prop_1', 41)
+    journal.set_fingerprint('doc-ada', 'abc')
+    journal.set_mock_n('doc-ada', 4)
+
+    journal.reset()
+
+    assert journal.get_row('2:ada lovelace') is None
+    assert journal.entities('2:ada lovelace', 'property') == {}
+    assert journal.get_fingerprint('doc-ada') == 'abc'
+    assert journal.get_mock_n('doc-ada') == 4
+    journal.close()
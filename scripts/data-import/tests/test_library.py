@@ -0,0 +1,41 @@
+import expert_import as ei
+
+
+def write_rows(path, names):
+    path.write_text('First Name,Last Name\n' + ''.join(f"{first},{last}\n" for first, last in names),
+                    encoding='utf-8')
+    return path
+
+
+def import_rows(path):
+    return [ei.upsert_consultant(prepared)[2]
+            for idx, row in ei.load_rows(path) if (prepared := ei.prepare_row(idx, row))]
+
+
+def test_library_flow_updates_consultants_a_cli_run_created(importer, fake_strapi, tmp_path):
+    # As left behind by an earlier CLI import
+    for first, last in (('Ada', 'Lovelace'), ('Alan', 'Turing')):
+        fake_strapi.create_entry('consultants', {'firstName': first, 'lastName': last})
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace'), ('Alan', 'Turing'), ('Grace', 'Hopper')])
+
+    assert import_rows(rows) == ['updated', 'updated', 'created']
+    assert len(fake_strapi.collections['consultants']) == 3
+
+
+def test_library_flow_is_idempotent(importer, fake_strapi, tmp_path):
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace')])
+    assert import_rows(rows) == ['created']
+    assert import_rows(rows) == ['updated']
+    assert len(fake_strapi.collections['consultants']) == 1
+
+
+def test_generated_email_does_not_match_someone_else(importer, fake_strapi, tmp_path, monkeypatch):
+    # John and Jane Smith can both draw j.smith@...; the email is made up, not from the sheet
+    monkeypatch.setattr(importer, 'generate_random_email', lambda *a, **kw: 'j.smith@gmail.com')
+    _, created = fake_strapi.create_entry('consultants', {'firstName': 'Jane', 'lastName': 'Smith',
+                                                          'contactInfo': {'Email': 'j.smith@gmail.com'}})
+    rows = write_rows(tmp_path / 'rows.csv', [('John', 'Smith')])
+
+    assert import_rows(rows) == ['created']
+    assert fake_strapi.collections['consultants'][created['data']['documentId']]['firstName'] == 'Jane'
+    assert len(fake_strapi.collections['consultants']) == 2
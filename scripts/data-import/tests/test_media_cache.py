@@ -0,0 +1,65 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from expert_import import media_cache as media_cache_module
+from expert_import.media_cache import MediaCache
+
+
+def saved(path):
+    return json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+
+
+def test_every_put_is_on_disk_before_any_flush(tmp_path):
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    cache.put('abc', 7, 'avatar.jpg', 10)
+    # As seen by the next run after this one was killed
+    assert MediaCache(cache.path).get('abc') == 7
+
+
+def test_puts_append_instead_of_rewriting_the_cache(tmp_path, monkeypatch):
+    dumps = []
+    real_dump = media_cache_module.json.dump
+    monkeypatch.setattr(media_cache_module.json, 'dump', lambda *a, **kw: (dumps.append(1), real_dump(*a, **kw)))
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    for n in range(100):
+        cache.put(f"digest{n}", n, f"file{n}.jpg", 100)
+    assert dumps == []
+    assert len(cache.log_path.read_text(encoding='utf-8').splitlines()) == 100
+
+
+def test_flush_folds_the_log_into_the_cache(tmp_path):
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    cache.put('abc', 7, 'avatar.jpg', 10)
+    cache.put('def', 8, 'house.jpg', 10)
+    cache.flush()
+    assert not cache.log_path.exists()
+    assert sorted(saved(cache.path)) == ['abc', 'def']
+
+    cache.put('ghi', 9, 'office.jpg', 10)
+    again = MediaCache(cache.path)
+    assert [again.get(d) for d in ('abc', 'def', 'ghi')] == [7, 8, 9]
+
+
+def test_discard_survives_a_crash(tmp_path):
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    cache.put('abc', 7, 'avatar.jpg', 10)
+    cache.flush()
+    cache.discard(['abc'])
+    assert MediaCache(cache.path).get('abc') is None
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    cache.put('abc', 7, 'avatar.jpg', 10)
+    with open(cache.log_path, 'a', encoding='utf-8') as f:
+        f.write('{"digest": "def", "ent')
+    assert MediaCache(cache.path).entries.keys() == {'abc'}
+
+
+def test_concurrent_puts_all_reach_the_file(tmp_path):
+    cache = MediaCache(tmp_path / 'media-cache.json')
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda n: cache.put(f"digest{n}", n, f"file{n}.jpg", 1), range(200)))
+    assert len(MediaCache(cache.path).entries) == 200
+    cache.flush()
+    assert len(saved(cache.path)) == 200
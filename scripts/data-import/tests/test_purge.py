@@ -0,0 +1,38 @@
+import requests
+
+from expert_import.purge import Purger
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.text = ''
+
+
+class FlakyStrapi:
+    """Drops the connection for every path in `unreachable`, as after the client gave up retrying."""
+
+    def __init__(self, unreachable):
+        self.unreachable = set(unreachable)
+        self.deleted = []
+
+    def delete(self, path):
+        if path in self.unreachable:
+            raise requests.ConnectionError(f"connection reset deleting {path}")
+        self.deleted.append(path)
+        return Response(404 if path.endswith('gone') else 200)
+
+
+def test_transport_errors_count_as_failed_and_the_purge_goes_on(caplog):
+    paths = [f"/api/properties/p{n}" for n in range(10)] + ['/api/properties/gone']
+    strapi = FlakyStrapi({'/api/properties/p3', '/api/properties/p7'})
+    purger = Purger(strapi, workers=4)
+
+    done = purger.delete_all('properties', paths)
+    purger.delete_all('consultants', ['/api/consultants/c1'])
+
+    assert sorted(done) == sorted(set(paths) - strapi.unreachable)
+    assert (purger.deleted, purger.failed) == (10, 2)
+    assert '/api/consultants/c1' in strapi.deleted
+    assert 'connection reset deleting /api/properties/p3' in caplog.text
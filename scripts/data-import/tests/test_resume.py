@@ -0,0 +1,53 @@
+import pytest
+
+from expert_import import importer
+
+
+def write_rows(path, names):
+    path.write_text('First Name,Last Name\n' + ''.join(f"{first},{last}\n" for first, last in names),
+                    encoding='utf-8')
+    return path
+
+
+def requests_to(fake, prefix):
+    return sum(len(samples) for name, samples in fake.latencies.items() if name.split(' ', 1)[1].startswith(prefix))
+
+
+@pytest.fixture
+def crash_on_properties(monkeypatch):
+    """Makes the next import die on its first property write, after the row's uploads."""
+    real_write_child = importer.write_child
+
+    def write_child(collection, *args, **kwargs):
+        if collection == 'properties':
+            raise RuntimeError('killed')
+        return real_write_child(collection, *args, **kwargs)
+
+    monkeypatch.setattr(importer, 'write_child', write_child)
+    return lambda: monkeypatch.setattr(importer, 'write_child', real_write_child)
+
+
+@pytest.mark.parametrize('upload_args', [(), ('--batch-uploads',)])
+def test_resumed_row_does_not_upload_its_files_again(run_import, fake_strapi, tmp_path, crash_on_properties,
+                                                    upload_args):
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace')])
+    with pytest.raises(RuntimeError, match='killed'):
+        run_import(rows, '--no-rollup', *upload_args)
+    uploaded = fake_strapi.upload_files
+    assert uploaded
+    # The media cache had not been saved when the process died
+    (tmp_path / 'cache' / 'media-cache.json').unlink(missing_ok=True)
+    crash_on_properties()
+
+    assert run_import(rows, '--resume', '--no-rollup', *upload_args) == 0
+    assert fake_strapi.upload_files == uploaded
+    assert fake_strapi.collections['properties']
+
+
+def test_done_rows_cost_no_request(run_import, fake_strapi, tmp_path):
+    rows = write_rows(tmp_path / 'rows.csv', [('Ada', 'Lovelace'), ('Alan', 'Turing')])
+    assert run_import(rows) == 0
+    before = {prefix: requests_to(fake_strapi, prefix) for prefix in ('/api/properties', '/api/timeline-items')}
+
+    assert run_import(rows, '--resume', '--no-rollup') == 0
+    assert {prefix: requests_to(fake_strapi, prefix) for prefix in before} == before
@@ -0,0 +1,75 @@
+from expert_import.portfolio_rollup import changed_totals, rollup
+
+
+def consultant(fake, first, **totals):
+    return fake.create_entry('consultants', {'firstName': first, 'lastName': 'Owner', **totals})[1]['data']
+
+
+def stored(fake, entry):
+    return {field: fake.collections['consultants'][entry['documentId']].get(field)
+            for field in ('total_aum', 'deal_count', 'avg_deal_size', 'total_gfa')}
+
+
+def test_rollup_folds_properties_per_owner():
+    properties = [{'deal_size': 100, 'owner': {'id': 1}}, {'deal_size': 51, 'owner': 1},
+                  {'deal_size': 7, 'owner': None}]
+    assert rollup(properties, {2: 900}) == {
+        1: {'total_aum': 151, 'deal_count': 2, 'avg_deal_size': 76},
+        2: {'total_aum': 0, 'deal_count': 0, 'avg_deal_size': 0, 'total_gfa': 900},
+    }
+
+
+def test_changed_totals_skips_consultants_already_in_sync():
+    consultants = [{'id': 1, 'documentId': 'a', 'total_aum': 10, 'deal_count': 1, 'avg_deal_size': 10},
+                   {'id': 2, 'documentId': 'b', 'total_aum': 5, 'deal_count': 1, 'avg_deal_size': 5}]
+    totals = {1: {'total_aum': 10, 'deal_count': 1, 'avg_deal_size': 10}}
+    assert list(changed_totals(consultants, totals)) == [('b', {'total_aum': 0, 'deal_count': 0,
+                                                                'avg_deal_size': 0})]
+
+
+def test_import_rollup_leaves_consultants_it_did_not_write_alone(importer, fake_strapi, monkeypatch):
+    imported = consultant(fake_strapi, 'Imported')
+    untouched = consultant(fake_strapi, 'Untouched', total_aum=500, deal_count=2, avg_deal_size=250)
+    for size in (300, 100):
+        fake_strapi.create_entry('properties', {'property_uid': f"p{size}", 'deal_size': size,
+                                                'owner': imported['id']})
+    monkeypatch.setitem(importer.portfolio_gfa, imported['id'], 1200)
+
+    assert importer.run_rollup(batch_size=1, owner_ids=set(importer.portfolio_gfa)) == 0
+
+    assert stored(fake_strapi, imported) == {'total_aum': 400, 'deal_count': 2, 'avg_deal_size': 200,
+                                             'total_gfa': 1200}
+    assert stored(fake_strapi, untouched) == {'total_aum': 500, 'deal_count': 2, 'avg_deal_size': 250,
+                                              'total_gfa': None}
+
+
+def test_full_rollup_recomputes_every_consultant(importer, fake_strapi):
+    orphan = consultant(fake_strapi, 'Orphan', total_aum=500, deal_count=2, avg_deal_size=250)
+
+    assert importer.run_rollup(batch_size=10) == 0
+
+    assert stored(fake_strapi, orphan) == {'total_aum': 0, 'deal_count': 0, 'avg_deal_size': 0,
+                                           'total_gfa': None}
+
+
+def test_import_defaults_to_the_scoped_rollup():
+    from expert_import.cli import build_parser
+
+    parser, _ = build_parser()
+    assert parser.parse_args(['import']).full_rollup is False
+    assert parser.parse_args(['import', '--full-rollup']).full_rollup is True
+
+
+def test_resumed_run_rolls_up_rows_the_interrupted_run_finished(run_import, fake_strapi, tmp_path):
+    rows = tmp_path / 'rows.csv'
+    rows.write_text('First Name,Last Name\nAda,Lovelace\nAlan,Turing\n', encoding='utf-8')
+    # Killed after the rows, before its rollup
+    assert run_import(rows, '--no-rollup') == 0
+    consultants = fake_strapi.collections['consultants'].values()
+    assert all(entry.get('total_aum') is None for entry in consultants)
+
+    # Every row is done in the journal, so the resumed run imports nothing itself
+    assert run_import(rows, '--resume') == 0
+    for entry in consultants:
+        assert entry['total_aum'] > 0
+        assert entry['total_gfa'] > 0
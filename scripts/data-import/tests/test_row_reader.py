@@ -0,0 +1,67 @@
+import openpyxl
+import pytest
+
+from expert_import.row_reader import RowReader
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / 'experts.xlsx'
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = 'Import Ready'
+    sheet.append(['First Name', 'Last Name', 'Years'])
+    sheet.append(['Ada', 'Lovelace', 12.0])
+    sheet.append([None, None, None])
+    sheet.append(['Alan', 'Turing', None])
+    sheet.append([None, None, None])
+    book.save(path)
+    return path
+
+
+@pytest.fixture
+def workbook_loads(monkeypatch):
+    loads = []
+    real_load = openpyxl.load_workbook
+
+    def load_workbook(*args, **kwargs):
+        loads.append(args[0])
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, 'load_workbook', load_workbook)
+    return loads
+
+
+EXPECTED = [
+    {'First Name': 'Ada', 'Last Name': 'Lovelace', 'Years': '12'},
+    {'First Name': None, 'Last Name': None, 'Years': None},
+    {'First Name': 'Alan', 'Last Name': 'Turing', 'Years': None},
+]
+
+
+def test_workbook_is_parsed_once_for_every_pass(workbook, workbook_loads, tmp_path):
+    reader = RowReader(workbook, cache_dir=tmp_path / 'rows')
+    assert reader.source == 'xlsx'
+    # validate, remote image scan, import
+    for _ in range(3):
+        assert list(reader) == EXPECTED
+    assert len(workbook_loads) == 1
+    assert reader.source == 'cache'
+
+
+def test_abandoned_pass_does_not_publish_a_partial_cache(workbook, workbook_loads, tmp_path):
+    reader = RowReader(workbook, cache_dir=tmp_path / 'rows')
+    rows = iter(reader)
+    next(rows)
+    rows.close()
+    assert reader.source == 'xlsx'
+    assert list(reader) == EXPECTED
+    assert len(workbook_loads) == 2
+
+
+def test_a_new_reader_uses_the_cache(workbook, workbook_loads, tmp_path):
+    list(RowReader(workbook, cache_dir=tmp_path / 'rows'))
+    reader = RowReader(workbook, cache_dir=tmp_path / 'rows')
+    assert reader.source == 'cache'
+    assert list(reader) == EXPECTED
+    assert len(workbook_loads) == 1
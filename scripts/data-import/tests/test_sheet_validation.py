@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from expert_import.sheet_validation import SheetValidator, parse_rate
+
+
+@pytest.mark.parametrize('cell, expected', [
+    ('EUR 1.200,50', (1200.5, 'EUR')),
+    ('250,50', (250.5, None)),
+    ('£1,250/hr', (1250.0, 'GBP')),
+    ('$250', (250.0, 'USD')),
+    ('250 GBP', (250.0, 'GBP')),
+    ('1 200 €', (1200.0, 'EUR')),
+    ('1,250', (1250.0, None)),
+])
+def test_parse_rate(cell, expected):
+    assert parse_rate(cell) == expected
+
+
+@pytest.mark.parametrize('cell', ['negotiable', '200-300', '$'])
+def test_parse_rate_rejects_cells_without_one_amount(cell):
+    with pytest.raises(ValueError, match='cannot parse rate'):
+        parse_rate(cell)
+
+
+def test_validator_reports_every_issue_with_its_sheet_row():
+    validator = SheetValidator(enums={'geographicalExpertise': ['Europe', 'Asia']},
+                               string_limits={'company': 10})
+    report = validator.validate([
+        {'First Name': 'Ada', 'Last Name': 'Lovelace', 'Rate': '£1,250/hr', 'geographical_expertise': 'Europe'},
+        {'First Name': 'Alan', 'Last Name': '', 'Rate': 'negotiable'},
+        {'First Name': 'Grace', 'Last Name': 'Hopper', 'geographical_expertise': 'Mars',
+         'company_name': 'Remington Rand', 'tag': '["Navy"'},
+    ])
+    assert report['rows'] == 3
+    assert report['valid_rows'] == 1
+    assert report['flagged_rows'] == [3, 4]
+    assert report['issues_by_check'] == {'required': 1, 'rate': 1, 'enum': 1, 'length': 1, 'json': 1}
+    assert [(issue['row'], issue['column']) for issue in report['issues']] == [
+        (3, 'Last Name'), (3, 'Rate'), (4, 'company_name'), (4, 'geographical_expertise'), (4, 'tag')]
+
+
+@pytest.fixture
+def sheet(tmp_path):
+    rows = tmp_path / 'rows.csv'
+    rows.write_text('First Name,Last Name,Rate\n'
+                    'Ada,Lovelace,"EUR 1.200,50"\n'
+                    'Alan,Turing,negotiable\n'
+                    'Grace,,250\n', encoding='utf-8')
+    return rows
+
+
+def last_report(tmp_path):
+    return json.loads((tmp_path / 'cache' / 'validation' / 'last-report.json').read_text(encoding='utf-8'))
+
+
+def test_invalid_rows_abort_the_import_before_any_request(run_import, fake_strapi, sheet, tmp_path):
+    assert run_import(sheet) == 1
+    assert fake_strapi.collections['consultants'] == {}
+    assert last_report(tmp_path)['flagged_rows'] == [3, 4]
+
+
+def test_on_invalid_skip_imports_the_other_rows(run_import, fake_strapi, sheet, tmp_path):
+    assert run_import(sheet, '--on-invalid', 'skip') == 0
+    consultants = fake_strapi.collections['consultants'].values()
+    assert [(entry['firstName'], entry['lastName']) for entry in consultants] == [('Ada', 'Lovelace')]
+    assert last_report(tmp_path)['on_invalid'] == 'skip'
@@ -0,0 +1,67 @@
+import socket
+
+import pytest
+import requests
+from fake_strapi import FakeStrapi
+
+from expert_import.strapi_client import StrapiClient
+
+
+@pytest.fixture
+def failing_strapi(request):
+    fake = FakeStrapi(port=0, error_rate=1.0, error_status=request.param).start()
+    yield fake
+    fake.stop()
+
+
+def client(url, **kwargs):
+    return StrapiClient(url, 'test', max_retries=2, backoff_base=0, backoff_max=0, **kwargs)
+
+
+@pytest.mark.parametrize('failing_strapi', [500, 502, 504], indirect=True)
+def test_post_is_not_replayed_after_a_server_error(failing_strapi):
+    strapi = client(failing_strapi.url)
+    res = strapi.post('/api/consultants', json={'data': {'firstName': 'Ada'}})
+    assert res.status_code == failing_strapi.error_status
+    assert strapi.requests == 1
+
+
+@pytest.mark.parametrize('failing_strapi', [500, 503], indirect=True)
+def test_idempotent_requests_are_retried_after_a_server_error(failing_strapi):
+    strapi = client(failing_strapi.url)
+    assert strapi.put('/api/consultants/abc', json={'data': {}}).status_code == failing_strapi.error_status
+    assert strapi.get('/api/consultants').status_code == failing_strapi.error_status
+    assert strapi.requests == 6
+
+
+@pytest.mark.parametrize('failing_strapi', [429, 503], indirect=True)
+def test_post_is_retried_when_the_server_refused_it(failing_strapi):
+    strapi = client(failing_strapi.url)
+    strapi.post('/api/consultants', json={'data': {'firstName': 'Ada'}})
+    assert strapi.requests == 3
+    assert strapi.retries == 2
+
+
+def test_post_is_retried_when_the_connection_was_never_made():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    # Nothing listens on the port any more: connection refused before anything was sent
+    strapi = client(f"http://127.0.0.1:{port}")
+    with pytest.raises(requests.ConnectionError):
+        strapi.post('/api/consultants', json={'data': {}})
+    assert strapi.requests == 3
+
+
+def test_post_is_not_replayed_after_a_read_timeout():
+    with socket.socket() as server:
+        # Accepts connections (via the backlog) but never answers
+        server.bind(('127.0.0.1', 0))
+        server.listen(8)
+        strapi = client(f"http://127.0.0.1:{server.getsockname()[1]}", timeouts={'write': 0.2, 'read': 0.2})
+        with pytest.raises(requests.ReadTimeout):
+            strapi.post('/api/consultants', json={'data': {}})
+        assert strapi.requests == 1
+        with pytest.raises(requests.ReadTimeout):
+            strapi.get('/api/consultants')
+        assert strapi.requests == 4
@@ -0,0 +1,39 @@
+import hashlib
+
+import requests
+
+from expert_import.streaming_upload import MultipartStream, sha256_file
+
+
+def encoded_by_requests(fields, files):
+    prepared = requests.Request('POST', 'http://strapi.test/api/upload', data=fields,
+                                files=[('files', part) for part in files]).prepare()
+    return prepared.body, prepared.headers['Content-Type'].split('boundary=')[1]
+
+
+def test_body_matches_what_requests_would_encode(tmp_path):
+    video = tmp_path / 'walkthrough.mp4'
+    video.write_bytes(bytes(range(256)) * 4000)
+    fields = {'fileInfo': '{"alternativeText": "Ada Lovelace"}'}
+    files = [('avatar.jpg', b'\xff\xd8jpeg bytes', 'image/jpeg'), ('walkthrough.mp4', video, 'video/mp4')]
+
+    stream = MultipartStream(fields, files)
+    body = b''.join(stream)
+
+    expected, boundary = encoded_by_requests(fields, [(name, content if isinstance(content, bytes)
+                                                       else content.read_bytes(), mime)
+                                                      for name, content, mime in files])
+    assert body == expected.replace(boundary.encode(), stream.boundary.encode())
+    assert len(body) == len(stream)
+    assert stream.sizes == [len(files[0][1]), video.stat().st_size]
+    assert stream.digests == [hashlib.sha256(files[0][1]).hexdigest(), sha256_file(video)]
+
+
+def test_rewind_sends_the_same_body_again(tmp_path):
+    image = tmp_path / 'house.jpg'
+    image.write_bytes(b'x' * 1000)
+    stream = MultipartStream({}, [('house.jpg', image, 'image/jpeg')])
+    first = stream.read(100) + stream.read()
+    stream.seek(0)
+    assert stream.read() == first
+    assert stream.digests == [sha256_file(image)]
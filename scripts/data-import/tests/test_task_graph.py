@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from expert_import.task_graph import TaskGraph
+
+
+@pytest.fixture
+def pool():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def test_nodes_get_their_dependencies_results(pool):
+    graph = TaskGraph(pool)
+    graph.add('image', lambda deps: 7)
+    graph.add('consultant', lambda deps: f"consultant with image {deps['image']}", deps=['image'])
+    graph.add('property', lambda deps: sorted(deps), deps=['image', 'consultant'])
+    assert graph.run() == {'image': 7, 'consultant': 'consultant with image 7',
+                           'property': ['consultant', 'image']}
+
+
+def test_a_failed_dependency_stops_everything_downstream(pool):
+    called = []
+
+    def node(name):
+        def run(deps):
+            called.append(name)
+            return name
+        return run
+
+    def upload_fails(deps):
+        called.append('image')
+        raise RuntimeError('upload failed')
+
+    graph = TaskGraph(pool)
+    graph.add('image', upload_fails)
+    graph.add('consultant', node('consultant'), deps=['image'])
+    graph.add('property', node('property'), deps=['consultant'])
+    graph.add('timeline', node('timeline'), deps=['consultant', 'property'])
+
+    with pytest.raises(RuntimeError, match='upload failed'):
+        graph.run()
+    assert called == ['image']
+
+
+def test_unknown_and_duplicate_tasks_are_rejected(pool):
+    graph = TaskGraph(pool)
+    graph.add('consultant', lambda deps: None)
+    with pytest.raises(ValueError, match='Duplicate'):
+        graph.add('consultant', lambda deps: None)
+    with pytest.raises(ValueError, match='unknown'):
+        graph.add('property', lambda deps: None, deps=['image'])
@@ -0,0 +1,62 @@
+/**
+ * consultant bulk-import controller
+ *
+ * Accepts an NDJSON stream (Content-Type: application/x-ndjson), one consultant
+ * bundle per line, or a JSON body of the form { data: [bundle, ...] }. Bundles
+ * are written as they arrive, each in its own transaction; one failing bundle
+ * does not stop the rest.
+ */
+
+import * as readline from 'readline';
+import { getErrorMessage } from '../../../utils/errorHandler';
+import { BundleResult, parseBundle } from '../services/bulk-import';
+
+// Upper bound per request; clients send larger imports in several chunks
+const MAX_BUNDLES = 1000;
+
+export default ({ strapi }: { strapi: any }) => ({
+  async importBundles(ctx: any) {
+    const service = strapi.service('api::consultant.bulk-import');
+    const results: BundleResult[] = [];
+
+    const importLine = async (line: string) => {
+      const index = results.length;
+      if (index >= MAX_BUNDLES) {
+        throw new Error(`At most ${MAX_BUNDLES} bundles per request`);
+      }
+      try {
+        results.push(await service.importBundle(parseBundle(line), index));
+      } catch (error: unknown) {
+        results.push({ index, status: 'error', error: getErrorMessage(error) });
+      }
+    };
+
+    try {
+      if (ctx.is('application/x-ndjson', 'application/jsonl')) {
+        // strapi::body leaves unknown content types unparsed, so the raw request is still readable
+        const lines = readline.createInterface({ input: ctx.req, crlfDelay: Infinity });
+        for await (const line of lines) {
+          if (line.trim()) {
+            await importLine(line);
+          }
+        }
+      } else {
+        const bundles = ctx.request.body?.data;
+        if (!Array.isArray(bundles)) {
+          return ctx.badRequest('Expected an NDJSON stream or { data: [bundles] }');
+        }
+        for (const bundle of bundles) {
+          await importLine(JSON.stringify(bundle));
+        }
+      }
+    } catch (error: unknown) {
+      return ctx.badRequest('Bulk import failed', { error: getErrorMessage(error), data: results });
+    }
+
+    const failed = results.filter((result) => result.status === 'error').length;
+    return ctx.send({
+      data: results,
+      meta: { received: results.length, imported: results.length - failed, failed }
+    });
+  }
+});
@@ -0,0 +1,20 @@
+/**
+ * consultant bulk-import router
+ */
+
+export default {
+  routes: [
+    {
+      method: 'POST',
+      path: '/consultants/bulk-import',
+      handler: 'bulk-import.importBundles',
+      config: {
+        auth: {
+          scope: ['authenticated']
+        },
+        policies: [],
+        middlewares: []
+      }
+    }
+  ]
+};
@@ -0,0 +1,135 @@
+/**
+ * consultant bulk-import service
+ *
+ * Writes consultant bundles (a consultant plus its properties and timeline
+ * items) one database transaction per bundle, so a bundle is either fully
+ * imported or not at all.
+ */
+
+import { getErrorMessage } from '../../../utils/errorHandler';
+
+const CONSULTANT_UID = 'api::consultant.consultant';
+const PROPERTY_UID = 'api::property.property';
+const TIMELINE_ITEM_UID = 'api::timeline-item.timeline-item';
+
+export interface ConsultantBundle {
+  // Caller's key for the bundle, echoed back in the result
+  key?: string;
+  // documentId of an existing consultant to update; omitted to create one
+  documentId?: string | null;
+  consultant: Record<string, any>;
+  properties?: Record<string, any>[];
+  timelineItems?: Record<string, any>[];
+  // Append `_<consultant documentId>` to property_uid / post_id so shared templates stay unique
+  scopeUids?: boolean;
+}
+
+export interface BundleResult {
+  index: number;
+  key?: string;
+  status: 'ok' | 'error';
+  action?: 'created' | 'updated';
+  consultant?: { id: number; documentId: string };
+  properties?: { property_uid: string; id: number; documentId: string }[];
+  timelineItems?: { post_id: string; id: number; documentId: string }[];
+  error?: string;
+}
+
+/**
+ * Parses one NDJSON line into a bundle; throws with a readable message when it is not one.
+ */
+export function parseBundle(line: string): ConsultantBundle {
+  let bundle: any;
+  try {
+    bundle = JSON.parse(line);
+  } catch (error) {
+    throw new Error('Invalid JSON');
+  }
+  if (!bundle || typeof bundle !== 'object' || Array.isArray(bundle)) {
+    throw new Error('Bundle must be a JSON object');
+  }
+  if (!bundle.consultant || typeof bundle.consultant !== 'object') {
+    throw new Error('Bundle is missing "consultant"');
+  }
+  for (const field of ['properties', 'timelineItems']) {
+    if (bundle[field] !== undefined && !Array.isArray(bundle[field])) {
+      throw new Error(`"${field}" must be an array`);
+    }
+  }
+  return bundle as ConsultantBundle;
+}
+
+export default ({ strapi }: { strapi: any }) => ({
+  /**
+   * Upserts the consultant, then creates its properties and timeline items,
+   * inside one transaction. Timeline items carrying a property_uid from the
+   * same bundle are linked to that property.
+   */
+  async importBundle(bundle: ConsultantBundle, index: number): Promise<BundleResult> {
+    try {
+      return await strapi.db.transaction(async () => {
+        let consultant: any;
+        let action: 'created' | 'updated';
+        if (bundle.documentId) {
+          const [existing] = await strapi.entityService.findMany(CONSULTANT_UID, {
+            filters: { documentId: bundle.documentId } as any,
+            fields: ['id'],
+            limit: 1
+          });
+          if (!existing) {
+            throw new Error(`Consultant ${bundle.documentId} not found`);
+          }
+          consultant = await strapi.entityService.update(CONSULTANT_UID, existing.id, { data: bundle.consultant });
+          action = 'updated';
+        } else {
+          consultant = await strapi.entityService.create(CONSULTANT_UID, { data: bundle.consultant });
+          action = 'created';
+        }
+
+        const scope = (uid: string) => (bundle.scopeUids && uid ? `${uid}_${consultant.documentId}` : uid);
+
+        const properties: NonNullable<BundleResult['properties']> = [];
+        const propertyIds = new Map<string, number>();
+        for (const data of bundle.properties || []) {
+          const created = await strapi.entityService.create(PROPERTY_UID, {
+            data: { ...data, property_uid: scope(data.property_uid), owner: consultant.id }
+          });
+          propertyIds.set(data.property_uid, created.id);
+          properties.push({ property_uid: created.property_uid, id: created.id, documentId: created.documentId });
+        }
+
+        const timelineItems: NonNullable<BundleResult['timelineItems']> = [];
+        for (const data of bundle.timelineItems || []) {
+          const linked = data.property_uid ? propertyIds.get(data.property_uid) : undefined;
+          const created = await strapi.entityService.create(TIMELINE_ITEM_UID, {
+            data: {
+              ...data,
+              post_id: scope(data.post_id),
+              author: consultant.id,
+              ...(linked ? { property: linked } : {})
+            }
+          });
+          timelineItems.push({ post_id: created.post_id, id: created.id, documentId: created.documentId });
+        }
+
+        return {
+          index,
+          key: bundle.key,
+          status: 'ok',
+          action,
+          consultant: { id: consultant.id, documentId: consultant.documentId },
+          properties,
+          timelineItems
+        } as BundleResult;
+      });
+    } catch (error: unknown) {
+      // The transaction has been rolled back; report and carry on with the next bundle
+      return {
+        index,
+        key: bundle.key,
+        status: 'error',
+        error: getErrorMessage(error)
+      };
+    }
+  }
+});
@@ -0,0 +1,88 @@
+import bulkImportService, { parseBundle } from '../src/api/consultant/services/bulk-import';
+import bulkImportController from '../src/api/consultant/controllers/bulk-import';
+
+function createStrapiMock() {
+  let nextId = 1;
+  const created: { uid: string; data: any }[] = [];
+  const strapi: any = {
+    db: {
+      transaction: jest.fn().mockImplementation((callback: any) => callback({})),
+    },
+    entityService: {
+      create: jest.fn().mockImplementation((uid: string, { data }: any) => {
+        if (uid === 'api::property.property' && data.property_uid === 'broken') {
+          return Promise.reject(new Error('This attribute must be unique'));
+        }
+        const entry = { id: nextId, documentId: `doc${nextId}`, ...data };
+        nextId += 1;
+        created.push({ uid, data });
+        return Promise.resolve(entry);
+      }),
+      update: jest.fn().mockImplementation((uid: string, id: number, { data }: any) =>
+        Promise.resolve({ id, documentId: 'existing', ...data })
+      ),
+      findMany: jest.fn().mockResolvedValue([{ id: 42 }]),
+    },
+  };
+  return { strapi, created };
+}
+
+describe('consultant bulk-import service', () => {
+  it('should be defined', () => {
+    expect(bulkImportService).toBeDefined();
+    expect(bulkImportController).toBeDefined();
+  });
+
+  it('creates a consultant with its properties and linked timeline items', async () => {
+    const { strapi, created } = createStrapiMock();
+    const service = bulkImportService({ strapi });
+
+    const result = await service.importBundle({
+      key: 'row-2',
+      consultant: { firstName: 'Tim', lastName: 'Webb' },
+      properties: [{ property_uid: 'prop_1', title: 'Tower' }],
+      timelineItems: [{ post_id: 'post_1', property_uid: 'prop_1' }],
+      scopeUids: true,
+    }, 0);
+
+    expect(strapi.db.transaction).toHaveBeenCalledTimes(1);
+    expect(result.status).toBe('ok');
+    expect(result.action).toBe('created');
+    expect(result.properties?.[0]?.property_uid).toBe('prop_1_doc1');
+    expect(created).toContainEqual({
+      uid: 'api::timeline-item.timeline-item',
+      data: { post_id: 'post_1_doc1', property_uid: 'prop_1', author: 1, property: 2 },
+    });
+  });
+
+  it('updates an existing consultant by documentId', async () => {
+    const { strapi } = createStrapiMock();
+    const result = await bulkImportService({ strapi }).importBundle({
+      documentId: 'existing',
+      consultant: { bio: 'Updated' },
+    }, 3);
+
+    expect(strapi.entityService.update).toHaveBeenCalledWith(
+      'api::consultant.consultant', 42, { data: { bio: 'Updated' } }
+    );
+    expect(result.action).toBe('updated');
+    expect(result.index).toBe(3);
+  });
+
+  it('reports a failed bundle instead of throwing', async () => {
+    const { strapi } = createStrapiMock();
+    const result = await bulkImportService({ strapi }).importBundle({
+      consultant: { firstName: 'Ada' },
+      properties: [{ property_uid: 'broken' }],
+    }, 0);
+
+    expect(result.status).toBe('error');
+    expect(result.error).toBe('This attribute must be unique');
+  });
+
+  it('rejects lines that are not bundles', () => {
+    expect(() => parseBundle('{')).toThrow('Invalid JSON');
+    expect(() => parseBundle('[]')).toThrow('Bundle must be a JSON object');
+    expect(() => parseBundle('{"properties": []}')).toThrow('Bundle is missing "consultant"');
+  });
+});